@@ -11,6 +11,7 @@ sys.path.append(os.getcwd())
 if os.path.exists(os.path.join(os.getcwd(), 'backend')):
     sys.path.append(os.path.join(os.getcwd(), 'backend'))
 
+from app.core.response_cache import invalidate_tags, events_tag
 from app.db.session import AsyncSessionLocal
 from app.models.models import Event, Venue, VenueEvent
 from sqlalchemy.future import select
@@ -83,6 +84,7 @@ async def add_super_bowl():
             print("No venues found in DB to link to.")
 
         await session.commit()
+        await invalidate_tags(events_tag("American Football"), "venues")
         print("Super Bowl Added Successfully!")
 
 if __name__ == "__main__":
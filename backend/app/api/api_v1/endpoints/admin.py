@@ -1,6 +1,14 @@
-from fastapi import APIRouter, Depends, HTTPException
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import PlainTextResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.api import deps
+from app.core.cache import cache
+from app.core.job_telemetry import job_telemetry
+from app.core.judgment_memo import judgment_memo
+from app.core.metrics import registry
+from app.core.work_queue import work_queue
 from app.db.init_db import init_db
 
 router = APIRouter()
@@ -18,3 +26,53 @@ async def seed_data(
         return {"message": "Database seeding completed successfully."}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
+
+@router.get("/cache/stats")
+async def cache_stats():
+    """
+    Cache hit/miss/error/bytes/latency per key namespace (raw:, venue:, event:, ...).
+    Counters are per worker process; use them to tune the CacheTTL tiers.
+    """
+    return cache.stats()
+
+@router.get("/work-queue/stats")
+async def work_queue_stats():
+    """
+    Redis stream work queue depth: queued, pending (read, not yet acked)
+    and dead-lettered tasks (SCHEDULER_EXECUTION='queue').
+    """
+    try:
+        return await work_queue.stats()
+    except Exception as e:
+        raise HTTPException(status_code=503, detail=f"Work queue unavailable: {e}")
+
+@router.get("/scheduler/runs")
+async def scheduler_runs(
+    job: Optional[str] = None,
+    limit: int = Query(50, ge=1, le=500)
+):
+    """
+    Recent scheduler job runs (newest first) with a summary per job:
+    start lag, duration, events processed/failed, stage timings
+    (scrape/analyze/db) and overlaps of the job's own interval.
+    Use it to size MAX_CONCURRENT_JOBS and the FREQ_* settings.
+    """
+    try:
+        return await job_telemetry.runs(job, limit)
+    except Exception as e:
+        raise HTTPException(status_code=503, detail=f"Job telemetry unavailable: {e}")
+
+@router.get("/dtss/judgment-memo")
+async def judgment_memo_stats():
+    """
+    Memoized LLM judgment lookups per kind (judge): hits,
+    misses and hit rate. Every hit is an LLM call saved on reposted content.
+    """
+    return judgment_memo.stats()
+
+@router.get("/metrics", response_class=PlainTextResponse)
+async def metrics():
+    """
+    All in-process metrics of this worker in Prometheus text format.
+    """
+    return registry.render()
@@ -36,7 +36,7 @@ async def create_checkin(
     longitude: float,
     event_id: Optional[str] = None,
     db: Session = Depends(get_db),
-    current_user: User = Depends(deps.get_current_user)
+    current_user: User = Depends(deps.get_current_user_record)
 ):
     """
     簽到（含 GPS 驗證）
@@ -155,7 +155,7 @@ async def get_my_checkins(
 @router.get("/stats")
 async def get_checkin_stats(
     db: Session = Depends(get_db),
-    current_user: User = Depends(deps.get_current_user)
+    current_user: User = Depends(deps.get_current_user_record)
 ):
     """取得簽到統計"""
     from sqlalchemy import func
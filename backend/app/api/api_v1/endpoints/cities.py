@@ -9,6 +9,8 @@ from typing import Optional, List
 import math
 
 from app.api import deps
+from app.core.cache import CacheTTL
+from app.core.response_cache import cached_response
 from app.models.models import Venue
 
 router = APIRouter()
@@ -57,24 +59,14 @@ def get_flag_emoji(country: str) -> str:
     # Convert country code to regional indicator symbols (flag emoji)
     return ''.join(chr(127397 + ord(c)) for c in code)
 
-@router.get("/cities")
-async def get_cities(
-    lat: Optional[float] = Query(None, description="User latitude for distance calculation"),
-    lng: Optional[float] = Query(None, description="User longitude for distance calculation"),
-    db: AsyncSession = Depends(deps.get_db)
-):
+@cached_response("cities", tags=["venues"], ttl=CacheTTL.STATIC)
+async def list_cities(db: AsyncSession) -> List[dict]:
     """
-    Get all available cities with venue counts and optional distance calculations.
-    
-    If lat/lng provided:
-    - Cities sorted by distance
-    - Distance included in response
-    - is_nearby flag for cities < 100km
+    Cities with venue counts and average coordinates.
     
-    Otherwise:
-    - Alphabetical by country then city
+    Independent of the user's location, so one cache entry serves every
+    request; distances are added per request by get_cities().
     """
-    
     # Query venues grouped by city/country with average coordinates
     stmt = select(
         Venue.city,
@@ -85,12 +77,9 @@ async def get_cities(
     ).group_by(Venue.city, Venue.country)
     
     result = await db.execute(stmt)
-    cities_data = result.all()
     
-    # Build response
-    cities = []
-    for city in cities_data:
-        city_obj = {
+    return [
+        {
             "name": city.city,
             "country": city.country,
             "country_code": get_country_code(city.country),
@@ -99,12 +88,36 @@ async def get_cities(
             "latitude": float(city.latitude) if city.latitude else 0,
             "longitude": float(city.longitude) if city.longitude else 0
         }
+        for city in result.all()
+    ]
+
+@router.get("/cities")
+async def get_cities(
+    lat: Optional[float] = Query(None, description="User latitude for distance calculation"),
+    lng: Optional[float] = Query(None, description="User longitude for distance calculation"),
+    db: AsyncSession = Depends(deps.get_db)
+):
+    """
+    Get all available cities with venue counts and optional distance calculations.
+    
+    If lat/lng provided:
+    - Cities sorted by distance
+    - Distance included in response
+    - is_nearby flag for cities < 100km
+    
+    Otherwise:
+    - Alphabetical by country then city
+    """
+    cities = []
+    # Copies: the cached list may be shared with other requests (L1)
+    for cached_city in await list_cities(db=db):
+        city_obj = dict(cached_city)
         
         # Calculate distance if user location provided
-        if lat is not None and lng is not None and city.latitude and city.longitude:
+        if lat is not None and lng is not None and city_obj["latitude"] and city_obj["longitude"]:
             distance = haversine_distance(
                 lat, lng,
-                float(city.latitude), float(city.longitude)
+                city_obj["latitude"], city_obj["longitude"]
             )
             city_obj["distance_km"] = round(distance, 1)
             city_obj["is_nearby"] = distance < 100
@@ -8,14 +8,16 @@ from app.models.models import Event, VenueEvent
 from app.schemas.schemas import EventWithVenues
 
 from starlette.requests import Request
+from starlette.responses import Response
 from app.core.limiter import limiter, role_based_limit
 
 router = APIRouter()
 
 @router.get("/", response_model=List[EventWithVenues])
-# @limiter.limit(role_based_limit())  # Temporarily disabled - causing 500 errors
+@limiter.limit(role_based_limit())
 async def read_events(
     request: Request,
+    response: Response,
     db: AsyncSession = Depends(deps.get_db),
     skip: int = 0,
     limit: int = 100,
@@ -7,6 +7,8 @@ from fastapi import APIRouter, Depends, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api import deps
+from app.core.cache import CacheTTL
+from app.core.response_cache import cached_response, QOE_TAG
 from app.services import search as search_service
 
 router = APIRouter()
@@ -43,6 +45,8 @@ async def search_venues(
 
 
 @router.get("/trending")
+# Time-windowed (next 7 days) and only filtered by a 50km radius: short TTL, ~1km coordinate rounding
+@cached_response("search:trending", tags=["venues", "events"], ttl=CacheTTL.SESSION, precision=2)
 async def get_trending(
     lat: Optional[float] = Query(None, description="User latitude"),
     lon: Optional[float] = Query(None, description="User longitude"),
@@ -69,6 +73,8 @@ async def get_trending(
 
 
 @router.get("/fallback")
+# Ranked by QoE, then distance: ~1km coordinate rounding, short TTL
+@cached_response("search:fallback", tags=["venues", QOE_TAG], ttl=CacheTTL.SESSION, precision=2)
 async def get_fallback(
     lat: float = Query(..., description="User latitude"),
     lon: float = Query(..., description="User longitude"),
@@ -8,6 +8,8 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List
 
 from app.api import deps
+from app.core.cache import CacheTTL
+from app.core.response_cache import cached_response
 from app.models.models import Event
 
 router = APIRouter()
@@ -33,6 +35,7 @@ SUPPORTED_SPORTS = [
 ]
 
 @router.get("/sports")
+@cached_response("sports", tags=["events"], ttl=CacheTTL.SEMI_DYNAMIC)
 async def get_sports(
     db: AsyncSession = Depends(deps.get_db)
 ):
@@ -1,8 +1,10 @@
 from typing import Generator
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.auth import token_resolver
 from app.db.session import AsyncSessionLocal
+from app.db import session as db_session
 from app.models.models import User
 
 security = HTTPBearer(auto_error=False)
@@ -12,12 +14,17 @@ async def get_db() -> Generator:
         yield session
 
 async def get_current_user(
-    credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: Session = Depends(get_db)
+    request: Request,
+    credentials: HTTPAuthorizationCredentials = Depends(security)
 ) -> User:
     """
     Get current authenticated user from Bearer token
     簡化版: 從 token 直接取得 user_id (實際應使用 JWT)
+
+    Uses the identity AuthMiddleware resolved (request.state.auth), so cache
+    hits do not touch the database. The returned User is transient and only
+    carries id and role - use get_current_user_record to read or modify
+    other columns (points, tier, ...).
     """
     if not credentials:
         raise HTTPException(
@@ -25,24 +32,40 @@ async def get_current_user(
             detail="Not authenticated",
             headers={"WWW-Authenticate": "Bearer"},
         )
-    
+
     # TODO: 實際應該驗證 JWT token
     # 目前簡化：token 就是 user_id
-    token = credentials.credentials
-    
-    try:
-        user = db.query(User).filter(User.id == token).first()
-        if not user:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Invalid authentication credentials"
-            )
-        return user
-    except Exception as e:
+    if hasattr(request.state, "auth"):
+        principal = request.state.auth
+    else:
+        # Middleware not installed (e.g. a sub-application)
+        principal = await token_resolver.resolve(credentials.credentials)
+
+    if principal is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid authentication credentials",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    return principal.to_user()
+
+async def get_current_user_record(
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(db_session.get_db)
+) -> User:
+    """
+    Full User row bound to the request session (one primary-key lookup).
+
+    Depends on the same get_db as the endpoints, so FastAPI shares one
+    session and changes to the user are committed with the endpoint's work.
+    """
+    user = await db.get(User, current_user.id)
+    if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Could not validate credentials"
+            detail="Invalid authentication credentials"
         )
+    return user
 
 async def require_admin(
     current_user: User = Depends(get_current_user)
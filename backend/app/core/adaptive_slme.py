@@ -0,0 +1,157 @@
+"""
+Adaptive SLME - Per-event check intervals driven by observed change rate
+
+FrequencyController gives every event of a tier the same fixed cadence,
+whether or not anything about it changes. With SLME_ADAPTIVE, each check
+reports whether the event changed (confidence moved by at least
+SLME_ADAPTIVE_EPSILON, an override fired, or a venue published new posts)
+and the event's interval adapts within its tier's bounds:
+
+- changed: interval * SLME_ADAPTIVE_TIGHTEN (down to the tier minimum)
+- stable:  interval * SLME_ADAPTIVE_BACKOFF (up to the tier maximum)
+- entering a new tier resets the interval to the tier's base frequency
+
+State lives in Redis (slme:cadence:<event_id>, no L1) so all processes
+and workers share it; while Redis is down the cache's in-memory fallback
+keeps it per process, and events without state use their tier's base
+frequency.
+
+Schedulers:
+- 'priority': next checks use the adaptive interval (both directions)
+- 'apscheduler': tier jobs skip events not due before the job's next run,
+  so stable events back off; they cannot be checked more often than the
+  tier job fires
+"""
+
+import logging
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterable, Optional, Tuple
+
+from app.core.cache import cache, CacheTTL
+from app.core.config import settings
+from app.core.metrics import registry
+from app.core.slme import slme
+
+logger = logging.getLogger(__name__)
+
+ADAPTIVE_OBSERVATIONS = registry.counter(
+    "mosport_slme_adaptive_observations_total", "Adaptive SLME observations by tier and result (changed, stable)"
+)
+ADAPTIVE_SKIPS = registry.counter(
+    "mosport_slme_adaptive_skips_total", "Events skipped by tier jobs because their adaptive interval had not elapsed"
+)
+
+
+@dataclass
+class Cadence:
+    """Adaptive state of one event"""
+    tier: str
+    interval: int
+    checked_at: float  # Unix seconds
+    stable_runs: int = 0
+    changes: int = 0
+
+    def due_at(self) -> datetime:
+        return datetime.fromtimestamp(self.checked_at + self.interval, timezone.utc)
+
+
+class AdaptiveFrequency:
+    """
+    Usage:
+        cadences = await adaptive_slme.observe({event_id: (tier, changed)})
+        interval = cadences[event_id].interval
+    """
+
+    def __init__(self, prefix: str = "slme:cadence"):
+        self.prefix = prefix
+
+    @staticmethod
+    def enabled() -> bool:
+        return settings.SLME_ADAPTIVE
+
+    def key(self, event_id: str) -> str:
+        return f"{self.prefix}:{event_id}"
+
+    @staticmethod
+    def next_interval(tier: str, current: Optional[int], changed: bool) -> int:
+        """Interval after one observation (pure)"""
+        low, high = slme.ADAPTIVE_BOUNDS[tier]
+        base = slme.tier_frequency(tier)
+        if current is None:
+            return base
+        factor = settings.SLME_ADAPTIVE_TIGHTEN if changed else settings.SLME_ADAPTIVE_BACKOFF
+        return int(min(high, max(low, current * factor)))
+
+    async def load(self, event_ids: Iterable[str]) -> Dict[str, Cadence]:
+        """Stored cadences (events without state are absent)"""
+        keys = {self.key(event_id): event_id for event_id in event_ids}
+        if not keys:
+            return {}
+        stored = await cache.get_many(list(keys))
+        cadences = {}
+        for key, value in stored.items():
+            try:
+                cadences[keys[key]] = Cadence(**value)
+            except (TypeError, KeyError) as e:
+                logger.warning(f"Ignoring malformed cadence state {key}: {e}")
+        return cadences
+
+    async def observe(self, observations: Dict[str, Tuple[str, bool]]) -> Dict[str, Cadence]:
+        """
+        Record one check per event and return the new cadences.
+
+        Args:
+            observations: event_id -> (tier checked at, whether anything changed)
+        """
+        if not observations:
+            return {}
+        previous = await self.load(observations)
+        now = datetime.now(timezone.utc).timestamp()
+
+        cadences = {}
+        for event_id, (tier, changed) in observations.items():
+            prior = previous.get(event_id)
+            if prior is not None and prior.tier != tier:
+                prior = None  # New tier: start again from its base frequency
+            cadences[event_id] = Cadence(
+                tier=tier,
+                interval=self.next_interval(tier, prior.interval if prior else None, changed),
+                checked_at=now,
+                stable_runs=0 if changed else (prior.stable_runs + 1 if prior else 1),
+                changes=(prior.changes if prior else 0) + int(changed),
+            )
+            ADAPTIVE_OBSERVATIONS.inc(tier=tier, result="changed" if changed else "stable")
+
+        await cache.set_many(
+            {self.key(event_id): vars(cadence) for event_id, cadence in cadences.items()},
+            ttl=CacheTTL.SEMI_DYNAMIC
+        )
+        return cadences
+
+    async def filter_due(self, event_ids: Iterable[str], tier: str, horizon: int) -> Tuple[set, int]:
+        """
+        Event ids a tier job should process now.
+
+        An event is skipped if its adaptive next check falls after the job's
+        next run (now + horizon seconds); it is picked up by that run instead.
+
+        Returns:
+            (due event ids, number skipped)
+        """
+        event_ids = list(event_ids)
+        cadences = await self.load(event_ids)
+        until = datetime.now(timezone.utc) + timedelta(seconds=horizon)
+        due = {
+            event_id for event_id in event_ids
+            if event_id not in cadences
+            or cadences[event_id].tier != tier
+            or cadences[event_id].due_at() < until
+        }
+        skipped = len(event_ids) - len(due)
+        if skipped:
+            ADAPTIVE_SKIPS.inc(skipped, tier=tier)
+        return due, skipped
+
+
+adaptive_slme = AdaptiveFrequency()
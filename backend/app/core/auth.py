@@ -0,0 +1,201 @@
+"""
+Auth - Bearer token resolution shared by the middleware and deps
+
+AuthMiddleware parses the bearer token on every request and resolves it to
+the user's id and role, then sets:
+- request.state.user_id   (None for guests / invalid tokens)
+- request.state.user_role ('fan', 'venue', 'staff', ... or 'guest')
+- request.state.auth      (the resolved AuthPrincipal or None)
+
+The rate limiter keys on user_role (core/limiter.py) and
+deps.get_current_user reuses request.state.auth instead of querying users.
+
+Resolution is cached in two tiers:
+- in-process LocalCache (AUTH_CACHE_LOCAL_TTL), no I/O on hits
+- Redis via CacheService under session:auth:* (AUTH_CACHE_TTL)
+Unknown tokens are cached too (AUTH_NEGATIVE_TTL), so invalid or guessed
+tokens cannot turn every request into a users lookup.
+
+Token format: the token is the user id (see deps.get_current_user TODO -
+replace _load_principal when JWT verification lands).
+"""
+
+import hashlib
+import logging
+import uuid
+from typing import Any, Dict, Optional
+
+from sqlalchemy import select
+
+from app.core.cache import cache, LocalCache
+from app.core.config import settings
+from app.core.metrics import registry
+from app.db.session import AsyncSessionLocal
+from app.models.models import User
+
+logger = logging.getLogger(__name__)
+
+GUEST_ROLE = "guest"
+
+# User.role -> rate-limit tier (keys of core/limiter.RATE_LIMITS).
+# Roles missing here get the guest tier.
+RATE_LIMIT_ROLES = {
+    "FAN": "fan",
+    "VENUE": "venue",
+    "STAFF": "staff",
+    "ADMIN": "staff",
+}
+
+AUTH_LOOKUPS = registry.counter(
+    "mosport_auth_lookups_total", "Token resolutions by source (local, redis, db, invalid)"
+)
+
+# Approximate size of one cached principal, for the LocalCache byte bound
+_ENTRY_SIZE = 128
+
+
+class AuthPrincipal:
+    """Identity resolved from a bearer token (no ORM state attached)"""
+
+    __slots__ = ("user_id", "role")
+
+    def __init__(self, user_id: str, role: str):
+        self.user_id = user_id
+        self.role = role
+
+    @property
+    def rate_limit_role(self) -> str:
+        return RATE_LIMIT_ROLES.get((self.role or "").upper(), GUEST_ROLE)
+
+    def to_user(self) -> User:
+        """Transient User carrying only id and role (not bound to a session)"""
+        return User(id=uuid.UUID(self.user_id), role=self.role)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"id": self.user_id, "role": self.role}
+
+
+class TokenResolver:
+    """
+    Token -> AuthPrincipal with local + Redis TTL caching.
+
+    Args:
+        ttl: Redis lifetime of a resolved token (seconds)
+        local_ttl: In-process lifetime (seconds); bounds staleness after a
+            role change on workers that already cached the token
+        negative_ttl: Lifetime of "unknown token" entries (seconds)
+        max_entries: Bound on the in-process cache
+    """
+
+    def __init__(self, ttl: int, local_ttl: int, negative_ttl: int, max_entries: int):
+        self.ttl = ttl
+        self.local_ttl = local_ttl
+        self.negative_ttl = negative_ttl
+        self.local = LocalCache(max_entries=max_entries, max_bytes=max_entries * _ENTRY_SIZE)
+
+    @staticmethod
+    def _key(token: str) -> str:
+        # Raw tokens never become cache keys
+        return "session:auth:" + hashlib.blake2b(token.encode("utf-8"), digest_size=16).hexdigest()
+
+    async def resolve(self, token: str) -> Optional[AuthPrincipal]:
+        """Returns the principal for `token`, or None if the token is invalid"""
+        key = self._key(token)
+
+        found, entry = self.local.get(key)
+        if found:
+            AUTH_LOOKUPS.inc(source="local")
+            return self._principal(entry)
+
+        entry = await cache.get(key)
+        if isinstance(entry, dict):
+            AUTH_LOOKUPS.inc(source="redis")
+            self._remember_local(key, entry)
+            return self._principal(entry)
+
+        try:
+            principal = await self._load_principal(token)
+        except Exception as e:
+            # Not cached: a DB hiccup must not pin valid tokens as invalid
+            logger.warning(f"Token resolution failed: {e}")
+            return None
+
+        entry = principal.to_dict() if principal else {"id": None, "role": None}
+        AUTH_LOOKUPS.inc(source="db" if principal else "invalid")
+        await cache.set(key, entry, ttl=self.ttl if principal else self.negative_ttl)
+        self._remember_local(key, entry)
+        return principal
+
+    async def forget(self, token: str) -> None:
+        """Drop a token from both tiers (e.g. after a role change or logout)"""
+        key = self._key(token)
+        self.local.delete(key)
+        await cache.delete(key)
+
+    async def _load_principal(self, token: str) -> Optional[AuthPrincipal]:
+        try:
+            user_id = uuid.UUID(token)
+        except ValueError:
+            return None
+
+        async with AsyncSessionLocal() as session:
+            result = await session.execute(select(User.id, User.role).where(User.id == user_id))
+            row = result.first()
+        if row is None:
+            return None
+        return AuthPrincipal(str(row.id), row.role)
+
+    def _remember_local(self, key: str, entry: Dict[str, Any]) -> None:
+        ttl = self.local_ttl if entry.get("id") else min(self.local_ttl, self.negative_ttl)
+        self.local.set(key, entry, ttl=ttl, size=_ENTRY_SIZE)
+
+    @staticmethod
+    def _principal(entry: Dict[str, Any]) -> Optional[AuthPrincipal]:
+        if not entry.get("id"):
+            return None
+        return AuthPrincipal(entry["id"], entry.get("role"))
+
+
+def bearer_token(headers) -> Optional[str]:
+    """Extract the bearer token from raw ASGI headers"""
+    for name, value in headers:
+        if name == b"authorization":
+            scheme, _, credentials = value.decode("latin-1").partition(" ")
+            if scheme.lower() == "bearer" and credentials.strip():
+                return credentials.strip()
+            return None
+    return None
+
+
+class AuthMiddleware:
+    """
+    Pure ASGI middleware populating request.state with the caller's identity.
+
+    Never rejects requests: endpoints that require a user still go through
+    deps.get_current_user, which raises 401 when request.state.auth is None.
+    Must wrap SlowAPIMiddleware (added after it) so default limits see the role.
+    """
+
+    def __init__(self, app, resolver: "TokenResolver"):
+        self.app = app
+        self.resolver = resolver
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http":
+            token = bearer_token(scope.get("headers", []))
+            principal = await self.resolver.resolve(token) if token else None
+
+            state = scope.setdefault("state", {})
+            state["auth"] = principal
+            state["user_id"] = principal.user_id if principal else None
+            state["user_role"] = principal.rate_limit_role if principal else GUEST_ROLE
+
+        await self.app(scope, receive, send)
+
+
+token_resolver = TokenResolver(
+    ttl=settings.AUTH_CACHE_TTL,
+    local_ttl=settings.AUTH_CACHE_LOCAL_TTL,
+    negative_ttl=settings.AUTH_NEGATIVE_TTL,
+    max_entries=settings.AUTH_CACHE_MAX_ENTRIES
+)
@@ -1,8 +1,17 @@
 import redis.asyncio as redis
 from app.core.config import settings
+import asyncio
 import logging
-from typing import Optional, Any
-import json
+import math
+import random
+import time
+import uuid
+from collections import OrderedDict
+from typing import Optional, Any, Awaitable, Callable, Dict, List, Tuple
+
+from app.core.codec import CacheCodec
+from app.core.redis_health import redis_breaker, CircuitState
+from app.core.metrics import registry
 
 logger = logging.getLogger(__name__)
 
@@ -22,6 +31,110 @@ class CacheTTL:
     RAW = 86400 * 2           # 48 hours (172,800 seconds)
     SESSION = 3600            # 1 hour
 
+    # In-process (L1) lifetime per tier. Kept short: pub/sub invalidation is
+    # the primary freshness mechanism, the TTL is only a safety net. Never
+    # longer than what is left of the Redis entry's own TTL.
+    # RAW is absent on purpose - raw social data lives in Redis only (Doctrine 1.1).
+    L1 = {
+        STATIC: 3600,        # 1 hour
+        SEMI_DYNAMIC: 600,   # 10 minutes
+        SESSION: 60,         # 1 minute
+    }
+
+
+# Key namespace -> TTL tier, used to derive the L1 lifetime of a key
+NAMESPACE_TIERS = {
+    "static": CacheTTL.STATIC,
+    "city": CacheTTL.STATIC,
+    "venue": CacheTTL.SEMI_DYNAMIC,
+    "event": CacheTTL.SEMI_DYNAMIC,
+    "session": CacheTTL.SESSION,
+    "raw": CacheTTL.RAW,
+    "tag": CacheTTL.STATIC,            # Response cache tag versions
+    "resp": CacheTTL.SEMI_DYNAMIC,     # Cached endpoint responses
+}
+
+INVALIDATION_CHANNEL = "cache:invalidate"
+
+# Instrumentation (exposed by GET /admin/metrics and GET /admin/cache/stats)
+CACHE_LOOKUPS = registry.counter(
+    "mosport_cache_lookups_total", "Cache lookups by namespace and result (hit, l1_hit, fallback_hit, miss)"
+)
+CACHE_ERRORS = registry.counter("mosport_cache_errors_total", "Redis errors by namespace and operation")
+CACHE_BYTES = registry.counter("mosport_cache_bytes_total", "Encoded payload bytes by namespace and direction")
+CACHE_LATENCY = registry.histogram(
+    "mosport_cache_latency_seconds", "Redis round-trip latency by namespace and operation"
+)
+
+# Marks values written by get_or_compute (value + recompute metadata)
+COMPUTED_MARKER = "__computed__"
+
+# Compare-and-delete so a worker never releases a lock it no longer owns
+RELEASE_LOCK_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', KEYS[1])
+end
+return 0
+"""
+
+
+def key_namespace(key: str) -> str:
+    """Namespace prefix of a cache key, e.g. 'venue:123:qoe_tags' -> 'venue'"""
+    return key.split(":", 1)[0]
+
+
+class LocalCache:
+    """
+    In-process L1 cache with LRU eviction and per-entry expiry.
+
+    Bounded by entry count and by approximate payload size (the length of
+    the serialized value as stored in Redis). Values are shared between
+    callers and must be treated as read-only.
+    """
+
+    def __init__(self, max_entries: int, max_bytes: int):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._data: "OrderedDict[str, Tuple[Any, float, int]]" = OrderedDict()
+        self._bytes = 0
+
+    def get(self, key: str) -> Tuple[bool, Any]:
+        """Returns (found, value)"""
+        entry = self._data.get(key)
+        if entry is None:
+            return False, None
+        value, expires_at, _ = entry
+        if expires_at <= time.monotonic():
+            self._pop(key)
+            return False, None
+        self._data.move_to_end(key)
+        return True, value
+
+    def set(self, key: str, value: Any, ttl: float, size: int) -> None:
+        self._pop(key)
+        if ttl <= 0 or size > self.max_bytes:
+            return
+        self._data[key] = (value, time.monotonic() + ttl, size)
+        self._bytes += size
+        while len(self._data) > self.max_entries or self._bytes > self.max_bytes:
+            _, (_, _, evicted_size) = self._data.popitem(last=False)
+            self._bytes -= evicted_size
+
+    def delete(self, key: str) -> None:
+        self._pop(key)
+
+    def clear(self) -> None:
+        self._data.clear()
+        self._bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        return {"entries": len(self._data), "bytes": self._bytes}
+
+    def _pop(self, key: str) -> None:
+        entry = self._data.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry[2]
+
 
 class CacheService:
     _instance = None
@@ -32,37 +145,169 @@ class CacheService:
             try:
                 cls._instance.redis = redis.from_url(
                     settings.REDIS_URL, 
-                    encoding="utf-8", 
-                    decode_responses=True,
-                    socket_connect_timeout=2  # Short timeout for fail-safe
+                    decode_responses=False,  # Values are binary codec envelopes
+                    socket_connect_timeout=2,  # Short timeout for fail-safe
+                    socket_timeout=settings.REDIS_SOCKET_TIMEOUT
                 )
             except Exception as e:
                 logger.warning(f"Redis initialization failed: {e}")
                 cls._instance.redis = None
+
+            cls._instance.codec = CacheCodec(
+                serializer=settings.CACHE_SERIALIZER,
+                compress_min_bytes=settings.CACHE_COMPRESS_MIN_BYTES,
+                compress_level=settings.CACHE_COMPRESS_LEVEL
+            )
+
+            # Optional L1 layer (Section 3.3: hot keys served from process memory)
+            cls._instance.local = None
+            if settings.CACHE_L1_ENABLED:
+                cls._instance.local = LocalCache(
+                    max_entries=settings.CACHE_L1_MAX_ENTRIES,
+                    max_bytes=settings.CACHE_L1_MAX_BYTES
+                )
+            # Degraded mode: bounded in-memory store used while Redis is down
+            cls._instance.fallback = LocalCache(
+                max_entries=settings.REDIS_FALLBACK_MAX_ENTRIES,
+                max_bytes=settings.REDIS_FALLBACK_MAX_BYTES
+            )
+            redis_breaker.add_listener(cls._instance._on_breaker_change)
+
+            cls._instance._origin = uuid.uuid4().hex
+            cls._instance._listener = None
+            cls._instance._inflight = {}
         return cls._instance
 
+    def _redis_available(self) -> bool:
+        """False when Redis is not configured or the circuit breaker is open"""
+        return self.redis is not None and redis_breaker.allow_request()
+
+    def _on_breaker_change(self, state: str) -> None:
+        if state == CircuitState.CLOSED:
+            # Redis is authoritative again; anything held locally may be stale
+            self.fallback.clear()
+            if self.local is not None:
+                self.local.clear()
+
+    def _store_fallback(self, key: str, value: Any, size: int, ttl: int) -> None:
+        self.fallback.set(key, value, min(ttl, settings.REDIS_FALLBACK_TTL), size)
+
+    async def start(self) -> None:
+        """Start the cross-worker invalidation listener (no-op without L1)"""
+        if self.local is None or not self.redis or self._listener is not None:
+            return
+        self._listener = asyncio.create_task(self._listen_invalidations())
+        logger.info("L1 cache enabled, listening for invalidations")
+
+    async def close(self) -> None:
+        if self._listener is not None:
+            self._listener.cancel()
+            try:
+                await self._listener
+            except asyncio.CancelledError:
+                pass
+            self._listener = None
+
     async def get(self, key: str) -> Optional[Any]:
-        if not self.redis:
-            return None
+        if self.local is not None:
+            found, value = self.local.get(key)
+            if found:
+                self._record_lookup(key, "l1_hit")
+                return value
+
+        if not self._redis_available():
+            found, value = self.fallback.get(key)
+            self._record_lookup(key, "fallback_hit" if found else "miss")
+            return value
+        started = time.perf_counter()
         try:
-            val = await self.redis.get(key)
+            if self.local is not None and self._l1_ttl(key) > 0:
+                # Same round trip: the L1 copy must not outlive the Redis entry
+                async with self.redis.pipeline(transaction=False) as pipe:
+                    pipe.get(key)
+                    pipe.pttl(key)
+                    val, pttl = await pipe.execute()
+            else:
+                val, pttl = await self.redis.get(key), None
+            redis_breaker.record_success()
+            self._record_latency([key], "get", started)
             if val:
-                try:
-                    return json.loads(val)
-                except json.JSONDecodeError:
-                    return val
+                self._record_lookup(key, "hit", len(val))
+                value = self._deserialize(val)
+                self._store_local(key, value, len(val), self._remaining_ttl(pttl))
+                return value
+            self._record_lookup(key, "miss")
             return None
         except Exception as e:
+            redis_breaker.record_failure()
+            self._record_error([key], "get")
             logger.warning(f"Redis get failed: {e}")
             return None
 
+    async def get_many(self, keys: List[str]) -> Dict[str, Any]:
+        """
+        Fetch several keys in one MGET round trip.
+
+        Returns:
+            Dict of key -> value for the keys that were found (misses omitted).
+            Served from L1 / the in-memory fallback while Redis is unavailable.
+        """
+        found: Dict[str, Any] = {}
+        remaining = []
+        for key in dict.fromkeys(keys):
+            if self.local is not None:
+                hit, value = self.local.get(key)
+                if hit:
+                    self._record_lookup(key, "l1_hit")
+                    found[key] = value
+                    continue
+            remaining.append(key)
+
+        if not remaining:
+            return found
+        if not self._redis_available():
+            for key in remaining:
+                hit, value = self.fallback.get(key)
+                self._record_lookup(key, "fallback_hit" if hit else "miss")
+                if hit:
+                    found[key] = value
+            return found
+        started = time.perf_counter()
+        try:
+            l1_keys = [key for key in remaining if self._l1_ttl(key) > 0] if self.local is not None else []
+            if l1_keys:
+                async with self.redis.pipeline(transaction=False) as pipe:
+                    pipe.mget(remaining)
+                    for key in l1_keys:
+                        pipe.pttl(key)
+                    values, *pttls = await pipe.execute()
+                l1_ttls = {key: self._remaining_ttl(pttl) for key, pttl in zip(l1_keys, pttls)}
+            else:
+                values, l1_ttls = await self.redis.mget(remaining), {}
+            redis_breaker.record_success()
+            self._record_latency(remaining, "get_many", started)
+            for key, val in zip(remaining, values):
+                if val:
+                    self._record_lookup(key, "hit", len(val))
+                    value = self._deserialize(val)
+                    self._store_local(key, value, len(val), l1_ttls.get(key))
+                    found[key] = value
+                else:
+                    self._record_lookup(key, "miss")
+            return found
+        except Exception as e:
+            redis_breaker.record_failure()
+            self._record_error(remaining, "get_many")
+            logger.warning(f"Redis get_many failed: {e}")
+            return found
+
     async def set(self, key: str, value: Any, ttl: int = CacheTTL.RAW) -> bool:
         """
         Set cache value with TTL.
         
         Args:
             key: Cache key
-            value: Value to cache (dict/list will be JSON serialized)
+            value: Value to cache (encoded with the configured CacheCodec)
             ttl: Time-to-live in seconds. Use CacheTTL constants:
                 - CacheTTL.STATIC (30 days) - Venue info, locations
                 - CacheTTL.SEMI_DYNAMIC (7 days) - Event fixtures
@@ -70,7 +315,7 @@ class CacheService:
                 - CacheTTL.SESSION (1 hour) - User sessions
         
         Returns:
-            bool: Success status
+            bool: Success status (False if only the in-memory fallback was written)
         
         Example:
             # Store venue location (static data)
@@ -84,23 +329,412 @@ class CacheService:
         """
         if not self.redis:
             return False
+        payload = self._serialize(value)
+        if not redis_breaker.allow_request():
+            self._store_fallback(key, value, len(payload), ttl)
+            return False
+        started = time.perf_counter()
         try:
-            if isinstance(value, (dict, list)):
-                value = json.dumps(value)
-            await self.redis.set(key, value, ex=ttl)
+            if self._publishes_invalidations:
+                async with self.redis.pipeline(transaction=False) as pipe:
+                    pipe.set(key, payload, ex=ttl)
+                    pipe.publish(INVALIDATION_CHANNEL, f"{self._origin}|{key}")
+                    await pipe.execute()
+            else:
+                await self.redis.set(key, payload, ex=ttl)
+            redis_breaker.record_success()
+            self._record_latency([key], "set", started)
+            CACHE_BYTES.inc(len(payload), namespace=key_namespace(key), direction="written")
+            self._store_local(key, value, len(payload), ttl)
             return True
         except Exception as e:
+            redis_breaker.record_failure()
+            self._record_error([key], "set")
             logger.warning(f"Redis set failed: {e}")
+            self._store_fallback(key, value, len(payload), ttl)
             return False
 
-    async def delete(self, key: str) -> bool:
+    async def set_many(self, mapping: Dict[str, Any], ttl: int = CacheTTL.RAW) -> bool:
+        """
+        Set several keys with the same TTL in one pipelined round trip.
+
+        Example:
+            await cache.set_many({
+                "venue:1:qoe_tags": {...},
+                "venue:2:qoe_tags": {...},
+            }, ttl=CacheTTL.SEMI_DYNAMIC)
+        """
+        if not mapping:
+            return True
         if not self.redis:
             return False
+        payloads = {key: self._serialize(value) for key, value in mapping.items()}
+        if not redis_breaker.allow_request():
+            for key, value in mapping.items():
+                self._store_fallback(key, value, len(payloads[key]), ttl)
+            return False
+        started = time.perf_counter()
+        try:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                for key, payload in payloads.items():
+                    pipe.set(key, payload, ex=ttl)
+                    if self._publishes_invalidations:
+                        pipe.publish(INVALIDATION_CHANNEL, f"{self._origin}|{key}")
+                await pipe.execute()
+            redis_breaker.record_success()
+            self._record_latency(list(payloads), "set_many", started)
+            for key, payload in payloads.items():
+                CACHE_BYTES.inc(len(payload), namespace=key_namespace(key), direction="written")
+            if self.local is not None:
+                for key, value in mapping.items():
+                    self._store_local(key, value, len(payloads[key]), ttl)
+            return True
+        except Exception as e:
+            redis_breaker.record_failure()
+            self._record_error(list(payloads), "set_many")
+            logger.warning(f"Redis set_many failed: {e}")
+            for key, value in mapping.items():
+                self._store_fallback(key, value, len(payloads[key]), ttl)
+            return False
+
+    async def delete_many(self, keys: List[str]) -> bool:
+        """Delete several keys in one pipelined round trip"""
+        if not keys:
+            return True
+        for key in keys:
+            self.fallback.delete(key)
+            if self.local is not None:
+                self.local.delete(key)
+        if not self._redis_available():
+            return False
+        started = time.perf_counter()
+        try:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                pipe.delete(*keys)
+                if self._publishes_invalidations:
+                    for key in keys:
+                        pipe.publish(INVALIDATION_CHANNEL, f"{self._origin}|{key}")
+                await pipe.execute()
+            redis_breaker.record_success()
+            self._record_latency(keys, "delete_many", started)
+            return True
+        except Exception as e:
+            redis_breaker.record_failure()
+            self._record_error(keys, "delete_many")
+            logger.warning(f"Redis delete_many failed: {e}")
+            return False
+
+    def buffer(self) -> "CacheWriteBuffer":
+        """Create a write buffer that flushes with one pipeline per TTL"""
+        return CacheWriteBuffer(self)
+
+    async def delete(self, key: str) -> bool:
+        self.fallback.delete(key)
+        if self.local is not None:
+            self.local.delete(key)
+        if not self._redis_available():
+            return False
+        started = time.perf_counter()
         try:
             await self.redis.delete(key)
+            redis_breaker.record_success()
+            self._record_latency([key], "delete", started)
+            if self._publishes_invalidations:
+                await self._publish_invalidation(key)
             return True
         except Exception as e:
+            redis_breaker.record_failure()
+            self._record_error([key], "delete")
             logger.warning(f"Redis delete failed: {e}")
             return False
 
+    async def get_or_compute(
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[Any]],
+        ttl: int = CacheTTL.RAW,
+        lock_timeout: float = 5.0,
+        beta: float = 1.0
+    ) -> Any:
+        """
+        Read-through cache with stampede protection.
+
+        - Concurrent misses in this process share one loader call (asyncio future)
+        - Across workers, a short Redis lock lets one worker recompute while the
+          others wait for its result (up to lock_timeout seconds)
+        - Entries are refreshed probabilistically before they expire (XFetch),
+          so a hot key is recomputed by one caller instead of expiring for all
+
+        Values are stored wrapped with their recompute metadata; read keys
+        written here through get_or_compute, not get().
+
+        Example:
+            cities = await cache.get_or_compute(
+                "city:list", lambda: load_cities(db), ttl=CacheTTL.STATIC
+            )
+        """
+        cached = await self.get(key)
+        if self._is_fresh(cached, beta):
+            return cached["value"]
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            return await asyncio.shield(inflight)
+
+        future = asyncio.get_running_loop().create_future()
+        # Nobody may be waiting on it; never warn about an unretrieved exception
+        future.add_done_callback(lambda f: f.cancelled() or f.exception())
+        self._inflight[key] = future
+        try:
+            value = await self._compute_locked(key, loader, ttl, lock_timeout, cached)
+            future.set_result(value)
+            return value
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        finally:
+            self._inflight.pop(key, None)
+
+    async def get_computed_many(self, keys: List[str]) -> Dict[str, Any]:
+        """
+        Values of get_or_compute keys that have not expired yet, in one MGET.
+
+        Lets a batch skip work whose result another run already computed;
+        keys missing from the result are absent or expired.
+        """
+        found = await self.get_many(keys)
+        now = time.time()
+        return {
+            key: cached["value"]
+            for key, cached in found.items()
+            if self._is_computed(cached) and now < cached["expires_at"]
+        }
+
+    async def _compute_locked(
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[Any]],
+        ttl: int,
+        lock_timeout: float,
+        stale: Any
+    ) -> Any:
+        lock_key = f"lock:{key}"
+        token = uuid.uuid4().hex
+        acquired = False
+        if self._redis_available():
+            try:
+                acquired = bool(await self.redis.set(
+                    lock_key, token, nx=True, px=int(lock_timeout * 1000)
+                ))
+                redis_breaker.record_success()
+            except Exception as e:
+                redis_breaker.record_failure()
+                logger.warning(f"Redis lock failed: {e}")
+                acquired = None  # Lock state unknown: compute locally
+
+            if acquired is False and self._is_computed(stale):
+                # Early refresh already running on another worker
+                return stale["value"]
+
+            if acquired is False:
+                deadline = time.monotonic() + lock_timeout
+                while time.monotonic() < deadline:
+                    await asyncio.sleep(0.05)
+                    cached = await self.get(key)
+                    if self._is_computed(cached):
+                        return cached["value"]
+                logger.warning(f"Timed out waiting for {key}, computing locally")
+
+        try:
+            started = time.monotonic()
+            value = await loader()
+            delta = time.monotonic() - started
+            await self.set(key, {
+                COMPUTED_MARKER: 1,
+                "value": value,
+                "delta": delta,
+                "expires_at": time.time() + ttl
+            }, ttl=ttl)
+            return value
+        finally:
+            if acquired:
+                try:
+                    await self.redis.eval(RELEASE_LOCK_SCRIPT, 1, lock_key, token)
+                except Exception as e:
+                    logger.warning(f"Redis lock release failed: {e}")
+
+    @staticmethod
+    def _is_computed(cached: Any) -> bool:
+        return isinstance(cached, dict) and COMPUTED_MARKER in cached
+
+    @classmethod
+    def _is_fresh(cls, cached: Any, beta: float) -> bool:
+        """XFetch: recompute early with a probability that grows near expiry"""
+        if not cls._is_computed(cached):
+            return False
+        jitter = cached["delta"] * beta * -math.log(1.0 - random.random())
+        return time.time() + jitter < cached["expires_at"]
+
+    def stats(self) -> Dict[str, Any]:
+        """Per-namespace hit/miss/error/bytes/latency summary for this worker"""
+        namespaces: Dict[str, Dict[str, Any]] = {}
+
+        def entry(namespace: str) -> Dict[str, Any]:
+            return namespaces.setdefault(namespace, {
+                "hit": 0, "l1_hit": 0, "fallback_hit": 0, "miss": 0,
+                "errors": 0, "bytes_read": 0, "bytes_written": 0, "latency": {}
+            })
+
+        for labels, value in CACHE_LOOKUPS.samples():
+            entry(labels["namespace"])[labels["result"]] += int(value)
+        for labels, value in CACHE_ERRORS.samples():
+            entry(labels["namespace"])["errors"] += int(value)
+        for labels, value in CACHE_BYTES.samples():
+            entry(labels["namespace"])[f"bytes_{labels['direction']}"] += int(value)
+        for labels, summary in CACHE_LATENCY.samples():
+            entry(labels["namespace"])["latency"][labels["op"]] = summary
+
+        for ns in namespaces.values():
+            hits = ns["hit"] + ns["l1_hit"] + ns["fallback_hit"]
+            lookups = hits + ns["miss"]
+            ns["hit_rate"] = round(hits / lookups, 4) if lookups else None
+
+        return {
+            "namespaces": namespaces,
+            "l1": self.local.stats() if self.local is not None else None,
+            "fallback": self.fallback.stats(),
+            "circuit": redis_breaker.status(),
+        }
+
+    # --- Instrumentation ---
+
+    @staticmethod
+    def _record_lookup(key: str, result: str, size: int = 0) -> None:
+        namespace = key_namespace(key)
+        CACHE_LOOKUPS.inc(namespace=namespace, result=result)
+        if size:
+            CACHE_BYTES.inc(size, namespace=namespace, direction="read")
+
+    @staticmethod
+    def _record_latency(keys: List[str], op: str, started: float) -> None:
+        elapsed = time.perf_counter() - started
+        for namespace in {key_namespace(key) for key in keys}:
+            CACHE_LATENCY.observe(elapsed, namespace=namespace, op=op)
+
+    @staticmethod
+    def _record_error(keys: List[str], op: str) -> None:
+        for namespace in {key_namespace(key) for key in keys}:
+            CACHE_ERRORS.inc(namespace=namespace, op=op)
+
+    # --- Serialization ---
+
+    def _serialize(self, value: Any) -> bytes:
+        return self.codec.encode(value)
+
+    def _deserialize(self, raw: bytes) -> Any:
+        return self.codec.decode(raw)
+
+    # --- L1 helpers ---
+
+    @property
+    def _publishes_invalidations(self) -> bool:
+        """Writers publish even without their own L1: other workers may have one"""
+        return self.local is not None or settings.CACHE_L1_INVALIDATION
+
+    @staticmethod
+    def _remaining_ttl(pttl: Optional[int]) -> Optional[float]:
+        """L1 cap from a Redis PTTL reply (-1 = no expiry, -2 = already gone)"""
+        if pttl is None or pttl == -1:
+            return None
+        return max(0, pttl) / 1000
+
+    def _l1_ttl(self, key: str, ttl: Optional[float] = None) -> float:
+        """L1 lifetime for a key, derived from its namespace's CacheTTL tier"""
+        tier = NAMESPACE_TIERS.get(key_namespace(key))
+        l1_ttl = CacheTTL.L1.get(tier, 0)
+        if ttl is not None:
+            l1_ttl = min(l1_ttl, ttl)
+        return l1_ttl
+
+    def _store_local(self, key: str, value: Any, size: int, ttl: Optional[float] = None) -> None:
+        if self.local is None:
+            return
+        self.local.set(key, value, self._l1_ttl(key, ttl), size)
+
+    async def _publish_invalidation(self, key: str) -> None:
+        try:
+            await self.redis.publish(INVALIDATION_CHANNEL, f"{self._origin}|{key}")
+        except Exception as e:
+            logger.warning(f"Cache invalidation publish failed: {e}")
+
+    async def _listen_invalidations(self) -> None:
+        """Drop L1 entries written or deleted by other workers"""
+        while True:
+            pubsub = self.redis.pubsub()
+            try:
+                await pubsub.subscribe(INVALIDATION_CHANNEL)
+                # Anything written while we were disconnected is unknown
+                self.local.clear()
+                async for message in pubsub.listen():
+                    if message.get("type") != "message":
+                        continue
+                    origin, _, key = message["data"].decode("utf-8").partition("|")
+                    if origin != self._origin:
+                        self.local.delete(key)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Cache invalidation listener failed: {e}")
+                self.local.clear()
+                await asyncio.sleep(5)
+            finally:
+                try:
+                    await pubsub.aclose()
+                except Exception:
+                    pass
+
+
+class CacheWriteBuffer:
+    """
+    Collects cache writes during a batch job and flushes them together.
+
+    Writes are grouped by TTL so a flush costs one pipelined round trip per
+    TTL tier, regardless of how many keys were buffered. Later writes to the
+    same key replace earlier ones.
+
+    Example:
+        writes = cache.buffer()
+        writes.set("venue:1:qoe_tags", {...}, CacheTTL.SEMI_DYNAMIC)
+        writes.set("raw:venue_post:1:abc", {...})  # CacheTTL.RAW
+        await writes.flush()
+    """
+
+    def __init__(self, service: CacheService):
+        self._service = service
+        self._pending: Dict[int, Dict[str, Any]] = {}
+
+    def set(self, key: str, value: Any, ttl: int = CacheTTL.RAW) -> None:
+        for tier_writes in self._pending.values():
+            tier_writes.pop(key, None)
+        self._pending.setdefault(ttl, {})[key] = value
+
+    def __len__(self) -> int:
+        return sum(len(tier_writes) for tier_writes in self._pending.values())
+
+    def discard(self) -> int:
+        """Drop the buffered writes (e.g. when the batch's DB writes failed)"""
+        dropped = len(self)
+        self._pending = {}
+        return dropped
+
+    async def flush(self) -> bool:
+        pending, self._pending = self._pending, {}
+        ok = True
+        for ttl, mapping in pending.items():
+            ok = await self._service.set_many(mapping, ttl=ttl) and ok
+        return ok
+
 cache = CacheService()
@@ -0,0 +1,134 @@
+"""
+Cache Value Codec - Versioned envelope for Redis values
+
+Layout of an encoded value:
+
+    b"\\x00mc" | version (1 byte) | serializer id (1 byte) | flags (1 byte) | body
+
+- serializer id: 1 = JSON (orjson when installed), 2 = msgpack
+- flags: bit 0 set = body is zlib-compressed
+
+Values written before the envelope existed are plain JSON (or plain strings).
+They never start with a NUL byte, so they are still decoded as before.
+"""
+
+import json
+import logging
+import zlib
+from datetime import date, datetime
+from typing import Any, Dict
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - optional dependency
+    msgpack = None
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"\x00mc"
+VERSION = 1
+HEADER_SIZE = len(MAGIC) + 3
+
+FLAG_ZLIB = 0x01
+
+
+def _default(obj: Any) -> Any:
+    """Fallback for types the serializers don't know (datetimes, UUIDs, ...)"""
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    return str(obj)
+
+
+class JSONSerializer:
+    id = 1
+    name = "json"
+
+    def dumps(self, value: Any) -> bytes:
+        if orjson is not None:
+            return orjson.dumps(value, default=_default, option=orjson.OPT_NON_STR_KEYS)
+        return json.dumps(value, default=_default, separators=(",", ":")).encode("utf-8")
+
+    def loads(self, body: bytes) -> Any:
+        if orjson is not None:
+            return orjson.loads(body)
+        return json.loads(body)
+
+
+class MsgpackSerializer:
+    id = 2
+    name = "msgpack"
+
+    def dumps(self, value: Any) -> bytes:
+        return msgpack.packb(value, use_bin_type=True, default=_default)
+
+    def loads(self, body: bytes) -> Any:
+        return msgpack.unpackb(body, raw=False)
+
+
+SERIALIZERS: Dict[str, Any] = {"json": JSONSerializer()}
+if msgpack is not None:
+    SERIALIZERS["msgpack"] = MsgpackSerializer()
+
+_SERIALIZERS_BY_ID = {s.id: s for s in SERIALIZERS.values()}
+
+
+class CacheCodec:
+    """
+    Encodes cache values into the versioned envelope and decodes both
+    envelope and legacy (plain JSON) values.
+
+    Args:
+        serializer: 'json' or 'msgpack' (falls back to json if msgpack is missing)
+        compress_min_bytes: Compress bodies at least this large (0 disables)
+        compress_level: zlib level (1 = fastest)
+    """
+
+    def __init__(self, serializer: str = "json", compress_min_bytes: int = 1024, compress_level: int = 1):
+        if serializer not in SERIALIZERS:
+            logger.warning(f"Cache serializer '{serializer}' unavailable, using json")
+            serializer = "json"
+        self.serializer = SERIALIZERS[serializer]
+        self.compress_min_bytes = compress_min_bytes
+        self.compress_level = compress_level
+
+    def encode(self, value: Any) -> bytes:
+        body = self.serializer.dumps(value)
+        flags = 0
+        if self.compress_min_bytes and len(body) >= self.compress_min_bytes:
+            compressed = zlib.compress(body, self.compress_level)
+            # Only keep compression when it actually pays off
+            if len(compressed) < len(body):
+                body = compressed
+                flags |= FLAG_ZLIB
+        return MAGIC + bytes((VERSION, self.serializer.id, flags)) + body
+
+    def decode(self, raw: bytes) -> Any:
+        if isinstance(raw, str):
+            raw = raw.encode("utf-8")
+        if not raw.startswith(MAGIC):
+            return self._decode_legacy(raw)
+
+        version, serializer_id, flags = raw[len(MAGIC):HEADER_SIZE]
+        if version != VERSION:
+            raise ValueError(f"Unsupported cache envelope version: {version}")
+        serializer = _SERIALIZERS_BY_ID.get(serializer_id)
+        if serializer is None:
+            raise ValueError(f"Unsupported cache serializer id: {serializer_id}")
+
+        body = raw[HEADER_SIZE:]
+        if flags & FLAG_ZLIB:
+            body = zlib.decompress(body)
+        return serializer.loads(body)
+
+    @staticmethod
+    def _decode_legacy(raw: bytes) -> Any:
+        """Pre-envelope values: JSON for dict/list, plain string otherwise"""
+        try:
+            return json.loads(raw)
+        except ValueError:
+            return raw.decode("utf-8", errors="replace")
@@ -1,18 +1,110 @@
+import asyncio
+import json
 import logging
-from typing import Optional, List, Dict, Any
+import math
+from typing import Optional, List, Dict, Any, Set, Tuple
 from app.core.config import settings
+from app.core.judgment_memo import judgment_memo, prompt_version
+from app.core.metrics import registry
 
 logger = logging.getLogger(__name__)
 
+JUDGE_MODEL = "gpt-4o"
+JUDGE_PROMPT = "You are a sports verification AI. Analyze the post to confirm if a sports venue is showing a match. Return JSON only: {is_match, confidence, tags}."
+JUDGE_VERSION = prompt_version(JUDGE_MODEL, JUDGE_PROMPT)
+
+JUDGE_BATCH_PROMPT = (
+    "You are a sports verification AI. Each numbered post comes from a sports venue's social feed. "
+    "For every post, judge whether the venue is showing a match. Return one result per post, "
+    "with its index: {results: [{index, is_match, confidence, tags}]}."
+)
+JUDGE_BATCH_VERSION = prompt_version(JUDGE_MODEL, JUDGE_BATCH_PROMPT)
+
+# Structured output: the model must return exactly this shape
+JUDGE_BATCH_SCHEMA = {
+    "name": "post_judgments",
+    "strict": True,
+    "schema": {
+        "type": "object",
+        "properties": {
+            "results": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "index": {"type": "integer"},
+                        "is_match": {"type": "boolean"},
+                        "confidence": {"type": "number"},
+                        "tags": {"type": "array", "items": {"type": "string"}}
+                    },
+                    "required": ["index", "is_match", "confidence", "tags"],
+                    "additionalProperties": False
+                }
+            }
+        },
+        "required": ["results"],
+        "additionalProperties": False
+    }
+}
+
+# Rough token costs for packing: ~4 characters per text token, images at
+# the 'auto' detail worst case, completion tokens per result
+POST_OVERHEAD_TOKENS = 12
+IMAGE_TOKENS = 765
+RESULT_TOKENS = 40
+
+JUDGE_REQUESTS = registry.counter(
+    "mosport_dtss_judge_requests_total", "AIJudge LLM requests by mode (single, batch) and outcome (ok, split, error)"
+)
+JUDGE_BATCH_POSTS = registry.counter(
+    "mosport_dtss_judge_batch_posts_total", "Posts judged through AIJudge.evaluate_posts batch requests"
+)
+
+
+def estimate_post_tokens(text: str, image_url: Optional[str] = None) -> int:
+    """Estimated prompt tokens of one post in a batch request"""
+    return POST_OVERHEAD_TOKENS + math.ceil(len(text) / 4) + (IMAGE_TOKENS if image_url else 0)
+
+
+def pack_posts(
+    posts: List[Tuple[int, Dict[str, Any]]],
+    token_budget: int,
+    max_posts: int
+) -> List[List[Tuple[int, Dict[str, Any]]]]:
+    """
+    Greedily pack (index, post) pairs into chunks of at most `max_posts`
+    posts and `token_budget` estimated prompt tokens. A post over the
+    budget on its own still gets a chunk (the API decides).
+    """
+    chunks: List[List[Tuple[int, Dict[str, Any]]]] = []
+    chunk: List[Tuple[int, Dict[str, Any]]] = []
+    tokens = 0
+    for item in posts:
+        cost = estimate_post_tokens(item[1]["text"], item[1].get("image_url"))
+        if chunk and (len(chunk) >= max_posts or tokens + cost > token_budget):
+            chunks.append(chunk)
+            chunk, tokens = [], 0
+        chunk.append(item)
+        tokens += cost
+    if chunk:
+        chunks.append(chunk)
+    return chunks
+
+
+def _is_context_error(error: Exception) -> bool:
+    """The request (prompt + max_tokens) exceeded the model's context window"""
+    return getattr(error, "code", None) == "context_length_exceeded" or "maximum context length" in str(error)
+
+
 class AIJudge:
-    def __init__(self):
-        self.api_key = settings.OPENAI_API_KEY
+    def __init__(self, api_key: Optional[str] = None, base_url: Optional[str] = None):
+        self.api_key = api_key or settings.OPENAI_API_KEY
         self.client = None
         
         if self.api_key:
             try:
                 from openai import AsyncOpenAI
-                self.client = AsyncOpenAI(api_key=self.api_key)
+                self.client = AsyncOpenAI(api_key=self.api_key, base_url=base_url or settings.OPENAI_BASE_URL)
             except ImportError:
                 logger.error("OpenAI package not installed.")
         else:
@@ -22,16 +114,25 @@ class AIJudge:
         """
         Analyzes social post content to determine if it validates a match.
         Returns: { "is_match": bool, "confidence": float, "tags": List[str] }
+
+        Identical content (after normalization) is answered from the
+        judgment memo for 48h instead of a new LLM call.
         """
         # 1. Mock Mode (Fail-safe)
         if not self.client:
             return self._mock_evaluation(text)
 
-        # 2. Real AI Judgment
+        # 2. Memoized judgment of the same content
+        memo_key = judgment_memo.key("judge", JUDGE_VERSION, text, image_url)
+        cached = await judgment_memo.get(memo_key, "judge")
+        if cached is not None:
+            return cached
+
+        # 3. Real AI Judgment
         try:
             # Construct prompt
             messages = [
-                {"role": "system", "content": "You are a sports verification AI. Analyze the post to confirm if a sports venue is showing a match. Return JSON only: {is_match, confidence, tags}."},
+                {"role": "system", "content": JUDGE_PROMPT},
                 {"role": "user", "content": f"Post: {text}"}
             ]
             
@@ -42,21 +143,144 @@ class AIJudge:
                 ]
 
             response = await self.client.chat.completions.create(
-                model="gpt-4o",
+                model=JUDGE_MODEL,
                 messages=messages,
                 response_format={"type": "json_object"},
                 max_tokens=150
             )
             
-            import json
             result = json.loads(response.choices[0].message.content)
+            JUDGE_REQUESTS.inc(mode="single", outcome="ok")
+            await judgment_memo.set(memo_key, result)
             return result
             
         except Exception as e:
+            JUDGE_REQUESTS.inc(mode="single", outcome="error")
             logger.error(f"AI Evaluation failed: {e}")
             # Fallback to neutral mock on error
             return {"is_match": False, "confidence": 0.0, "tags": [], "error": str(e)}
 
+    async def evaluate_posts(self, posts: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        evaluate_post() for many posts, packed into few LLM requests.
+
+        Args:
+            posts: [{"text": str, "image_url": str or None}, ...]
+        Returns:
+            One { "is_match", "confidence", "tags" } per post, in order
+            (with "error" for posts that could not be judged).
+
+        Memoized posts are answered without a request. The rest are packed
+        into structured-output requests of up to DTSS_BATCH_MAX_POSTS posts
+        and DTSS_BATCH_TOKEN_BUDGET estimated prompt tokens; a request that
+        still overflows (context error, truncated output or missing
+        results) is split in half and retried, down to single posts.
+        """
+        if not posts:
+            return []
+
+        # 1. Mock Mode (Fail-safe)
+        if not self.client:
+            return [self._mock_evaluation(post["text"]) for post in posts]
+
+        # 2. Memoized judgments of the same content
+        keys = [judgment_memo.key("judge", JUDGE_BATCH_VERSION, post["text"], post.get("image_url")) for post in posts]
+        memoized = await judgment_memo.get_many(keys, "judge")
+        results: List[Optional[Dict[str, Any]]] = [memoized.get(key) for key in keys]
+
+        # 3. Batched AI Judgment of the rest (identical posts are judged once)
+        pending: Dict[str, Tuple[int, Dict[str, Any]]] = {}
+        for index, (key, post) in enumerate(zip(keys, posts)):
+            if results[index] is None and key not in pending:
+                pending[key] = (index, post)
+
+        slots = asyncio.Semaphore(settings.DTSS_BATCH_CONCURRENCY)
+
+        async def judge(chunk: List[Tuple[int, Dict[str, Any]]]) -> Dict[int, Dict[str, Any]]:
+            async with slots:
+                return await self._evaluate_chunk(chunk)
+
+        chunks = pack_posts(list(pending.values()), settings.DTSS_BATCH_TOKEN_BUDGET, settings.DTSS_BATCH_MAX_POSTS)
+        judged: Dict[int, Dict[str, Any]] = {}
+        for chunk_results in await asyncio.gather(*(judge(chunk) for chunk in chunks)):
+            judged.update(chunk_results)
+
+        await judgment_memo.set_many({
+            key: judged[index] for key, (index, _) in pending.items() if "error" not in judged[index]
+        })
+        for index, key in enumerate(keys):
+            if results[index] is None:
+                results[index] = judged[pending[key][0]]
+        return results
+
+    async def _evaluate_chunk(self, chunk: List[Tuple[int, Dict[str, Any]]]) -> Dict[int, Dict[str, Any]]:
+        """One batch request; halves the chunk when the request overflows"""
+        content: List[Dict[str, Any]] = []
+        for index, post in chunk:
+            content.append({"type": "text", "text": f"Post {index}: {post['text']}"})
+            if post.get("image_url"):
+                content.append({"type": "image_url", "image_url": {"url": post["image_url"]}})
+
+        overflow = None
+        try:
+            response = await self.client.chat.completions.create(
+                model=JUDGE_MODEL,
+                messages=[
+                    {"role": "system", "content": JUDGE_BATCH_PROMPT},
+                    {"role": "user", "content": content}
+                ],
+                response_format={"type": "json_schema", "json_schema": JUDGE_BATCH_SCHEMA},
+                max_tokens=RESULT_TOKENS * len(chunk) + 50
+            )
+            choice = response.choices[0]
+            if choice.finish_reason == "length":
+                overflow = "output truncated"
+            else:
+                entries = json.loads(choice.message.content)["results"]
+        except Exception as e:
+            if not _is_context_error(e):
+                JUDGE_REQUESTS.inc(mode="batch", outcome="error")
+                logger.error(f"AI batch evaluation of {len(chunk)} posts failed: {e}")
+                return {index: self._failed(e) for index, _ in chunk}
+            overflow = "context length exceeded"
+
+        if overflow is not None:
+            if len(chunk) == 1:
+                JUDGE_REQUESTS.inc(mode="batch", outcome="error")
+                return {chunk[0][0]: self._failed(overflow)}
+            JUDGE_REQUESTS.inc(mode="batch", outcome="split")
+            logger.info(f"🔀 AI batch of {len(chunk)} posts split: {overflow}")
+            middle = len(chunk) // 2
+            left, right = await asyncio.gather(
+                self._evaluate_chunk(chunk[:middle]), self._evaluate_chunk(chunk[middle:])
+            )
+            return {**left, **right}
+
+        JUDGE_REQUESTS.inc(mode="batch", outcome="ok")
+        expected = {index for index, _ in chunk}
+        judged = {}
+        for entry in entries:
+            if entry.get("index") in expected:
+                judged[entry["index"]] = {
+                    "is_match": bool(entry.get("is_match")),
+                    "confidence": min(1.0, max(0.0, float(entry.get("confidence", 0.0)))),
+                    "tags": list(entry.get("tags") or [])
+                }
+        JUDGE_BATCH_POSTS.inc(len(judged))
+
+        missing = [(index, post) for index, post in chunk if index not in judged]
+        if missing and len(missing) < len(chunk):
+            # Model skipped some posts: ask again for just those
+            judged.update(await self._evaluate_chunk(missing))
+        else:
+            judged.update({index: self._failed("no result returned") for index, _ in missing})
+        return judged
+
+    @staticmethod
+    def _failed(error: Any) -> Dict[str, Any]:
+        # Neutral result, as evaluate_post falls back to on error
+        return {"is_match": False, "confidence": 0.0, "tags": [], "error": str(error)}
+
     def _mock_evaluation(self, text: str) -> Dict[str, Any]:
         """
         Deterministic mock logic for testing without API usage.
@@ -75,4 +299,66 @@ class AIJudge:
             "tags": []
         }
 
+class JudgeBatcher:
+    """
+    Coalesces evaluate_posts() calls of concurrent callers into shared ones.
+
+    Venue checks of a run each have a handful of new posts; judged per
+    venue, a batch request would carry ~3 posts. Callers submit here
+    instead: posts wait up to `linger` seconds (or until a full round of
+    DTSS_BATCH_MAX_POSTS x DTSS_BATCH_CONCURRENCY posts is pending) and are
+    then judged together, packed across venues by evaluate_posts.
+
+    Usage:
+        results = await judge_batcher.evaluate_posts(posts)  # Same contract as AIJudge
+    """
+
+    def __init__(self, judge: AIJudge, linger: Optional[float] = None):
+        self.judge = judge
+        self.linger = linger if linger is not None else settings.DTSS_BATCH_LINGER_MS / 1000
+        self._pending: List[Tuple[Dict[str, Any], asyncio.Future]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._flushes: Set[asyncio.Task] = set()
+
+    @property
+    def enabled(self) -> bool:
+        """False in mock mode (no LLM client): nothing to amortize"""
+        return self.judge.client is not None
+
+    async def evaluate_posts(self, posts: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        if not posts:
+            return []
+        loop = asyncio.get_running_loop()
+        futures = [loop.create_future() for _ in posts]
+        self._pending.extend(zip(posts, futures))
+        if len(self._pending) >= settings.DTSS_BATCH_MAX_POSTS * settings.DTSS_BATCH_CONCURRENCY:
+            self.flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.linger, self.flush)
+        return list(await asyncio.gather(*futures))
+
+    def flush(self) -> None:
+        """Send the pending posts now"""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._pending:
+            return
+        batch, self._pending = self._pending, []
+        task = asyncio.get_running_loop().create_task(self._judge(batch))
+        self._flushes.add(task)
+        task.add_done_callback(self._flushes.discard)
+
+    async def _judge(self, batch: List[Tuple[Dict[str, Any], asyncio.Future]]) -> None:
+        try:
+            results = await self.judge.evaluate_posts([post for post, _ in batch])
+        except Exception as e:
+            logger.error(f"AI batch evaluation of {len(batch)} posts failed: {e}")
+            results = [self.judge._failed(e) for _ in batch]
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+
+
 dtss_judge = AIJudge()
+judge_batcher = JudgeBatcher(dtss_judge)
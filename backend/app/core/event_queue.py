@@ -0,0 +1,82 @@
+"""
+Event Queue - Per-event next-check times in a min-heap
+
+Used by the 'priority' scheduler (core/scheduler.py) instead of four tier
+jobs that each reload every scheduled/live event. Every event has exactly
+one due time, computed by slme.next_check_at() after each check, and the
+dispatcher only wakes when the earliest one is due.
+
+Rescheduling or removing an event does not touch the heap: the entry
+stays and is skipped when popped, because its due time no longer
+matches _due (lazy deletion). The heap is compacted when stale entries
+outnumber live ones.
+"""
+
+import heapq
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+
+class EventQueue:
+    """
+    Min-heap of (due_at, event_id).
+
+    Usage:
+        queue.schedule(event_id, due_at)
+        for event_id in queue.pop_due(now, limit=50):
+            ...
+            queue.schedule(event_id, slme.next_check_at(start_time, status))
+    """
+
+    def __init__(self):
+        self._heap: List[Tuple[datetime, str]] = []
+        self._due: Dict[str, datetime] = {}
+
+    def __len__(self) -> int:
+        return len(self._due)
+
+    def __contains__(self, event_id: str) -> bool:
+        return event_id in self._due
+
+    def schedule(self, event_id: str, due_at: datetime) -> None:
+        """Insert or move an event (the latest call wins)"""
+        if self._due.get(event_id) == due_at:
+            return
+        self._due[event_id] = due_at
+        heapq.heappush(self._heap, (due_at, event_id))
+        if len(self._heap) > 2 * len(self._due) + 64:
+            self._compact()
+
+    def remove(self, event_id: str) -> None:
+        self._due.pop(event_id, None)
+
+    def due_at(self, event_id: str) -> Optional[datetime]:
+        return self._due.get(event_id)
+
+    def next_due(self) -> Optional[datetime]:
+        """Earliest due time, or None if the queue is empty"""
+        self._drop_stale_head()
+        return self._heap[0][0] if self._heap else None
+
+    def pop_due(self, now: datetime, limit: int) -> List[str]:
+        """Remove and return up to `limit` event ids due at `now`, earliest first"""
+        due = []
+        while len(due) < limit:
+            self._drop_stale_head()
+            if not self._heap or self._heap[0][0] > now:
+                break
+            _, event_id = heapq.heappop(self._heap)
+            del self._due[event_id]
+            due.append(event_id)
+        return due
+
+    def snapshot(self) -> Dict[str, datetime]:
+        return dict(self._due)
+
+    def _drop_stale_head(self) -> None:
+        while self._heap and self._due.get(self._heap[0][1]) != self._heap[0][0]:
+            heapq.heappop(self._heap)
+
+    def _compact(self) -> None:
+        self._heap = [(due_at, event_id) for event_id, due_at in self._due.items()]
+        heapq.heapify(self._heap)
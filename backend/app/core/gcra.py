@@ -0,0 +1,212 @@
+"""
+GCRA Rate Limiting - One atomic Redis call per request
+
+Generic Cell Rate Algorithm: each key stores a single value, the
+"theoretical arrival time" (TAT). A request is allowed if
+TAT - now <= period - emission_interval, and the TAT then moves forward
+by one emission interval (period / amount). Check-and-update runs in one
+Lua script, so it is atomic across workers.
+
+In front of Redis sits an in-process pre-filter:
+- a token bucket per key with the same rate/burst. If this worker alone
+  has already exceeded the limit, the global limit is exceeded as well,
+  so the request is rejected without a Redis call.
+- the retry-after of the last Redis rejection, so a throttled client is
+  turned away locally until it may retry.
+
+GCRARateLimiter implements the `limits` RateLimiter interface
+(hit / test / get_window_stats / clear), so slowapi uses it as a drop-in
+strategy and keeps producing the X-RateLimit-* headers.
+"""
+
+import logging
+import time
+from collections import OrderedDict
+from typing import Tuple
+
+import redis
+from limits import RateLimitItem
+from limits.util import WindowStats
+
+logger = logging.getLogger(__name__)
+
+# KEYS[1] = TAT key
+# ARGV[1] = emission interval (ms), ARGV[2] = burst (limit amount), ARGV[3] = cost
+# Returns {allowed, remaining, retry_after_ms, reset_after_ms}
+GCRA_SCRIPT = """
+local emission = tonumber(ARGV[1])
+local burst = tonumber(ARGV[2])
+local cost = tonumber(ARGV[3])
+local t = redis.call('TIME')
+local now = tonumber(t[1]) * 1000 + math.floor(tonumber(t[2]) / 1000)
+
+local tat = tonumber(redis.call('GET', KEYS[1]))
+if not tat or tat < now then
+    tat = now
+end
+
+local new_tat = tat + emission * cost
+local allow_at = new_tat - emission * burst
+if allow_at > now then
+    return {0, 0, allow_at - now, tat - now}
+end
+
+redis.call('SET', KEYS[1], new_tat, 'PX', math.ceil(new_tat - now))
+local remaining = math.floor((now - allow_at) / emission)
+return {1, remaining, 0, new_tat - now}
+"""
+
+# Read-only variant for test() / get_window_stats() without a recent hit
+GCRA_PEEK_SCRIPT = """
+local emission = tonumber(ARGV[1])
+local burst = tonumber(ARGV[2])
+local t = redis.call('TIME')
+local now = tonumber(t[1]) * 1000 + math.floor(tonumber(t[2]) / 1000)
+local tat = tonumber(redis.call('GET', KEYS[1]))
+if not tat or tat < now then
+    tat = now
+end
+local remaining = math.floor((now - (tat - emission * burst)) / emission)
+return {remaining, tat - now}
+"""
+
+
+class LocalPreFilter:
+    """
+    Per-worker token buckets plus remembered Redis rejections.
+
+    Bounded to max_keys entries (LRU), so a flood of distinct clients
+    cannot grow memory without limit.
+    """
+
+    def __init__(self, max_keys: int = 10000):
+        self.max_keys = max_keys
+        self._buckets: "OrderedDict[str, Tuple[float, float]]" = OrderedDict()
+        self._blocked_until: "OrderedDict[str, float]" = OrderedDict()
+
+    def blocked_for(self, key: str) -> float:
+        """Seconds until a client rejected by Redis may retry (0 if not blocked)"""
+        until = self._blocked_until.get(key)
+        if until is None:
+            return 0.0
+        remaining = until - time.monotonic()
+        if remaining <= 0:
+            del self._blocked_until[key]
+            return 0.0
+        return remaining
+
+    def block(self, key: str, seconds: float) -> None:
+        self._blocked_until[key] = time.monotonic() + seconds
+        self._blocked_until.move_to_end(key)
+        self._trim(self._blocked_until)
+
+    def consume(self, key: str, rate: float, capacity: int, cost: int = 1) -> Tuple[bool, float]:
+        """
+        Take `cost` tokens from the local bucket.
+
+        Returns:
+            (allowed, seconds until enough tokens are available)
+        """
+        now = time.monotonic()
+        tokens, last = self._buckets.get(key, (float(capacity), now))
+        tokens = min(float(capacity), tokens + (now - last) * rate)
+        if tokens < cost:
+            self._buckets[key] = (tokens, now)
+            self._buckets.move_to_end(key)
+            return False, (cost - tokens) / rate
+        self._buckets[key] = (tokens - cost, now)
+        self._buckets.move_to_end(key)
+        self._trim(self._buckets)
+        return True, 0.0
+
+    def clear(self, key: str) -> None:
+        self._buckets.pop(key, None)
+        self._blocked_until.pop(key, None)
+
+    def _trim(self, data: OrderedDict) -> None:
+        while len(data) > self.max_keys:
+            data.popitem(last=False)
+
+
+class GCRARateLimiter:
+    """
+    `limits`-compatible rate limiter strategy backed by the GCRA Lua script.
+
+    Args:
+        redis_url: Redis connection URL
+        socket_timeout: Per-command timeout in seconds
+        local_max_keys: Bound on tracked keys for the local pre-filter
+    """
+
+    def __init__(self, redis_url: str, socket_timeout: float = 1.0, local_max_keys: int = 10000):
+        self._client = redis.Redis.from_url(
+            redis_url,
+            socket_connect_timeout=2,
+            socket_timeout=socket_timeout
+        )
+        self._gcra = self._client.register_script(GCRA_SCRIPT)
+        self._peek = self._client.register_script(GCRA_PEEK_SCRIPT)
+        self.local = LocalPreFilter(max_keys=local_max_keys)
+        # key -> (reset epoch seconds, remaining) from the latest hit, so header
+        # injection does not cost a second Redis call
+        self._last_stats: "OrderedDict[str, Tuple[float, int]]" = OrderedDict()
+        self._local_max_keys = local_max_keys
+
+    @staticmethod
+    def _params(item: RateLimitItem) -> Tuple[int, int]:
+        """(emission interval in whole ms, burst) - integers keep TAT values exact in Lua"""
+        return max(1, round(item.get_expiry() * 1000 / item.amount)), item.amount
+
+    def hit(self, item: RateLimitItem, *identifiers: str, cost: int = 1) -> bool:
+        key = item.key_for(*identifiers)
+        emission_ms, burst = self._params(item)
+
+        # 1. Local pre-filter (no Redis round trip)
+        blocked = self.local.blocked_for(key)
+        if blocked:
+            self._remember(key, blocked, 0)
+            return False
+        allowed, wait = self.local.consume(key, 1000 / emission_ms, burst, cost)
+        if not allowed:
+            self._remember(key, wait, 0)
+            return False
+
+        # 2. Global decision: one atomic script call
+        allowed, remaining, retry_after_ms, reset_after_ms = self._gcra(
+            keys=[key], args=[emission_ms, burst, cost]
+        )
+        if not allowed:
+            self.local.block(key, retry_after_ms / 1000)
+            self._remember(key, retry_after_ms / 1000, 0)
+            return False
+        self._remember(key, reset_after_ms / 1000, remaining)
+        return True
+
+    def test(self, item: RateLimitItem, *identifiers: str, cost: int = 1) -> bool:
+        key = item.key_for(*identifiers)
+        if self.local.blocked_for(key):
+            return False
+        emission_ms, burst = self._params(item)
+        remaining, _ = self._peek(keys=[key], args=[emission_ms, burst])
+        return remaining >= cost
+
+    def get_window_stats(self, item: RateLimitItem, *identifiers: str) -> WindowStats:
+        key = item.key_for(*identifiers)
+        stats = self._last_stats.get(key)
+        if stats is None or stats[0] < time.time():
+            emission_ms, burst = self._params(item)
+            remaining, reset_after_ms = self._peek(keys=[key], args=[emission_ms, burst])
+            stats = (time.time() + reset_after_ms / 1000, max(0, remaining))
+        return WindowStats(int(stats[0]), stats[1])
+
+    def clear(self, item: RateLimitItem, *identifiers: str) -> None:
+        key = item.key_for(*identifiers)
+        self.local.clear(key)
+        self._last_stats.pop(key, None)
+        self._client.delete(key)
+
+    def _remember(self, key: str, reset_after: float, remaining: int) -> None:
+        self._last_stats[key] = (time.time() + reset_after, remaining)
+        self._last_stats.move_to_end(key)
+        while len(self._last_stats) > self._local_max_keys:
+            self._last_stats.popitem(last=False)
@@ -0,0 +1,236 @@
+"""
+Job Telemetry - Per-run records of scheduler jobs
+
+Every tier job run (and every priority-queue batch) records:
+
+- lag:        seconds between the scheduled and the actual start
+- duration:   wall-clock seconds of the run
+- processed / failed events
+- stages:     busy seconds per stage (scrape, analyze, db), summed over the
+              run's concurrent tasks - compare with duration to see where
+              MAX_CONCURRENT_JOBS slots are spent
+- overlap:    the run outlasted its interval, or started while the previous
+              run of the same job was still going
+- status:     ok, failed (exception) or cancelled (demotion, shutdown)
+
+Records go to a bounded Redis list per job (telemetry:jobs:<job>, newest
+first, SCHEDULER_TELEMETRY_HISTORY entries) and are served by
+GET /admin/scheduler/runs. Runs are counted by status in
+mosport_scheduler_job_runs_total; overlaps are logged as alerts and counted in
+mosport_scheduler_job_overlaps_total. Telemetry never fails a job: without
+Redis only the in-process metrics are kept.
+"""
+
+import asyncio
+import json
+import logging
+import statistics
+import time
+from contextlib import asynccontextmanager, contextmanager
+from datetime import datetime, timezone
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional
+
+from app.core.cache import cache
+from app.core.config import settings
+from app.core.metrics import registry
+from app.core.redis_health import redis_breaker
+
+logger = logging.getLogger(__name__)
+
+# Seconds; job runs range from sub-second (empty tiers) to many minutes
+JOB_BUCKETS = (0.1, 0.5, 1.0, 5.0, 15.0, 30.0, 60.0, 120.0, 300.0, 900.0, 3600.0)
+
+JOB_DURATION = registry.histogram(
+    "mosport_scheduler_job_duration_seconds", "Scheduler job run duration", JOB_BUCKETS
+)
+JOB_LAG = registry.histogram(
+    "mosport_scheduler_job_lag_seconds", "Delay between scheduled and actual job start", JOB_BUCKETS
+)
+JOB_STAGE = registry.histogram(
+    "mosport_scheduler_job_stage_seconds", "Busy time per job stage (scrape, analyze, db)", JOB_BUCKETS
+)
+JOB_EVENTS = registry.counter(
+    "mosport_scheduler_job_events_total", "Events handled by scheduler jobs by outcome (processed, failed)"
+)
+JOB_RUNS = registry.counter(
+    "mosport_scheduler_job_runs_total", "Scheduler job runs by status (ok, failed, cancelled)"
+)
+JOB_OVERLAPS = registry.counter(
+    "mosport_scheduler_job_overlaps_total", "Scheduler job runs that overlapped their own interval"
+)
+
+
+class StageTimer:
+    """Busy seconds per stage, summed over concurrent tasks"""
+
+    def __init__(self):
+        self.seconds: Dict[str, float] = {}
+
+    @contextmanager
+    def track(self, stage: str) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.seconds[stage] = self.seconds.get(stage, 0.0) + time.perf_counter() - started
+
+
+class JobRun:
+    """One run of a job; fields are filled in by the job while it runs"""
+
+    def __init__(self, job: str, interval: Optional[float], scheduled_at: Optional[float]):
+        self.job = job
+        self.interval = interval
+        self.started_at = time.time()
+        self.scheduled_at = scheduled_at
+        self.stages = StageTimer()
+        self.processed = 0
+        self.failed = 0
+        self.status = "ok"
+        self.message = ""
+        self.duration = 0.0
+        self.overlap = False
+
+    @property
+    def success(self) -> bool:
+        return self.status == "ok"
+
+    @property
+    def lag(self) -> Optional[float]:
+        if self.scheduled_at is None:
+            return None
+        return max(0.0, self.started_at - self.scheduled_at)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "job": self.job,
+            "started_at": datetime.fromtimestamp(self.started_at, timezone.utc).isoformat(),
+            "lag": None if self.lag is None else round(self.lag, 3),
+            "duration": round(self.duration, 3),
+            "interval": self.interval,
+            "processed": self.processed,
+            "failed": self.failed,
+            "stages": {stage: round(seconds, 3) for stage, seconds in self.stages.seconds.items()},
+            "overlap": self.overlap,
+            "status": self.status,
+            "success": self.success,
+            "message": self.message[:500],
+        }
+
+
+class JobTelemetry:
+    """
+    Usage:
+        async with job_telemetry.track("tier:HOT", interval=300) as run:
+            result = await processor.process_events_by_tier("HOT")
+            run.processed = result.events_processed
+    """
+
+    def __init__(self, prefix: str = "telemetry:jobs", history: int = settings.SCHEDULER_TELEMETRY_HISTORY):
+        self.prefix = prefix
+        self.history = history
+        self._scheduled: Dict[str, float] = {}
+        self._running: Dict[str, int] = {}
+
+    def scheduled(self, job: str, run_time: datetime) -> None:
+        """Scheduled start of the job's next run (from the scheduler, for lag)"""
+        self._scheduled[job] = run_time.timestamp()
+
+    @asynccontextmanager
+    async def track(
+        self,
+        job: str,
+        interval: Optional[float] = None,
+        scheduled_at: Optional[datetime] = None
+    ) -> AsyncIterator[JobRun]:
+        """Time one run of `job` and store its record when it ends"""
+        planned = self._scheduled.pop(job, None)
+        if scheduled_at is not None:
+            planned = scheduled_at.timestamp()
+        run = JobRun(job, interval, planned)
+        self._running[job] = self._running.get(job, 0) + 1
+        concurrent = self._running[job] > 1
+        started = time.perf_counter()
+        try:
+            yield run
+        except asyncio.CancelledError:
+            run.status = "cancelled"
+            run.message = "cancelled"
+            raise
+        except BaseException as e:
+            run.status = "failed"
+            run.message = str(e) or type(e).__name__
+            raise
+        finally:
+            self._running[job] -= 1
+            run.duration = time.perf_counter() - started
+            run.overlap = concurrent or (interval is not None and run.duration > interval)
+            self._observe(run)
+            await self._store(run)
+
+    async def runs(self, job: Optional[str] = None, limit: int = 50) -> Dict[str, Any]:
+        """Recent runs (newest first) and a summary per job"""
+        redis = cache.redis
+        if redis is None:
+            return {}
+        jobs = [job] if job else sorted(j.decode() for j in await redis.smembers(f"{self.prefix}:index"))
+        report = {}
+        for name in jobs:
+            raw = await redis.lrange(f"{self.prefix}:{name}", 0, max(0, limit - 1))
+            runs = [json.loads(entry) for entry in raw]
+            report[name] = {"summary": self._summary(runs), "runs": runs}
+        return report
+
+    def _observe(self, run: JobRun) -> None:
+        JOB_RUNS.inc(job=run.job, status=run.status)
+        JOB_DURATION.observe(run.duration, job=run.job)
+        if run.lag is not None:
+            JOB_LAG.observe(run.lag, job=run.job)
+        for stage, seconds in run.stages.seconds.items():
+            JOB_STAGE.observe(seconds, job=run.job, stage=stage)
+        JOB_EVENTS.inc(run.processed, job=run.job, outcome="processed")
+        JOB_EVENTS.inc(run.failed, job=run.job, outcome="failed")
+        if run.overlap:
+            JOB_OVERLAPS.inc(job=run.job)
+            logger.warning(
+                f"🚨 Job {run.job} overlapped its interval: ran {run.duration:.1f}s"
+                + (f" (interval {run.interval}s)" if run.interval else "")
+                + " - raise its FREQ_* setting or MAX_CONCURRENT_JOBS"
+            )
+
+    async def _store(self, run: JobRun) -> None:
+        redis = cache.redis
+        if redis is None or not redis_breaker.allow_request():
+            return
+        key = f"{self.prefix}:{run.job}"
+        try:
+            async with redis.pipeline(transaction=False) as pipe:
+                pipe.lpush(key, json.dumps(run.to_dict()))
+                pipe.ltrim(key, 0, self.history - 1)
+                pipe.expire(key, 86400 * 7)
+                pipe.sadd(f"{self.prefix}:index", run.job)
+                await pipe.execute()
+        except Exception as e:
+            logger.warning(f"Could not store telemetry for job {run.job}: {e}")
+
+    @staticmethod
+    def _summary(runs: List[Dict[str, Any]]) -> Dict[str, Any]:
+        if not runs:
+            return {"runs": 0}
+        durations = sorted(r["duration"] for r in runs)
+        lags = [r["lag"] for r in runs if r["lag"] is not None]
+        return {
+            "runs": len(runs),
+            "duration_p50": statistics.median(durations),
+            "duration_max": durations[-1],
+            "lag_p50": statistics.median(lags) if lags else None,
+            "lag_max": max(lags) if lags else None,
+            "processed": sum(r["processed"] for r in runs),
+            "failed": sum(r["failed"] for r in runs),
+            "overlaps": sum(1 for r in runs if r["overlap"]),
+            "errors": sum(1 for r in runs if r.get("status", "ok" if r["success"] else "failed") == "failed"),
+            "cancelled": sum(1 for r in runs if r.get("status") == "cancelled"),
+        }
+
+
+job_telemetry = JobTelemetry()
@@ -0,0 +1,103 @@
+"""
+Judgment Memo - Content-hash cache of LLM post judgments
+
+Venues repost the same promo day after day; judging it again gives the
+same answer at the cost of a full LLM call. Judgments are memoized under
+
+    raw:judgment:<kind>:<prompt version>:<content hash>
+
+- content hash: blake2b of the normalized text (NFKC, case-folded,
+  whitespace collapsed) and the image URL
+- prompt version: fingerprint of the model and prompt, so editing either
+  starts a fresh memo instead of serving stale judgments
+
+Only LLM judgments (AIJudge) are memoized; the local keyword judge is
+cheaper than the Redis lookup.
+
+Entries hold derivative results only and live in the RAW tier (48h,
+Doctrine 1.1), like the posts they were derived from. Lookups are counted
+per kind in mosport_dtss_judgment_memo_total (hit/miss) and summarized by
+GET /admin/dtss/judgment-memo. Without Redis every lookup is a miss and
+the judgment is made as before.
+"""
+
+import hashlib
+import logging
+import re
+import unicodedata
+from typing import Any, Dict, List, Optional
+
+from app.core.cache import cache, CacheTTL
+from app.core.metrics import registry
+
+logger = logging.getLogger(__name__)
+
+JUDGMENT_MEMO = registry.counter(
+    "mosport_dtss_judgment_memo_total", "Memoized LLM judgment lookups by kind and result (hit, miss)"
+)
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def prompt_version(model: str, prompt: str) -> str:
+    """Short fingerprint of a model + prompt pair"""
+    return hashlib.blake2b(f"{model}\0{prompt}".encode(), digest_size=6).hexdigest()
+
+
+def normalize_text(text: str) -> str:
+    return _WHITESPACE.sub(" ", unicodedata.normalize("NFKC", text)).strip().casefold()
+
+
+def content_hash(text: str, image_url: Optional[str] = None) -> str:
+    payload = f"{normalize_text(text)}\0{image_url or ''}"
+    return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
+
+class JudgmentMemo:
+    """
+    Usage:
+        memo_key = judgment_memo.key("judge", version, text, image_url)
+        result = await judgment_memo.get(memo_key, "judge")
+        if result is None:
+            result = await llm_judgment(...)
+            await judgment_memo.set(memo_key, result)
+    """
+
+    def __init__(self, prefix: str = "raw:judgment"):
+        self.prefix = prefix
+
+    def key(self, kind: str, version: str, text: str, image_url: Optional[str] = None) -> str:
+        return f"{self.prefix}:{kind}:{version}:{content_hash(text, image_url)}"
+
+    async def get(self, key: str, kind: str) -> Optional[Dict[str, Any]]:
+        result = await cache.get(key)
+        JUDGMENT_MEMO.inc(kind=kind, result="hit" if result is not None else "miss")
+        return result
+
+    async def get_many(self, keys: List[str], kind: str) -> Dict[str, Dict[str, Any]]:
+        """get() for many keys in one MGET; returns the memoized ones"""
+        found = await cache.get_many(keys)
+        JUDGMENT_MEMO.inc(len(found), kind=kind, result="hit")
+        JUDGMENT_MEMO.inc(len(set(keys)) - len(found), kind=kind, result="miss")
+        return found
+
+    async def set_many(self, results: Dict[str, Dict[str, Any]]) -> None:
+        if results:
+            await cache.set_many(results, ttl=CacheTTL.RAW)
+
+    async def set(self, key: str, result: Dict[str, Any]) -> None:
+        await cache.set(key, result, ttl=CacheTTL.RAW)
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Hits, misses and hit rate per kind for this worker"""
+        kinds: Dict[str, Dict[str, Any]] = {}
+        for labels, value in JUDGMENT_MEMO.samples():
+            entry = kinds.setdefault(labels["kind"], {"hit": 0, "miss": 0})
+            entry[labels["result"]] += int(value)
+        for entry in kinds.values():
+            lookups = entry["hit"] + entry["miss"]
+            entry["hit_rate"] = round(entry["hit"] / lookups, 4) if lookups else None
+        return kinds
+
+
+judgment_memo = JudgmentMemo()
@@ -0,0 +1,265 @@
+"""
+Leader Election - Redis lease so one process runs background jobs
+
+Every API worker runs the lifespan hook, so without coordination each of
+N workers would run its own scheduler (N x scrapes, LLM calls, DB writes).
+Workers compete for a lease key instead:
+
+- acquire: SET scheduler:leader <token> NX PX <ttl>
+- renew:   every ttl/3, extend the lease only if we still own it (Lua)
+- release: on shutdown, delete it only if we still own it (Lua)
+
+Followers retry the acquire at the same interval, so a crashed leader is
+replaced within SCHEDULER_LEASE_TTL + ttl/3 seconds; a clean shutdown
+releases the lease and hands over within ttl/3.
+
+A leader steps down before a follower can take its lease over: when a
+renewal fails and the lease would lapse before the next attempt, and in
+any case at the lease deadline (a timer, so a renewal stuck on the Redis
+socket timeout cannot stretch the term). Demotion cancels the jobs still
+running, so two leaders never run jobs at the same time.
+
+If Redis cannot be reached when the elector starts, the process leads
+locally (SCHEDULER_LEADER_LOCAL_FALLBACK, logged as an error) so a
+deployment without Redis still runs its jobs - once per worker. It keeps
+trying to acquire the lease and steps down if another worker holds it
+once Redis is up. Redis going down after it was reached demotes the
+leader as above: nobody leads until it is back.
+"""
+
+import asyncio
+import logging
+import time
+import uuid
+from typing import Any, Callable, List, Optional, Tuple
+
+import redis.asyncio as redis
+
+from app.core.cache import RELEASE_LOCK_SCRIPT
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+RENEW_LEASE_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('pexpire', KEYS[1], ARGV[2])
+end
+return 0
+"""
+
+
+class LeaderElector:
+    """
+    Lease-based leader election with renewal.
+
+    Args:
+        key: Redis key holding the leader's token
+        lease_ttl: Lease lifetime in seconds
+        on_elected: Called when this process becomes leader
+        on_demoted: Called when this process loses leadership
+    """
+
+    def __init__(
+        self,
+        key: str,
+        lease_ttl: float,
+        on_elected: Callable[[], None],
+        on_demoted: Callable[[], None]
+    ):
+        self.key = key
+        self.lease_ttl = lease_ttl
+        self.renew_interval = lease_ttl / 3
+        self.token = uuid.uuid4().hex
+        self.is_leader = False
+        self.local = False  # Leading without a lease (Redis unreachable since start)
+        self._redis_seen = False
+        self._on_elected = on_elected
+        self._on_demoted = on_demoted
+        self._lease_valid_until = 0.0
+        self._deadline: Optional[asyncio.TimerHandle] = None
+        self._task: Optional[asyncio.Task] = None
+        self._client: Optional[redis.Redis] = None
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    def stop(self) -> None:
+        """Stop campaigning; the lease is released by the cancelled task"""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    def status(self) -> dict:
+        return {"leader": self.is_leader, "local": self.local, "token": self.token, "lease_ttl": self.lease_ttl}
+
+    def _connect(self) -> redis.Redis:
+        return redis.from_url(
+            settings.REDIS_URL,
+            socket_connect_timeout=2,
+            socket_timeout=settings.REDIS_SOCKET_TIMEOUT
+        )
+
+    async def _run(self) -> None:
+        # One client per run: it is closed on the way out, start() needs a new one
+        self._client = self._connect()
+        try:
+            while True:
+                await self._tick()
+                await asyncio.sleep(self.renew_interval)
+        except asyncio.CancelledError:
+            await self._release()
+            raise
+        finally:
+            client, self._client = self._client, None
+            await client.aclose()
+
+    async def _tick(self) -> None:
+        started = time.monotonic()
+        try:
+            if self.is_leader and not self.local:
+                held = await self._client.eval(
+                    RENEW_LEASE_SCRIPT, 1, self.key, self.token, int(self.lease_ttl * 1000)
+                )
+            else:
+                held = await self._client.set(
+                    self.key, self.token, nx=True, px=int(self.lease_ttl * 1000)
+                )
+        except Exception as e:
+            if self.local:
+                return  # Still no Redis: keep leading locally
+            if not self._redis_seen and not self.is_leader and settings.SCHEDULER_LEADER_LOCAL_FALLBACK:
+                self._lead_locally(e)
+                return
+            logger.warning(f"Leader lease {'renewal' if self.is_leader else 'acquire'} failed: {e}")
+            # The next attempt would come too late: the lease may lapse before it
+            if self.is_leader and time.monotonic() + self.renew_interval >= self._lease_valid_until:
+                self._demote("lease could not be renewed")
+            return
+
+        self._redis_seen = True
+        if held:
+            # Measured from before the call: the lease may have started earlier
+            self._lease_valid_until = started + self.lease_ttl
+            self._arm_deadline()
+            if self.local:
+                self.local = False
+                logger.info(f"👑 Redis reachable: local leadership now holds the lease ({self.key})")
+            elif not self.is_leader:
+                self.is_leader = True
+                logger.info(f"👑 Acquired leadership ({self.key})")
+                self._notify(self._on_elected)
+        elif self.is_leader:
+            self._demote("lease taken over")
+
+    def _lead_locally(self, error: Exception) -> None:
+        self.is_leader = True
+        self.local = True
+        logger.error(
+            f"🚨 Redis unreachable ({error}): leading locally without a lease ({self.key}). "
+            f"Every worker in this state runs the scheduler; set SCHEDULER_LEADER_ELECTION=False "
+            f"for single-process deployments without Redis"
+        )
+        self._notify(self._on_elected)
+
+    def _arm_deadline(self) -> None:
+        """Step down at the lease deadline unless a renewal moves it first"""
+        if self._deadline is not None:
+            self._deadline.cancel()
+        delay = max(0.0, self._lease_valid_until - time.monotonic())
+        self._deadline = asyncio.get_running_loop().call_later(delay, self._on_deadline)
+
+    def _on_deadline(self) -> None:
+        self._deadline = None
+        if self.is_leader and time.monotonic() >= self._lease_valid_until:
+            self._demote("lease expired before it was renewed")
+
+    def _demote(self, reason: str) -> None:
+        if self._deadline is not None:
+            self._deadline.cancel()
+            self._deadline = None
+        self.is_leader = False
+        self.local = False
+        logger.warning(f"⚠️ Lost leadership ({self.key}): {reason}")
+        self._notify(self._on_demoted)
+
+    def _notify(self, callback: Callable[[], None]) -> None:
+        try:
+            callback()
+        except Exception as e:
+            logger.error(f"Leader election callback failed: {e}")
+
+    async def _release(self) -> None:
+        if self._deadline is not None:
+            self._deadline.cancel()
+            self._deadline = None
+        if not self.is_leader:
+            return
+        local, self.is_leader, self.local = self.local, False, False
+        self._notify(self._on_demoted)
+        if local:
+            return  # No lease to release
+        try:
+            await self._client.eval(RELEASE_LOCK_SCRIPT, 1, self.key, self.token)
+            logger.info(f"Released leadership ({self.key})")
+        except Exception as e:
+            logger.warning(f"Leader lease release failed: {e}")
+
+
+class LeaderElectedScheduler:
+    """
+    TaskScheduler wrapper that only runs the real scheduler while leader.
+
+    A fresh scheduler is built from `factory` for every leadership term
+    (APScheduler instances are not meant to be restarted), and jobs added
+    through add_job() are replayed onto it. On demotion the scheduler is
+    shut down and its running jobs are cancelled.
+    """
+
+    def __init__(self, factory: Callable[[], Any], key: str = "scheduler:leader"):
+        self._factory = factory
+        self._inner: Optional[Any] = None
+        self._custom_jobs: List[Tuple[Any, Any, dict]] = []
+        self.elector = LeaderElector(
+            key,
+            lease_ttl=settings.SCHEDULER_LEASE_TTL,
+            on_elected=self._start_inner,
+            on_demoted=self._stop_inner
+        )
+
+    @property
+    def is_leader(self) -> bool:
+        return self.elector.is_leader
+
+    def start(self) -> None:
+        logger.info(
+            f"🗳️ Scheduler leader election started (lease {settings.SCHEDULER_LEASE_TTL}s, "
+            f"worker token {self.elector.token[:8]})"
+        )
+        self.elector.start()
+
+    def shutdown(self) -> None:
+        self.elector.stop()
+        self._stop_inner()
+
+    def add_job(self, func: Any, trigger: Any, **kwargs: Any) -> None:
+        self._custom_jobs.append((func, trigger, kwargs))
+        if self._inner is not None:
+            self._inner.add_job(func, trigger, **kwargs)
+
+    def _start_inner(self) -> None:
+        if self._inner is not None:
+            return
+        self._inner = self._factory()
+        for func, trigger, kwargs in self._custom_jobs:
+            self._inner.add_job(func, trigger, **kwargs)
+        self._inner.start()
+
+    def _stop_inner(self) -> None:
+        if self._inner is None:
+            return
+        inner, self._inner = self._inner, None
+        try:
+            inner.shutdown()
+        except Exception as e:
+            logger.error(f"Error stopping scheduler after demotion: {e}")
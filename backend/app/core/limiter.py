@@ -13,17 +13,32 @@ Rate Limits per Role:
 - VENUES: 100 req/min (moderate limits)
 - STAFF: No limit (internal debugging)
 - Guest (unauthenticated): 30 req/min (strictest)
+
+Storage: GCRA via one atomic Lua call per request, with an in-process
+pre-filter (core/gcra.py). Set RATE_LIMIT_STRATEGY to a slowapi strategy
+name to fall back to slowapi's own storage strategies.
+
+Degraded mode: while the shared Redis circuit breaker (core/redis_health.py)
+is open, limits are enforced from slowapi's in-memory fallback storage.
+When slowapi itself marks the storage dead, the fallback limits are still
+the role limits above (per worker), not a flat default.
 """
 
 from slowapi import Limiter
 from slowapi.util import get_remote_address
 from app.core.config import settings
+from app.core.gcra import GCRARateLimiter
+from app.core.redis_health import redis_breaker
 from starlette.requests import Request
 from typing import Callable
+from contextvars import ContextVar
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Breaker state for the request being checked (never shared across requests)
+_breaker_open: ContextVar[bool] = ContextVar("rate_limit_breaker_open", default=False)
+
 # Role-based rate limits (Constitutional: Section 4)
 RATE_LIMITS = {
     "fan": "60/minute",      # FANS: Strict limit per Constitution
@@ -79,12 +94,97 @@ def get_limit_for_role(request: Request) -> str:
     return limit
 
 
+def get_limit_for_key(key: str) -> str:
+    """
+    Dynamic limit provider in the form slowapi calls it (with the rate-limit key).
+
+    The key produced by get_user_key ends with the role ("192.168.1.1:fan").
+    """
+    user_role = key.rsplit(":", 1)[-1]
+    return RATE_LIMITS.get(user_role.lower(), RATE_LIMITS["guest"])
+
+
+class CircuitBreakerLimiter(Limiter):
+    """
+    slowapi Limiter driven by the shared Redis circuit breaker.
+
+    While the breaker is open, requests are counted in slowapi's in-memory
+    fallback storage instead of waiting on Redis: the breaker state is kept
+    per request (context variable) and only selects the limiter, so
+    slowapi's own storage-failure detection (_storage_dead) is left alone.
+    Rate-limit headers are read from the same limiter. Storage errors
+    slowapi detects are reported back to the breaker.
+
+    With RATE_LIMIT_STRATEGY='gcra' the Redis strategy is replaced by
+    GCRARateLimiter; slowapi still builds keys and X-RateLimit-* headers.
+    """
+
+    def __init__(self, *args, **kwargs):
+        gcra = settings.RATE_LIMIT_STRATEGY.lower() == "gcra"
+        if not gcra:
+            kwargs.setdefault("strategy", settings.RATE_LIMIT_STRATEGY)
+        super().__init__(*args, **kwargs)
+        if gcra:
+            self._limiter = GCRARateLimiter(
+                settings.REDIS_URL,
+                socket_timeout=settings.REDIS_SOCKET_TIMEOUT,
+                local_max_keys=settings.RATE_LIMIT_LOCAL_MAX_KEYS
+            )
+
+    @property
+    def limiter(self):
+        if _breaker_open.get() and self._fallback_limiter is not None:
+            return self._fallback_limiter
+        return super().limiter
+
+    def _inject_headers(self, *args, **kwargs):
+        # X-RateLimit-* come from the limiter that counted the request
+        token = _breaker_open.set(redis_breaker.is_open)
+        try:
+            return super()._inject_headers(*args, **kwargs)
+        finally:
+            _breaker_open.reset(token)
+
+    def _inject_asgi_headers(self, *args, **kwargs):
+        token = _breaker_open.set(redis_breaker.is_open)
+        try:
+            return super()._inject_asgi_headers(*args, **kwargs)
+        finally:
+            _breaker_open.reset(token)
+
+    def _check_request_limit(self, request: Request, *args, **kwargs) -> None:
+        breaker_open = not redis_breaker.allow_request()
+        token = _breaker_open.set(breaker_open)
+        storage_was_dead = self._storage_dead
+        # get_limit_for_key needs the request to build the key; slowapi only
+        # binds it for route limits. Checks are synchronous, so this is per request.
+        for group in self._in_memory_fallback:
+            group.with_request(request)
+        try:
+            super()._check_request_limit(request, *args, **kwargs)
+        finally:
+            _breaker_open.reset(token)
+            # Only requests that actually went to Redis report its health
+            if not breaker_open and not storage_was_dead:
+                if self._storage_dead:
+                    redis_breaker.record_failure()
+                else:
+                    redis_breaker.record_success()
+
+
 # Initialize Limiter with role-based key function
-limiter = Limiter(
+limiter = CircuitBreakerLimiter(
     key_func=get_user_key,
     storage_uri=settings.REDIS_URL,
+    storage_options={
+        "socket_connect_timeout": 2,
+        "socket_timeout": settings.REDIS_SOCKET_TIMEOUT
+    },
     default_limits=["100/minute"],  # Fallback if role detection fails
-    headers_enabled=True  # Add X-RateLimit-* headers to responses
+    headers_enabled=True,  # Add X-RateLimit-* headers to responses
+    in_memory_fallback_enabled=True,  # Bounded local counting while Redis is down
+    in_memory_fallback=[get_limit_for_key],  # Role limits, counted per worker
+    swallow_errors=True  # Never turn a limiter failure into a 500
 )
 
 
@@ -104,5 +204,8 @@ def role_based_limit() -> Callable:
     - 100/min for VENUES
     - Unlimited for STAFF
     - 30/min for guests
+
+    Note: endpoints must accept a `response: Response` parameter so slowapi
+    can attach the X-RateLimit-* headers.
     """
-    return get_limit_for_role
+    return get_limit_for_key
@@ -0,0 +1,144 @@
+"""
+Redis Health - Shared circuit breaker for Redis-backed components
+
+Used by CacheService and the rate limiter. After
+REDIS_BREAKER_FAILURE_THRESHOLD consecutive errors the breaker opens and
+callers fail fast into their in-memory fallbacks instead of waiting on
+socket timeouts. While open, a background task pings Redis every
+REDIS_BREAKER_PROBE_INTERVAL seconds and closes the breaker once it answers.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Callable, List, Optional
+
+import redis.asyncio as redis
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitState:
+    CLOSED = "closed"  # Redis healthy, requests go through
+    OPEN = "open"      # Redis failing, callers use their fallback
+
+
+class RedisCircuitBreaker:
+    """
+    Consecutive-failure circuit breaker with background recovery probing.
+
+    Usage:
+        if not redis_breaker.allow_request():
+            return fallback()
+        try:
+            result = await client.get(key)
+            redis_breaker.record_success()
+        except Exception:
+            redis_breaker.record_failure()
+    """
+
+    def __init__(self, failure_threshold: int, probe_interval: float):
+        self.failure_threshold = failure_threshold
+        self.probe_interval = probe_interval
+        self.state = CircuitState.CLOSED
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self._probe_task: Optional[asyncio.Task] = None
+        self._listeners: List[Callable[[str], None]] = []
+
+    def allow_request(self) -> bool:
+        if self.state == CircuitState.OPEN:
+            self._ensure_probe()
+            return False
+        return True
+
+    @property
+    def is_open(self) -> bool:
+        return self.state == CircuitState.OPEN
+
+    def record_success(self) -> None:
+        self.failures = 0
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        if self.state == CircuitState.CLOSED and self.failures >= self.failure_threshold:
+            self._open()
+
+    def add_listener(self, callback: Callable[[str], None]) -> None:
+        """Register a callback invoked with the new state on every transition"""
+        self._listeners.append(callback)
+
+    def status(self) -> dict:
+        return {
+            "state": self.state,
+            "consecutive_failures": self.failures,
+            "open_for_seconds": round(time.monotonic() - self.opened_at, 1) if self.opened_at else 0,
+        }
+
+    async def close(self) -> None:
+        """Stop the recovery probe (application shutdown)"""
+        if self._probe_task is not None:
+            self._probe_task.cancel()
+            try:
+                await self._probe_task
+            except asyncio.CancelledError:
+                pass
+            self._probe_task = None
+
+    def _open(self) -> None:
+        self.state = CircuitState.OPEN
+        self.opened_at = time.monotonic()
+        logger.warning(
+            f"⚠️ Redis circuit OPEN after {self.failures} consecutive failures - "
+            "using in-memory fallbacks"
+        )
+        self._notify()
+        self._ensure_probe()
+
+    def _ensure_probe(self) -> None:
+        if self._probe_task is not None and not self._probe_task.done():
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return  # Outside the event loop; started by the next async caller
+        self._probe_task = loop.create_task(self._probe())
+
+    def _close(self) -> None:
+        self.state = CircuitState.CLOSED
+        self.failures = 0
+        self.opened_at = None
+        logger.info("✅ Redis circuit CLOSED - Redis reachable again")
+        self._notify()
+
+    def _notify(self) -> None:
+        for callback in self._listeners:
+            try:
+                callback(self.state)
+            except Exception as e:
+                logger.error(f"Circuit breaker listener failed: {e}")
+
+    async def _probe(self) -> None:
+        client = redis.from_url(
+            settings.REDIS_URL,
+            socket_connect_timeout=settings.REDIS_SOCKET_TIMEOUT,
+            socket_timeout=settings.REDIS_SOCKET_TIMEOUT
+        )
+        try:
+            while self.state == CircuitState.OPEN:
+                await asyncio.sleep(self.probe_interval)
+                try:
+                    await client.ping()
+                    self._close()
+                except Exception as e:
+                    logger.debug(f"Redis probe failed: {e}")
+        finally:
+            await client.aclose()
+
+
+redis_breaker = RedisCircuitBreaker(
+    failure_threshold=settings.REDIS_BREAKER_FAILURE_THRESHOLD,
+    probe_interval=settings.REDIS_BREAKER_PROBE_INTERVAL
+)
@@ -0,0 +1,146 @@
+"""
+Response Cache - Endpoint-level caching with tag-based invalidation
+
+Built on CacheService.get_or_compute (single-flight + early refresh).
+Responses are keyed by endpoint namespace + normalized query params, and
+carry dependency tags. Writers call invalidate_tags() after changing data.
+
+Tags are hierarchical, separated by ':':
+- invalidate_tags("events") drops everything tagged "events" or "events:..."
+- invalidate_tags("events:sport=football") drops entries tagged with that
+  tag, plus entries tagged "events" (aggregates over all events), but not
+  entries tagged "events:sport=baseball"
+
+Invalidation does not delete entries. Each tag has a version token that
+is part of the response key. Bumping the token makes old entries
+unreachable, and they expire through their TTL.
+"""
+
+import functools
+import hashlib
+import logging
+import uuid
+from typing import Any, Callable, Dict, Iterable, List, Optional, Union
+
+from app.core.cache import cache, CacheTTL
+
+logger = logging.getLogger(__name__)
+
+TagSpec = Union[Iterable[str], Callable[[Dict[str, Any]], Iterable[str]]]
+
+_PRIMITIVES = (str, int, float, bool)
+
+
+def _ancestors(tag: str) -> List[str]:
+    parts = tag.split(":")
+    return [":".join(parts[:i]) for i in range(1, len(parts))]
+
+
+def _version_key(tag: str) -> str:
+    return f"tag:v:{tag}"
+
+
+def _scope_key(tag: str) -> str:
+    return f"tag:scope:{tag}"
+
+
+def _dependency_keys(tag: str) -> List[str]:
+    """Version keys an entry tagged `tag` depends on"""
+    return [_version_key(tag)] + [_scope_key(a) for a in _ancestors(tag)]
+
+
+def _digest(value: str) -> str:
+    return hashlib.blake2b(value.encode("utf-8"), digest_size=8).hexdigest()
+
+
+def normalize_params(params: Dict[str, Any], precision: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Keep only query-like values (primitives / lists of primitives), drop
+    None, strip strings and optionally round floats (e.g. coordinates).
+    """
+    normalized = {}
+    for name, value in sorted(params.items()):
+        if value is None:
+            continue
+        if isinstance(value, (list, tuple)) and all(isinstance(v, _PRIMITIVES) for v in value):
+            normalized[name] = sorted(str(v) for v in value)
+        elif isinstance(value, str):
+            normalized[name] = value.strip()
+        elif isinstance(value, float) and precision is not None:
+            normalized[name] = round(value, precision)
+        elif isinstance(value, _PRIMITIVES):
+            normalized[name] = value
+    return normalized
+
+
+# Venue QoE scores change on every HOT cycle. Deliberately a root tag, not
+# "venues:qoe": invalidating a child also drops entries tagged with its
+# ancestors, and venue lists/counts ("venues") do not depend on QoE.
+QOE_TAG = "qoe"
+
+
+def events_tag(sport: Optional[str] = None) -> str:
+    """Tag for event data, optionally scoped to one sport ("events:sport=baseball")"""
+    if not sport:
+        return "events"
+    return f"events:sport={sport.strip().lower()}"
+
+
+async def invalidate_tags(*tags: str) -> None:
+    """
+    Invalidate all cached responses depending on the given tags.
+
+    Example:
+        await invalidate_tags("venues")
+        await invalidate_tags("events:sport=baseball")
+    """
+    keys = set()
+    for tag in tags:
+        keys.add(_version_key(tag))
+        keys.add(_scope_key(tag))
+        keys.update(_version_key(a) for a in _ancestors(tag))
+    if not keys:
+        return
+    token = uuid.uuid4().hex
+    # Version tokens must outlive every response that embeds them
+    await cache.set_many({key: token for key in keys}, ttl=CacheTTL.STATIC)
+    logger.info(f"Invalidated response cache tags: {', '.join(sorted(tags))}")
+
+
+def cached_response(
+    namespace: str,
+    tags: TagSpec,
+    ttl: int = CacheTTL.SESSION,
+    precision: Optional[int] = None
+) -> Callable:
+    """
+    Cache a read endpoint's (JSON-serializable) response.
+
+    Args:
+        namespace: Endpoint identifier used in the key, e.g. "cities"
+        tags: Dependency tags, or a callable receiving the normalized params
+        ttl: Upper bound on staleness if an invalidation is ever missed
+        precision: Round float params to this many decimals (improves hit
+            rate for coordinates when exact distances are not returned)
+
+    Usage:
+        @cached_response("cities", tags=["venues"], ttl=CacheTTL.STATIC)
+        async def list_cities(db: AsyncSession) -> List[dict]:
+            ...  # Location-independent; per-user distances are added after the lookup
+    """
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            params = normalize_params(kwargs, precision)
+            entry_tags = tags(params) if callable(tags) else tags
+
+            dependency_keys = sorted({k for tag in entry_tags for k in _dependency_keys(tag)})
+            versions = await cache.get_many(dependency_keys)
+            signature = ",".join(f"{k}={versions.get(k, 0)}" for k in dependency_keys)
+
+            key = f"resp:{namespace}:{_digest(repr(params))}:{_digest(signature)}"
+            return await cache.get_or_compute(key, lambda: func(*args, **kwargs), ttl=ttl)
+
+        return wrapper
+
+    return decorator
@@ -10,17 +10,48 @@ Future-Proof: Protocol-based design allows Celery swap with minimal changes
 ---
 """
 
+import asyncio
+import functools
+import inspect
 import logging
-from typing import Protocol, Any, runtime_checkable
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Protocol, Any, Dict, List, Optional, Set, runtime_checkable
+from apscheduler.events import EVENT_JOB_SUBMITTED, JobSubmissionEvent
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.interval import IntervalTrigger
+from sqlalchemy.future import select
 
+from app.core.adaptive_slme import adaptive_slme
+from app.core.cache import cache
 from app.core.config import settings
+from app.core.event_queue import EventQueue
+from app.core.job_telemetry import job_telemetry, JobRun
+from app.core.leader import LeaderElectedScheduler
+from app.core.slme import slme, SlotWindow
+from app.core.work_queue import work_queue, TASK_VERIFY_EVENTS
 from app.db.session import AsyncSessionLocal
+from app.models.models import Event
 from app.services.event_processor import EventProcessor
 
 logger = logging.getLogger(__name__)
 
+# Events the scheduler keeps checking
+ACTIVE_STATUSES = ("scheduled", "live")
+
+# Tier job cadence (APScheduler)
+TIER_FREQUENCIES = {
+    "HOT": settings.FREQ_HOT,
+    "WARM": settings.FREQ_WARM,
+    "COOL": settings.FREQ_COOL,
+    "COLD": settings.FREQ_COLD,
+}
+
+# End of the slot window each tier job covered last. Kept in Redis too, so
+# a new leader (failover, restart) resumes where the previous one stopped
+_tier_slots_until: Dict[str, datetime] = {}
+TIER_SLOTS_KEY = "scheduler:tier_slots:{tier}"
+
 
 # --- Protocol Definition (Abstract Interface) ---
 @runtime_checkable
@@ -37,7 +68,7 @@ class TaskScheduler(Protocol):
         ...
     
     def shutdown(self) -> None:
-        """Gracefully stop the scheduler"""
+        """Stop the scheduler and cancel the jobs still running"""
         ...
     
     def add_job(self, func: Any, trigger: Any, **kwargs: Any) -> None:
@@ -57,17 +88,182 @@ async def run_tier_job(tier: str) -> None:
     4. Handle cleanup
     
     This wrapper allows the scheduler to remain stateless.
+    
+    With work spreading, the job fires SCHEDULER_TIER_SLICES times per tier
+    interval and takes only the events whose slot came up since its last run.
+
+    Each run is recorded by job_telemetry (lag, duration, events, stage
+    timings, overlap alerts; GET /admin/scheduler/runs).
     """
     logger.info(f"⏰ Scheduler triggered: {tier} tier job")
+    slots = await tier_slot_window(tier)
+    
+    # Overlap = a run outlasting the tier interval, not one slice of it
+    async with job_telemetry.track(tier_job_id(tier), interval=TIER_FREQUENCIES[tier]) as run:
+        async with AsyncSessionLocal() as session:
+            processor = EventProcessor(session, stages=run.stages)
+            if queue_execution():
+                total = count = 0
+                async for events in processor.iter_events_by_tier(tier, slots=slots):
+                    total += len(events)
+                    count += await enqueue_events([str(event.id) for event in events])
+                run.processed = total
+                run.message = f"Enqueued {total} events in {count} tasks"
+                logger.info(f"📤 {tier} job enqueued {total} events in {count} tasks")
+                return
+            result = await processor.process_events_by_tier(tier, slots)
+            run.processed = result.events_processed
+            run.failed = result.events_failed
+            run.status = "ok" if result.success else "failed"
+            run.message = result.message
+            
+            if result.success:
+                logger.info(f"✅ {tier} job completed: {result.message}")
+            else:
+                logger.error(f"❌ {tier} job failed: {result.message}")
+
+
+def tier_job_id(tier: str) -> str:
+    return f"job_{tier.lower()}_tier"
+
+
+def tier_slices() -> int:
+    """Tier job runs per tier interval (1 = no work spreading)"""
+    if settings.SCHEDULER_SPREAD <= 0:
+        return 1
+    return max(1, settings.SCHEDULER_TIER_SLICES)
+
+
+async def tier_slot_window(tier: str) -> Optional[SlotWindow]:
+    """
+    Slots a tier job run is responsible for: since the previous run of the
+    tier job on any process (Redis), at most one full period back.
+
+    Without any record (first start, Redis down), the window reaches a full
+    period back: events whose slots fell into a gap (restart, leader
+    failover) are checked now instead of a period later, at the cost of
+    checking some events twice.
+    """
+    slices = tier_slices()
+    if slices == 1:
+        return None
+    period = TIER_FREQUENCIES[tier]
+    now = datetime.now(timezone.utc)
+    earliest = now - timedelta(seconds=period)
+    key = TIER_SLOTS_KEY.format(tier=tier)
+    
+    # The later record wins: another leader may have run since this process did
+    stored = await cache.get(key)
+    covered = [t for t in (_tier_slots_until.get(tier), stored and datetime.fromisoformat(stored)) if t]
+    start = max(covered + [earliest])
+    
+    _tier_slots_until[tier] = now
+    await cache.set(key, now.isoformat(), ttl=period * 2)
+    return SlotWindow(period, start, now, settings.SCHEDULER_SPREAD)
+
+
+def queue_execution() -> bool:
+    return settings.SCHEDULER_EXECUTION.lower() == "queue"
+
+
+async def enqueue_events(event_ids: List[str]) -> int:
+    """Hand events to `python -m app.worker` in WORK_QUEUE_TASK_SIZE chunks"""
+    size = settings.WORK_QUEUE_TASK_SIZE
+    payloads = [{"event_ids": event_ids[i:i + size]} for i in range(0, len(event_ids), size)]
+    return await work_queue.enqueue_many(TASK_VERIFY_EVENTS, payloads)
+
+
+async def dispatch_event_job(event_ids: List[str], run: Optional[JobRun] = None) -> Dict[str, Optional[datetime]]:
+    """
+    Run due events inline, or enqueue them for the worker.
+    
+    In queue mode the next check is computed from the current row
+    (id/start_time/status only); changes the worker makes are picked up
+    when the event is next due.
+    """
+    if not queue_execution():
+        return await run_event_job(event_ids, run)
+    
+    async with AsyncSessionLocal() as session:
+        result = await session.execute(
+            select(Event.id, Event.start_time, Event.status)
+            .where(Event.id.in_([uuid.UUID(i) for i in event_ids]))
+        )
+        rows = result.all()
+    
+    active = [row for row in rows if row.status in ACTIVE_STATUSES and row.start_time is not None]
+    await enqueue_events([str(row.id) for row in active])
+    if run is not None:
+        run.processed = len(active)
+    
+    # Adaptive intervals as of the last completed check
+    intervals = await adaptive_intervals([str(row.id) for row in active])
+    now = datetime.now(timezone.utc)
+    next_checks: Dict[str, Optional[datetime]] = dict.fromkeys(event_ids)
+    for row in active:
+        event_id = str(row.id)
+        next_checks[event_id] = slme.next_check_at(
+            row.start_time, row.status, now, intervals.get(event_id), event_id
+        )
+    return next_checks
+
+
+async def adaptive_intervals(event_ids: List[str]) -> Dict[str, int]:
+    """Stored adaptive SLME intervals (empty unless SLME_ADAPTIVE)"""
+    if not adaptive_slme.enabled():
+        return {}
+    cadences = await adaptive_slme.load(event_ids)
+    return {event_id: cadence.interval for event_id, cadence in cadences.items()}
+
+
+async def run_event_job(event_ids: List[str], run: Optional[JobRun] = None) -> Dict[str, Optional[datetime]]:
+    """
+    Process specific events, each at its current SLME tier.
+    
+    Statuses are re-checked here, not where the events were picked: a
+    queued task can outlive its event (finished, cancelled by an override),
+    and inactive events are dropped instead of verified.
     
+    Args:
+        run: Telemetry record to fill in (events, stage timings)
+    
+    Returns:
+        event_id -> next check time (None once the event is no longer
+        scheduled/live or no longer exists)
+    """
     async with AsyncSessionLocal() as session:
-        processor = EventProcessor(session)
-        result = await processor.process_events_by_tier(tier)
+        result = await session.execute(
+            select(Event).where(Event.id.in_([uuid.UUID(i) for i in event_ids]))
+        )
+        events = [
+            event for event in result.scalars().all()
+            if event.status in ACTIVE_STATUSES and event.start_time is not None
+        ]
+        dropped = len(event_ids) - len(events)
+        if dropped:
+            logger.info(f"⏭️ Dropped {dropped}/{len(event_ids)} events no longer active (or deleted)")
+        if not events:
+            return dict.fromkeys(event_ids)
+        
+        processor = EventProcessor(session, stages=run.stages if run else None)
+        outcome = await processor.process_events(events)
+        if outcome.success:
+            logger.info(f"✅ Event queue batch: {outcome.message}")
+        if run is not None:
+            run.processed = outcome.events_processed
+            run.failed = outcome.events_failed
+            run.message = outcome.message
         
-        if result.success:
-            logger.info(f"✅ {tier} job completed: {result.message}")
-        else:
-            logger.error(f"❌ {tier} job failed: {result.message}")
+        # Statuses reflect this run (e.g. cancelled by an override alert)
+        now = datetime.now(timezone.utc)
+        next_checks: Dict[str, Optional[datetime]] = dict.fromkeys(event_ids)
+        for event in events:
+            if event.status in ACTIVE_STATUSES and event.start_time is not None:
+                cadence = processor.cadences.get(str(event.id))
+                next_checks[str(event.id)] = slme.next_check_at(
+                    event.start_time, event.status, now, cadence.interval if cadence else None, str(event.id)
+                )
+        return next_checks
 
 
 # --- APScheduler Implementation ---
@@ -89,6 +285,10 @@ class APSchedulerAdapter:
                 'max_instances': settings.MAX_CONCURRENT_JOBS
             }
         )
+        # Scheduled run times feed the start lag in job telemetry
+        self._scheduler.add_listener(self._on_job_submitted, EVENT_JOB_SUBMITTED)
+        # Running job coroutines, cancelled on shutdown (e.g. after losing leadership)
+        self._running_jobs: Set[asyncio.Task] = set()
     
     def start(self) -> None:
         """Start the scheduler and register SLME-based jobs"""
@@ -98,14 +298,40 @@ class APSchedulerAdapter:
         logger.info("✅ APScheduler is now running")
     
     def shutdown(self) -> None:
-        """Gracefully shut down the scheduler"""
+        """Stop scheduling and cancel the jobs that are still running"""
         logger.info("🛑 Shutting down APScheduler...")
-        self._scheduler.shutdown(wait=True)
+        self._scheduler.shutdown(wait=False)
+        running, self._running_jobs = self._running_jobs, set()
+        for task in running:
+            task.cancel()
+        if running:
+            logger.warning(f"🛑 Cancelled {len(running)} running scheduler jobs")
         logger.info("✅ APScheduler stopped")
     
     def add_job(self, func: Any, trigger: Any, **kwargs: Any) -> None:
         """Add a custom job (for future extensibility)"""
-        self._scheduler.add_job(func, trigger, **kwargs)
+        self._scheduler.add_job(self._tracked(func), trigger, **kwargs)
+    
+    def _tracked(self, func: Any) -> Any:
+        """Register each run of a coroutine job so shutdown() can cancel it"""
+        if not inspect.iscoroutinefunction(func):
+            return func
+        
+        @functools.wraps(func)
+        async def job(*args: Any, **kwargs: Any) -> Any:
+            task = asyncio.current_task()
+            self._running_jobs.add(task)
+            try:
+                return await func(*args, **kwargs)
+            finally:
+                self._running_jobs.discard(task)
+        
+        return job
+    
+    @staticmethod
+    def _on_job_submitted(event: JobSubmissionEvent) -> None:
+        # Coalesced runs: lag is measured from the earliest missed run
+        job_telemetry.scheduled(event.job_id, min(event.scheduled_run_times))
     
     def _setup_jobs(self) -> None:
         """
@@ -118,10 +344,10 @@ class APSchedulerAdapter:
         
         # HOT Tier: Every 5 minutes (T-1 verification)
         self._scheduler.add_job(
-            run_tier_job,
-            IntervalTrigger(seconds=settings.FREQ_HOT),
+            self._tracked(run_tier_job),
+            self._tier_trigger("HOT"),
             args=["HOT"],
-            id="job_hot_tier",
+            id=tier_job_id("HOT"),
             replace_existing=True,
             name="HOT Tier Processor (T-1 Live Verification)"
         )
@@ -129,10 +355,10 @@ class APSchedulerAdapter:
         
         # WARM Tier: Every 1 hour (T-24 social validation)
         self._scheduler.add_job(
-            run_tier_job,
-            IntervalTrigger(seconds=settings.FREQ_WARM),
+            self._tracked(run_tier_job),
+            self._tier_trigger("WARM"),
             args=["WARM"],
-            id="job_warm_tier",
+            id=tier_job_id("WARM"),
             replace_existing=True,
             name="WARM Tier Processor (T-24 Social Lock-in)"
         )
@@ -140,10 +366,10 @@ class APSchedulerAdapter:
         
         # COOL Tier: Every 6 hours (T-7 prediction)
         self._scheduler.add_job(
-            run_tier_job,
-            IntervalTrigger(seconds=settings.FREQ_COOL),
+            self._tracked(run_tier_job),
+            self._tier_trigger("COOL"),
             args=["COOL"],
-            id="job_cool_tier",
+            id=tier_job_id("COOL"),
             replace_existing=True,
             name="COOL Tier Processor (T-7 Prediction)"
         )
@@ -151,16 +377,141 @@ class APSchedulerAdapter:
         
         # COLD Tier: Every 24 hours (low priority)
         self._scheduler.add_job(
-            run_tier_job,
-            IntervalTrigger(seconds=settings.FREQ_COLD),
+            self._tracked(run_tier_job),
+            self._tier_trigger("COLD"),
             args=["COLD"],
-            id="job_cold_tier",
+            id=tier_job_id("COLD"),
             replace_existing=True,
             name="COLD Tier Processor (Low Priority)"
         )
         logger.info(f"📌 Registered COLD tier job (every {settings.FREQ_COLD}s / {settings.FREQ_COLD//86400}d)")
         
+        if tier_slices() > 1:
+            logger.info(f"🪜 Tier work spread over {tier_slices()} slices per interval")
         logger.info("🎯 All SLME tier jobs registered successfully")
+    
+    def _tier_trigger(self, tier: str) -> IntervalTrigger:
+        """Tier interval, split into slices when work spreading is on"""
+        return IntervalTrigger(seconds=max(1, TIER_FREQUENCIES[tier] // tier_slices()))
+
+
+# --- Per-event Priority Queue Implementation ---
+class PriorityQueueScheduler(APSchedulerAdapter):
+    """
+    Per-event scheduling instead of four tier-wide interval jobs.
+    
+    Each scheduled/live event sits in an EventQueue (min-heap) with its own
+    next-check time from slme.next_check_at(). A dispatcher task sleeps until
+    the earliest event is due, processes the due batch, and reinserts each
+    event at its new next-check time. DB work scales with due events instead
+    of (all events x tier jobs).
+    
+    A light resync job (ids/times only, every SCHEDULER_RESYNC_INTERVAL)
+    picks up new events and drops finished ones. APScheduler stays
+    available through add_job() for custom jobs.
+    """
+    
+    def __init__(self):
+        super().__init__()
+        self.queue = EventQueue()
+        self._running: Set[str] = set()
+        self._wakeup = asyncio.Event()
+        self._dispatcher: Optional[asyncio.Task] = None
+    
+    def shutdown(self) -> None:
+        if self._dispatcher is not None:
+            self._dispatcher.cancel()
+            self._dispatcher = None
+        super().shutdown()
+    
+    def _setup_jobs(self) -> None:
+        """Register the resync job (first run immediately) and start dispatching"""
+        self._scheduler.add_job(
+            self._tracked(self.resync),
+            IntervalTrigger(seconds=settings.SCHEDULER_RESYNC_INTERVAL),
+            id="job_event_queue_resync",
+            replace_existing=True,
+            next_run_time=datetime.now(timezone.utc),
+            name="Event Queue Resync"
+        )
+        self._dispatcher = asyncio.get_running_loop().create_task(self._dispatch_loop())
+        logger.info(
+            f"🎯 Per-event priority scheduler started "
+            f"(resync every {settings.SCHEDULER_RESYNC_INTERVAL}s)"
+        )
+    
+    async def resync(self) -> None:
+        """Add new active events, drop inactive ones, pull moved events earlier"""
+        async with AsyncSessionLocal() as session:
+            result = await session.execute(
+                select(Event.id, Event.start_time, Event.status, Event.last_verified)
+                .where(Event.status.in_(ACTIVE_STATUSES), Event.start_time.isnot(None))
+            )
+            rows = result.all()
+        
+        intervals = await adaptive_intervals([str(row.id) for row in rows])
+        now = datetime.now(timezone.utc)
+        active = set()
+        added = 0
+        for row in rows:
+            event_id = str(row.id)
+            active.add(event_id)
+            if event_id in self._running:
+                continue
+            # Resume from the last verification, so restarts do not reset cadence
+            due_at = max(now, slme.next_check_at(
+                row.start_time, row.status, row.last_verified or now, intervals.get(event_id), event_id
+            ))
+            current = self.queue.due_at(event_id)
+            if current is None:
+                added += 1
+            if current is None or due_at < current:
+                self.queue.schedule(event_id, due_at)
+        
+        for event_id in set(self.queue.snapshot()) - active:
+            self.queue.remove(event_id)
+        
+        logger.info(f"🔄 Event queue resync: {len(self.queue)} events queued, {added} new")
+        self._wakeup.set()
+    
+    async def _dispatch_loop(self) -> None:
+        while True:
+            self._wakeup.clear()
+            now = datetime.now(timezone.utc)
+            due_at = self.queue.next_due()
+            due_ids = self.queue.pop_due(now, settings.SCHEDULER_BATCH_SIZE)
+            if due_ids:
+                await self._run_due(due_ids, due_at)
+                continue
+            
+            next_due = self.queue.next_due()
+            timeout = None if next_due is None else (next_due - now).total_seconds()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+    
+    async def _run_due(self, event_ids: List[str], due_at: Optional[datetime] = None) -> None:
+        logger.info(f"⏰ Event queue: {len(event_ids)} events due")
+        self._running.update(event_ids)
+        try:
+            # Lag = how late the most overdue event of the batch is
+            async with job_telemetry.track("event_queue", scheduled_at=due_at) as run:
+                next_checks = await dispatch_event_job(event_ids, run)
+        except Exception as e:
+            # Retry at HOT cadence rather than spinning on a failing DB
+            logger.error(f"❌ Event queue batch failed: {str(e)}")
+            now = datetime.now(timezone.utc)
+            next_checks = {
+                event_id: slme.spread_slot(event_id, slme.FREQ_HOT, now + timedelta(seconds=slme.FREQ_HOT / 2))
+                for event_id in event_ids
+            }
+        finally:
+            self._running.difference_update(event_ids)
+        
+        for event_id, due_at in next_checks.items():
+            if due_at is not None:
+                self.queue.schedule(event_id, due_at)
 
 
 # --- Future: Celery Implementation (Placeholder) ---
@@ -168,6 +519,10 @@ class CeleryAdapter:
     """
     Celery implementation placeholder.
     
+    Out-of-process execution is available without Celery: set
+    SCHEDULER_EXECUTION='queue' and run `python -m app.worker` (Redis stream
+    work queue, see core/work_queue.py and app/worker.py).
+    
     To migrate to Celery:
     1. Implement this class
     2. Change settings.SCHEDULER_TYPE to 'celery'
@@ -199,22 +554,33 @@ def get_scheduler() -> TaskScheduler:
     """
     Factory function to create scheduler instance based on config.
     
+    With SCHEDULER_LEADER_ELECTION, the scheduler is wrapped so that only
+    the process holding the Redis lease runs it (see core/leader.py).
+    
     Returns:
         TaskScheduler implementation (APScheduler or Celery)
     
     Raises:
         NotImplementedError: If SCHEDULER_TYPE is not supported
     """
+    if settings.SCHEDULER_LEADER_ELECTION:
+        return LeaderElectedScheduler(_create_scheduler)
+    return _create_scheduler()
+
+
+def _create_scheduler() -> TaskScheduler:
     scheduler_type = settings.SCHEDULER_TYPE.lower()
     
     if scheduler_type == "celery":
         return CeleryAdapter()
     elif scheduler_type == "apscheduler":
         return APSchedulerAdapter()
+    elif scheduler_type == "priority":
+        return PriorityQueueScheduler()
     else:
         raise ValueError(
             f"Unknown SCHEDULER_TYPE: {settings.SCHEDULER_TYPE}. "
-            "Valid options: 'apscheduler', 'celery'"
+            "Valid options: 'apscheduler', 'priority', 'celery'"
         )
 
 
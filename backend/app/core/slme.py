@@ -1,4 +1,21 @@
+import hashlib
 from datetime import datetime, timedelta, timezone
+from typing import Optional, Tuple
+
+from sqlalchemy import and_, or_
+from sqlalchemy.sql.elements import ColumnElement
+
+from app.core.config import settings
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def _epoch_us(moment: datetime) -> int:
+    """Microseconds since the epoch (naive datetimes are UTC), without float rounding"""
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return (moment - _EPOCH) // timedelta(microseconds=1)
+
 
 class FrequencyController:
     # Frequency Constants (in seconds)
@@ -37,13 +54,24 @@ class FrequencyController:
         # 4. COLD Check (More than 7 days away)
         return "COLD"
 
+    # Adaptive mode (core/adaptive_slme.py): (min, max) interval per tier in seconds
+    ADAPTIVE_BOUNDS = {
+        "HOT": (120, 900),
+        "WARM": (900, 14400),
+        "COOL": (3600, 43200),
+        "COLD": (21600, 259200),
+    }
+
     @classmethod
     def determine_next_check(cls, start_time: datetime, status: str = "scheduled") -> int:
         """
         Returns the number of seconds to wait before the next check.
         """
-        tier = cls.get_tier(start_time, status)
-        
+        return cls.tier_frequency(cls.get_tier(start_time, status))
+
+    @classmethod
+    def tier_frequency(cls, tier: str) -> int:
+        """Fixed check frequency of a tier in seconds"""
         if tier == "HOT":
             return cls.FREQ_HOT
         elif tier == "WARM":
@@ -53,4 +81,130 @@ class FrequencyController:
         else: # COLD
             return cls.FREQ_COLD
 
+    # Tier boundaries relative to start_time, hottest last, and the tier entered at each
+    TIER_BOUNDARIES = (timedelta(days=7), timedelta(hours=24), timedelta(hours=2))
+    BOUNDARY_TIERS = ("COOL", "WARM", "HOT")
+
+    @classmethod
+    def next_check_at(cls, start_time: datetime, status: str = "scheduled", now: Optional[datetime] = None,
+                      interval: Optional[int] = None, event_id: Optional[str] = None) -> datetime:
+        """
+        Absolute time of the next check for one event.
+
+        now + determine_next_check() (or `interval`, e.g. an adaptive one),
+        but never later than the moment the event enters a hotter tier -
+        otherwise an event checked at COLD cadence 7.5 days out would next be
+        seen when it is already HOT.
+
+        With `event_id` and SCHEDULER_SPREAD > 0 the time moves to the
+        event's slot (see spread_slot): checks of a tier are spread evenly
+        over its interval, and events entering a hotter tier together are
+        spread over that tier's interval instead of all firing at the boundary.
+        """
+        now = now or datetime.now(timezone.utc)
+        if start_time.tzinfo is None:
+            start_time = start_time.replace(tzinfo=timezone.utc)
+
+        if interval is None:
+            interval = cls.determine_next_check(start_time, status)
+        spread = settings.SCHEDULER_SPREAD if event_id is not None else 0
+        if spread > 0:
+            earliest = now + timedelta(seconds=interval * (1 - spread / 2))
+            next_check = cls.spread_slot(event_id, interval, earliest, spread)
+        else:
+            next_check = now + timedelta(seconds=interval)
+
+        for boundary, tier in zip(cls.TIER_BOUNDARIES, cls.BOUNDARY_TIERS):
+            crossing = start_time - boundary
+            if now < crossing < next_check:
+                next_check = crossing
+                if spread > 0:
+                    next_check = cls.spread_slot(event_id, cls.tier_frequency(tier), crossing, spread)
+                break
+        return next_check
+
+    @staticmethod
+    def spread_offset(event_id: str) -> float:
+        """Deterministic position of an event in [0, 1), stable across processes"""
+        digest = hashlib.blake2b(str(event_id).encode(), digest_size=8).digest()
+        return int.from_bytes(digest, "big") / 2 ** 64
+
+    @classmethod
+    def spread_slot(cls, event_id: str, period: float, earliest: datetime, spread: float = 1.0) -> datetime:
+        """
+        First slot of the event at or after `earliest`.
+
+        An event's slots repeat every `period` seconds at a fixed per-event
+        offset (spread_offset * spread * period, epoch aligned), so a tier's
+        events are checked uniformly across its interval rather than in
+        bursts. Deterministic: every process computes the same slots.
+        """
+        period_us, offset_us = cls._slot_grid(event_id, period, spread)
+        cycles = -(-(_epoch_us(earliest) - offset_us) // period_us)
+        return _EPOCH + timedelta(microseconds=cycles * period_us + offset_us)
+
+    @classmethod
+    def slot_in_window(cls, event_id: str, period: float, start: datetime, end: datetime,
+                       spread: float = 1.0) -> bool:
+        """True if one of the event's slots (see spread_slot) falls in (start, end]"""
+        if (end - start).total_seconds() >= period:
+            return True
+        period_us, offset_us = cls._slot_grid(event_id, period, spread)
+        return (_epoch_us(end) - offset_us) // period_us > (_epoch_us(start) - offset_us) // period_us
+
+    @classmethod
+    def _slot_grid(cls, event_id: str, period: float, spread: float) -> Tuple[int, int]:
+        """(period, offset) of an event's slots in whole microseconds, the
+        resolution of datetime, so a returned slot is exactly on the grid"""
+        period_us = max(1, round(period * 1_000_000))
+        return period_us, int(cls.spread_offset(event_id) * spread * period_us)
+
+    # Events that started less than this long ago are still HOT
+    HOT_AFTER_START = timedelta(hours=3)
+
+    @classmethod
+    def tier_clause(cls, tier: str, start_time: ColumnElement, status: ColumnElement,
+                    now: Optional[datetime] = None) -> ColumnElement:
+        """
+        SQL predicate selecting exactly the events get_tier() puts in `tier`.
+
+        Lets tier jobs filter in the database (on the partial index
+        idx_events_active_status_start) instead of loading every event.
+
+        Usage:
+            select(Event).where(slme.tier_clause("WARM", Event.start_time, Event.status))
+        """
+        now = now or datetime.now(timezone.utc)
+        cool, warm, hot = (now + boundary for boundary in cls.TIER_BOUNDARIES)
+        hot_since = now - cls.HOT_AFTER_START
+        not_live = status != "live"
+
+        if tier == "HOT":
+            return or_(status == "live", start_time.between(hot_since, hot))
+        if tier == "WARM":
+            return and_(not_live, start_time > hot, start_time <= warm)
+        if tier == "COOL":
+            return and_(not_live, start_time > warm, start_time <= cool)
+        if tier == "COLD":
+            return and_(not_live, or_(start_time > cool, start_time < hot_since))
+        raise ValueError(f"Unknown tier: {tier}")
+
+class SlotWindow:
+    """
+    Events whose slot (FrequencyController.spread_slot) falls in (start, end].
+
+    Tier jobs run several times per tier interval and each run only takes
+    the events whose slot came up since the previous run.
+    """
+
+    def __init__(self, period: float, start: datetime, end: datetime, spread: float = 1.0):
+        self.period = period
+        self.start = start
+        self.end = end
+        self.spread = spread
+
+    def __contains__(self, event_id: object) -> bool:
+        return FrequencyController.slot_in_window(str(event_id), self.period, self.start, self.end, self.spread)
+
+
 slme = FrequencyController()
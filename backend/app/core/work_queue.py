@@ -0,0 +1,262 @@
+"""
+Work Queue - Redis stream with consumer groups for background tasks
+
+With SCHEDULER_EXECUTION='queue' the scheduler only decides *when*
+events are due and enqueues them here; `python -m app.worker` processes
+(scales independently of the API workers).
+
+Delivery semantics (at-least-once):
+- enqueue: XADD to WORK_QUEUE_STREAM (approximately capped at WORK_QUEUE_MAXLEN)
+- read:    XREADGROUP in group WORK_QUEUE_GROUP, one consumer per worker process
+- ack:     XACK after the handler finished
+- retry:   a failed task is re-added with attempts + 1 and the original acked
+- dead:    after WORK_QUEUE_MAX_ATTEMPTS the task goes to <stream>:dead
+- crash:   entries pending longer than WORK_QUEUE_VISIBILITY_TIMEOUT (the
+           consumer died mid-task) are claimed with XAUTOCLAIM (Redis 6.2+)
+           and go through the same retry path
+- running: a live consumer renews its in-flight entries (XCLAIM JUSTID,
+           see heartbeat()) so long tasks are never mistaken for crashed ones
+
+Handlers must be idempotent: a requeued task may already be half done.
+"""
+
+import json
+import logging
+import time
+from typing import Any, Collection, Dict, Iterable, List, Optional
+
+import redis.asyncio as redis
+from redis.exceptions import ResponseError
+
+from app.core.config import settings
+from app.core.metrics import registry
+
+logger = logging.getLogger(__name__)
+
+# Task types
+TASK_VERIFY_EVENTS = "verify_events"
+
+QUEUE_TASKS = registry.counter(
+    "mosport_work_queue_tasks_total", "Work queue tasks by type and outcome (enqueued, done, retried, dead)"
+)
+
+
+class QueuedTask:
+    """One stream entry"""
+
+    __slots__ = ("id", "type", "payload", "attempts", "enqueued_at")
+
+    def __init__(self, id: str, type: str, payload: Dict[str, Any], attempts: int, enqueued_at: float):
+        self.id = id
+        self.type = type
+        self.payload = payload
+        self.attempts = attempts
+        self.enqueued_at = enqueued_at
+
+    @classmethod
+    def from_entry(cls, entry_id: bytes, fields: Dict[bytes, bytes]) -> "QueuedTask":
+        return cls(
+            id=entry_id.decode(),
+            type=fields[b"type"].decode(),
+            payload=json.loads(fields[b"payload"]),
+            attempts=int(fields.get(b"attempts", b"0")),
+            enqueued_at=float(fields.get(b"enqueued_at", b"0")),
+        )
+
+
+class WorkQueue:
+    """
+    Redis stream work queue.
+
+    Usage (producer):
+        await work_queue.enqueue(TASK_VERIFY_EVENTS, {"event_ids": [...]})
+
+    Usage (consumer, see app/worker.py):
+        for task in await work_queue.read(consumer, count=4):
+            ...
+            await work_queue.ack(task)  # or await work_queue.fail(task, error)
+    """
+
+    def __init__(self, stream: str, group: str, maxlen: int, max_attempts: int):
+        self.stream = stream
+        self.group = group
+        self.dead_stream = f"{stream}:dead"
+        self.maxlen = maxlen
+        self.max_attempts = max_attempts
+        self.redis = redis.from_url(
+            settings.REDIS_URL,
+            decode_responses=False,
+            socket_connect_timeout=2,
+            socket_timeout=None  # XREADGROUP blocks; bounded by block_ms instead
+        )
+
+    async def enqueue(self, task_type: str, payload: Dict[str, Any], attempts: int = 0) -> str:
+        entry_id = await self.redis.xadd(
+            self.stream,
+            self._fields(task_type, payload, attempts),
+            maxlen=self.maxlen,
+            approximate=True
+        )
+        QUEUE_TASKS.inc(type=task_type, outcome="enqueued")
+        return entry_id.decode()
+
+    async def enqueue_many(self, task_type: str, payloads: List[Dict[str, Any]]) -> int:
+        """Enqueue several tasks in one round trip"""
+        if not payloads:
+            return 0
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for payload in payloads:
+                pipe.xadd(
+                    self.stream,
+                    self._fields(task_type, payload, 0),
+                    maxlen=self.maxlen,
+                    approximate=True
+                )
+            await pipe.execute()
+        QUEUE_TASKS.inc(len(payloads), type=task_type, outcome="enqueued")
+        return len(payloads)
+
+    async def ensure_group(self) -> None:
+        """Create the consumer group (and stream) if missing"""
+        try:
+            await self.redis.xgroup_create(self.stream, self.group, id="0", mkstream=True)
+            logger.info(f"Created consumer group {self.group} on {self.stream}")
+        except ResponseError as e:
+            if "BUSYGROUP" not in str(e):
+                raise
+
+    async def read(self, consumer: str, count: int, block_ms: int = 5000) -> List[QueuedTask]:
+        """New tasks for this consumer (blocks up to block_ms when idle)"""
+        response = await self.redis.xreadgroup(
+            self.group, consumer, {self.stream: ">"}, count=count, block=block_ms
+        )
+        tasks = []
+        for _, entries in response or []:
+            for entry_id, fields in entries:
+                tasks.append(await self._parse(entry_id, fields))
+        return [t for t in tasks if t is not None]
+
+    async def heartbeat(self, consumer: str, task_ids: Iterable[str]) -> None:
+        """
+        Reset the idle time of tasks this consumer is still running.
+
+        XCLAIM with min-idle 0 keeps the entries with the same consumer and
+        only restarts their idle clock, so requeue_stale() in other workers
+        leaves them alone. JUSTID skips returning the payloads and does not
+        bump the delivery counter.
+        """
+        task_ids = list(task_ids)
+        if task_ids:
+            await self.redis.xclaim(self.stream, self.group, consumer, 0, task_ids, justid=True)
+
+    async def requeue_stale(
+        self,
+        consumer: str,
+        min_idle_ms: int,
+        count: int,
+        running: Collection[str] = ()
+    ) -> int:
+        """
+        Re-enqueue tasks another (crashed) consumer read but never acked.
+
+        Each requeue counts as an attempt, so a task that kills its worker
+        ends up in the dead-letter stream instead of cycling forever.
+        `running` are ids this consumer is still processing; if one of them
+        went idle past the timeout anyway (missed heartbeat) it is left to
+        finish instead of being run a second time.
+        """
+        response = await self.redis.xautoclaim(
+            self.stream, self.group, consumer, min_idle_time=min_idle_ms, start_id="0-0", count=count
+        )
+        requeued = 0
+        for entry_id, fields in response[1]:
+            if entry_id.decode() in running:
+                continue
+            if not fields:
+                # Trimmed from the stream while pending
+                await self.redis.xack(self.stream, self.group, entry_id)
+                continue
+            task = await self._parse(entry_id, fields)
+            if task is not None:
+                await self.fail(task, "consumer died while processing")
+                requeued += 1
+        return requeued
+
+    async def ack(self, task: QueuedTask) -> None:
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.xack(self.stream, self.group, task.id)
+            pipe.xdel(self.stream, task.id)
+            await pipe.execute()
+        QUEUE_TASKS.inc(type=task.type, outcome="done")
+
+    async def fail(self, task: QueuedTask, error: str) -> None:
+        """Re-enqueue a failed task with attempts + 1, or dead-letter it"""
+        attempts = task.attempts + 1
+        if attempts >= self.max_attempts:
+            await self._dead_letter(task, error)
+            return
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.xadd(
+                self.stream,
+                self._fields(task.type, task.payload, attempts),
+                maxlen=self.maxlen,
+                approximate=True
+            )
+            pipe.xack(self.stream, self.group, task.id)
+            pipe.xdel(self.stream, task.id)
+            await pipe.execute()
+        QUEUE_TASKS.inc(type=task.type, outcome="retried")
+        logger.warning(f"Task {task.id} ({task.type}) failed, retry {attempts}/{self.max_attempts - 1}: {error}")
+
+    async def stats(self) -> Dict[str, Any]:
+        length = await self.redis.xlen(self.stream)
+        dead = await self.redis.xlen(self.dead_stream)
+        try:
+            pending = (await self.redis.xpending(self.stream, self.group))["pending"]
+        except ResponseError:
+            pending = 0  # Group not created yet
+        return {"stream": self.stream, "length": length, "pending": pending, "dead": dead}
+
+    async def close(self) -> None:
+        await self.redis.aclose()
+
+    async def _dead_letter(self, task: QueuedTask, error: str) -> None:
+        fields = self._fields(task.type, task.payload, task.attempts)
+        fields.update({"error": error[:500], "original_id": task.id})
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.xadd(self.dead_stream, fields, maxlen=self.maxlen, approximate=True)
+            pipe.xack(self.stream, self.group, task.id)
+            pipe.xdel(self.stream, task.id)
+            await pipe.execute()
+        QUEUE_TASKS.inc(type=task.type, outcome="dead")
+        logger.error(f"Task {task.id} ({task.type}) dead-lettered after {task.attempts} attempts: {error}")
+
+    async def _parse(self, entry_id: bytes, fields: Dict[bytes, bytes]) -> Optional[QueuedTask]:
+        try:
+            return QueuedTask.from_entry(entry_id, fields)
+        except Exception as e:
+            # Malformed entry: park it so it is not redelivered forever
+            logger.error(f"Malformed work queue entry {entry_id!r}: {e}")
+            async with self.redis.pipeline(transaction=True) as pipe:
+                pipe.xadd(self.dead_stream, {**fields, b"error": str(e)[:500]}, maxlen=self.maxlen, approximate=True)
+                pipe.xack(self.stream, self.group, entry_id)
+                pipe.xdel(self.stream, entry_id)
+                await pipe.execute()
+            return None
+
+    @staticmethod
+    def _fields(task_type: str, payload: Dict[str, Any], attempts: int) -> Dict[str, Any]:
+        return {
+            "type": task_type,
+            "payload": json.dumps(payload),
+            "attempts": attempts,
+            "enqueued_at": f"{time.time():.3f}",
+        }
+
+
+work_queue = WorkQueue(
+    stream=settings.WORK_QUEUE_STREAM,
+    group=settings.WORK_QUEUE_GROUP,
+    maxlen=settings.WORK_QUEUE_MAXLEN,
+    max_attempts=settings.WORK_QUEUE_MAX_ATTEMPTS
+)
@@ -2,6 +2,7 @@ import asyncio
 import uuid
 from datetime import datetime, timedelta, timezone
 
+from app.core.response_cache import invalidate_tags
 from app.db.session import AsyncSessionLocal
 from app.models.models import Venue, Event, VenueEvent, User
 from sqlalchemy.future import select
@@ -218,6 +219,7 @@ async def init_db():
                         print(f"  -> Linked to additional event: {ev.title}")
 
         await session.commit()
+        await invalidate_tags("venues", "events")
         print("Data Initialization Complete.")
 
 if __name__ == "__main__":
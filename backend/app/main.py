@@ -9,7 +9,11 @@ import logging
 from app.core.config import settings
 from app.api.api_v1.api import api_router
 from app.core.limiter import limiter
+from app.core.auth import AuthMiddleware, token_resolver
+from app.core.cache import cache
+from app.core.redis_health import redis_breaker
 from app.core.scheduler import scheduler_manager
+from app.services.scraper import scraper_service
 from app.db.init_db import init_db
 
 # Setup logging
@@ -36,6 +40,8 @@ async def lifespan(app: FastAPI):
         logger.info("✅ Auto-seeding complete")
     except Exception as e:
         logger.error(f"❌ Auto-seeding failed: {e}")
+
+    await cache.start()
     
     if settings.ENABLE_SCHEDULER:
         logger.info(f"Initializing Scheduler System ({settings.SCHEDULER_TYPE})...")
@@ -58,6 +64,9 @@ async def lifespan(app: FastAPI):
             logger.info("✅ Scheduler stopped gracefully")
         except Exception as e:
             logger.error(f"Error during scheduler shutdown: {str(e)}")
+    await scraper_service.close()
+    await cache.close()
+    await redis_breaker.close()
 
 app = FastAPI(
     title=settings.PROJECT_NAME,
@@ -69,6 +78,8 @@ app = FastAPI(
 app.state.limiter = limiter
 app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
 app.add_middleware(SlowAPIMiddleware)
+# Added after SlowAPIMiddleware so it runs first and sets request.state.user_role
+app.add_middleware(AuthMiddleware, resolver=token_resolver)
 
 # Set all CORS enabled origins
 if settings.BACKEND_CORS_ORIGINS:
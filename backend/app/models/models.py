@@ -1,7 +1,7 @@
 from sqlalchemy import Column, String, Boolean, ForeignKey, DateTime, Float, Integer, Index, Text
 from sqlalchemy.dialects.postgresql import UUID, JSONB, ARRAY
 from sqlalchemy.orm import relationship
-from sqlalchemy.sql import func
+from sqlalchemy.sql import func, text
 import uuid
 
 from app.db.base_class import Base
@@ -79,6 +79,14 @@ class Event(Base):
     # Using VennueEvent association
     venues = relationship("VenueEvent", back_populates="event")
 
+    # Tier job scans (slme.tier_clause) only touch active events
+    __table_args__ = (
+        Index(
+            'idx_events_active_status_start', 'status', 'start_time',
+            postgresql_where=text("status IN ('scheduled', 'live')")
+        ),
+    )
+
 class VenueEvent(Base):
     __tablename__ = "venue_events"
 
@@ -12,10 +12,39 @@ Constitutional Compliance: 1.1 (TTL separation), 1.5 (Shadow Log)
 import logging
 from typing import List, Dict, Any, Optional
 from datetime import datetime
-from app.core.cache import cache, CacheTTL
+from app.core.cache import cache, CacheTTL, CacheWriteBuffer
+from app.core.dtss import judge_batcher
+from app.core.metrics import registry
+from app.services.watermarks import watermark_key, post_position, is_newer, make_watermark
 
 logger = logging.getLogger(__name__)
 
+POST_WATERMARK_CHECKS = registry.counter(
+    "mosport_dtss_watermark_checks_total",
+    "Venue post checks by result (new_posts = analyzed, unchanged = previous result carried forward)"
+)
+
+# LLM Prompt for venue posts
+VENUE_POST_PROMPT = """
+You are the 'Mosport Venue Validator'. Detect live sports events and operational status.
+
+Target Keywords: 
+- Events: 'WBC', 'World Cup', 'Premier League', 'Live', 'Sound On'
+- Overrides: 'Closed', 'Private Event', 'Sold Out'
+
+Output JSON Schema:
+{
+  "has_live_event": boolean,
+  "event_confidence": float (0.0-1.0),
+  "detected_keywords": list of strings,
+  "qoe_update": {
+    "visual": string or null (e.g., 'Big Screen'),
+    "audio": string or null (e.g., 'Sound On')
+  },
+  "override_status": boolean  // True if 'Closed' or 'Private Event' detected
+}
+"""
+
 
 class DTSSService:
     """
@@ -85,7 +114,9 @@ class DTSSService:
         venue_id: str, 
         post_id: str,
         text: str, 
-        image_url: Optional[str] = None
+        image_url: Optional[str] = None,
+        cache_writes: Optional[CacheWriteBuffer] = None,
+        judgment: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
         """
         Upgraded Venue Activity Sync with Private Event Detection
@@ -93,41 +124,45 @@ class DTSSService:
         Constitutional Compliance:
         - Raw text/image stored in Redis (48h TTL)
         - Only confidence scores, tags, QoE stored in PostgreSQL
+
+        If cache_writes is given, the raw post is queued on that buffer and
+        written when the caller flushes it (batch jobs), instead of costing
+        one Redis round trip per post.
+
+        A `judgment` made by the caller (batched AI judging, memoized by
+        content in AIJudge, see analyze_new_venue_posts) is used as is;
+        otherwise the keyword judgment runs locally (too cheap to memoize).
         """
         logger.info(f"Analyzing venue post for {venue_id}: {text[:50]}...")
         
         # Store raw data (Constitutional: Redis with TTL)
-        await cache.set(
-            f"raw:venue_post:{venue_id}:{post_id}",
-            {
-                "text": text,
-                "image_url": image_url,
-                "captured_at": datetime.utcnow().isoformat()
-            },
-            ttl=CacheTTL.RAW  # 48 hours
-        )
+        raw_key = f"raw:venue_post:{venue_id}:{post_id}"
+        raw_post = {
+            "text": text,
+            "image_url": image_url,
+            "captured_at": datetime.utcnow().isoformat()
+        }
+        if cache_writes is not None:
+            cache_writes.set(raw_key, raw_post, ttl=CacheTTL.RAW)
+        else:
+            await cache.set(raw_key, raw_post, ttl=CacheTTL.RAW)  # 48 hours
         
-        # LLM Prompt
-        system_prompt = """
-        You are the 'Mosport Venue Validator'. Detect live sports events and operational status.
+        if judgment is None:
+            judgment = self._judge_venue_post(text)
         
-        Target Keywords: 
-        - Events: 'WBC', 'World Cup', 'Premier League', 'Live', 'Sound On'
-        - Overrides: 'Closed', 'Private Event', 'Sold Out'
+        derivative_result = {**judgment, "verified_at": datetime.utcnow().isoformat()}
         
-        Output JSON Schema:
-        {
-          "has_live_event": boolean,
-          "event_confidence": float (0.0-1.0),
-          "detected_keywords": list of strings,
-          "qoe_update": {
-            "visual": string or null (e.g., 'Big Screen'),
-            "audio": string or null (e.g., 'Sound On')
-          },
-          "override_status": boolean  // True if 'Closed' or 'Private Event' detected
-        }
-        """
+        # Interventional Alert (Fail-Safe Trigger)
+        if derivative_result["override_status"]:
+            logger.warning(f"⚠️ OVERRIDE DETECTED for Venue {venue_id}: {text[:100]}")
+        
+        logger.info(f"Venue {venue_id} Confidence: {derivative_result['event_confidence']:.2f}")
         
+        # Return ONLY derivative data (safe for PostgreSQL)
+        return derivative_result
+
+    def _judge_venue_post(self, text: str) -> Dict[str, Any]:
+        """Judgment of one post under VENUE_POST_PROMPT"""
         # Mock LLM response (replace with actual OpenAI/Anthropic call)
         text_lower = text.lower()
         
@@ -135,7 +170,7 @@ class DTSSService:
         has_event = any(kw in text_lower for kw in ['live', 'match', 'wbc', 'football'])
         is_override = any(kw in text_lower for kw in ['closed', 'private event', 'sold out'])
         
-        derivative_result = {
+        return {
             "has_live_event": has_event,
             "event_confidence": 0.95 if has_event else 0.1,
             "detected_keywords": [kw for kw in ['Live', 'WBC', 'Sound ON'] if kw.lower() in text_lower],
@@ -143,18 +178,116 @@ class DTSSService:
                 "visual": "Big Screen" if "screen" in text_lower else None,
                 "audio": "Sound ON" if "sound" in text_lower else None
             },
-            "override_status": is_override,
-            "verified_at": datetime.utcnow().isoformat()
+            "override_status": is_override
         }
+
+    async def _ai_judge_venue_posts(self, posts: List[Dict[str, Any]]) -> Optional[List[Dict[str, Any]]]:
+        """
+        Judge posts with the AI judge and map the results onto the
+        VENUE_POST_PROMPT shape.
+
+        Posts go through judge_batcher, so the new posts of all venues
+        checked around the same time share batch requests (and the judgment
+        memo in AIJudge). Returns None in mock mode (no OpenAI client), where
+        posts get the keyword judgment one by one. Override detection stays
+        keyword based; a post the AI could not judge falls back to the
+        keyword judgment.
+        """
+        if not judge_batcher.enabled:
+            return None
+        results = await judge_batcher.evaluate_posts(
+            [{"text": post["text"], "image_url": post.get("image_url")} for post in posts]
+        )
+        judgments = []
+        for post, result in zip(posts, results):
+            judgment = self._judge_venue_post(post["text"])
+            if "error" not in result:
+                tags = result.get("tags") or []
+                judgment.update({
+                    "has_live_event": result["is_match"],
+                    "event_confidence": result["confidence"],
+                    "qoe_update": {
+                        "visual": "Big Screen" if "Big Screen" in tags else judgment["qoe_update"]["visual"],
+                        "audio": "Sound ON" if "Sound ON" in tags else judgment["qoe_update"]["audio"]
+                    },
+                    "override_status": judgment["override_status"] or "Closed" in tags
+                })
+            judgments.append(judgment)
+        return judgments
+
+    async def get_post_state(self, venue_id: str, platform: str = "instagram") -> Dict[str, Any]:
+        """
+        Watermark and analysis window of a venue's feed (see services/watermarks.py).
         
-        # Interventional Alert (Fail-Safe Trigger)
-        if derivative_result["override_status"]:
-            logger.warning(f"⚠️ OVERRIDE DETECTED for Venue {venue_id}: {text[:100]}")
+        Returns:
+            {"watermark": {"post_id", "timestamp"} or None, "window": [analyses, newest first]}
+        """
+        state = await cache.get(watermark_key(venue_id, platform))
+        if not state:
+            return {"watermark": None, "window": []}
+        return state
+    
+    async def get_post_states(self, venue_ids: List[str], platform: str = "instagram") -> Dict[str, Dict[str, Any]]:
+        """get_post_state() for many venues in one MGET"""
+        keys = {watermark_key(venue_id, platform): venue_id for venue_id in venue_ids}
+        stored = await cache.get_many(list(keys))
+        return {
+            venue_id: stored.get(key) or {"watermark": None, "window": []}
+            for key, venue_id in keys.items()
+        }
+    
+    async def analyze_new_venue_posts(
+        self,
+        venue_id: str,
+        posts: List[Dict[str, Any]],
+        state: Dict[str, Any],
+        platform: str = "instagram",
+        window_size: int = 3,
+        cache_writes: Optional[CacheWriteBuffer] = None
+    ) -> Dict[str, Any]:
+        """
+        Incremental venue post analysis.
         
-        logger.info(f"Venue {venue_id} Confidence: {derivative_result['event_confidence']:.2f}")
+        Only posts newer than the state's watermark are analyzed; their
+        results are merged into the window of the latest `window_size`
+        analyses, which is stored with the new watermark (48h TTL, derivative
+        data only). Without new posts nothing is analyzed or written and the
+        previous window carries forward. With an OpenAI key the new posts
+        are judged by the AI judge, batched with other venues' posts.
         
-        # Return ONLY derivative data (safe for PostgreSQL)
-        return derivative_result
+        Returns:
+            {"window": [analyses, newest first], "new_posts": int, "carried_forward": bool}
+        """
+        watermark = state.get("watermark")
+        new_posts = sorted(
+            (post for post in posts if is_newer(post, watermark)),
+            key=post_position,
+            reverse=True
+        )
+        if not new_posts:
+            POST_WATERMARK_CHECKS.inc(result="unchanged")
+            return {"window": state.get("window", []), "new_posts": 0, "carried_forward": True}
+        
+        POST_WATERMARK_CHECKS.inc(result="new_posts")
+        to_analyze = new_posts[:window_size]
+        judgments = await self._ai_judge_venue_posts(to_analyze) or [None] * len(to_analyze)
+        analyzed = []
+        for post, judgment in zip(to_analyze, judgments):
+            analysis = await self.analyze_venue_post(
+                venue_id, post['id'], post['text'], post.get('image_url'),
+                cache_writes=cache_writes, judgment=judgment
+            )
+            analyzed.append({**analysis, "post_id": post['id'], "timestamp": post.get('timestamp')})
+        
+        window = sorted(analyzed + state.get("window", []), key=post_position, reverse=True)[:window_size]
+        new_state = {"watermark": make_watermark(new_posts[0]), "window": window}
+        key = watermark_key(venue_id, platform)
+        if cache_writes is not None:
+            cache_writes.set(key, new_state, ttl=CacheTTL.RAW)
+        else:
+            await cache.set(key, new_state, ttl=CacheTTL.RAW)
+        
+        return {"window": window, "new_posts": len(new_posts), "carried_forward": False}
 
 
 # Singleton instance
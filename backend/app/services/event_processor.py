@@ -9,28 +9,43 @@ Constitutional Compliance: 1.1 (Derivative only), 1.2 (Backend logic)
 ---
 """
 
+import asyncio
 import logging
-from typing import List, Dict, Any
-from datetime import datetime
+from typing import List, Dict, Any, AsyncIterator, Optional
+from datetime import datetime, timezone
+from sqlalchemy import tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 
-from app.models.models import Event, Venue, VenueEvent
+from app.models.models import Event, VenueEvent
 from app.services.dtss import dtss_service
+from app.services.event_writer import EventWriter
+from app.services.venue_memo import VenueMemo
 from app.services.scraper import scraper_service
+from app.services.scraper_backends import ScraperError, VenuePosts
 from app.services.qoe import qoe_calculator
-from app.core.slme import slme
+from app.core.slme import slme, SlotWindow
+from app.core.adaptive_slme import adaptive_slme, Cadence
 from app.core.cache import cache, CacheTTL
+from app.core.job_telemetry import StageTimer
+from app.core.config import settings
+from app.core.response_cache import invalidate_tags, events_tag, QOE_TAG
 
 logger = logging.getLogger(__name__)
 
 
+def live_check_key(venue_id: str) -> str:
+    """Cache key of a venue's live check result (shared across runs, see VenueMemo)"""
+    return f"venue:{venue_id}:live_check"
+
+
 class ProcessResult:
     """Result object for monitoring and logging"""
-    def __init__(self, success: bool, message: str, events_processed: int = 0):
+    def __init__(self, success: bool, message: str, events_processed: int = 0, events_failed: int = 0):
         self.success = success
         self.message = message
         self.events_processed = events_processed
+        self.events_failed = events_failed
         self.timestamp = datetime.utcnow()
 
 
@@ -42,12 +57,39 @@ class EventProcessor:
     - No scheduler-specific code (can be called by APScheduler, Celery, or API)
     - All methods are async (compatible with various execution contexts)
     - Returns explicit Result objects for monitoring
+    
+    Concurrency:
+    - Events of a batch run concurrently, at most MAX_CONCURRENT_JOBS at a time
+    - Venue checks (scrape + DTSS) share a second MAX_CONCURRENT_JOBS bound;
+      the scraper adds per-platform limits on top
+    - All DB access goes through self.writer (one lock around the session);
+      results are recorded and written in bulk when the batch ends
+    
+    Stage timings (scrape, analyze, db) accumulate in self.stages, e.g. a
+    JobRun's timer for scheduler telemetry (core/job_telemetry.py).
     """
     
-    def __init__(self, db: AsyncSession):
+    def __init__(self, db: AsyncSession, stages: Optional[StageTimer] = None):
         self.db = db
+        self.stages = stages or StageTimer()
+        self.writer = EventWriter(db)
+        # Separate bounds for events and venue checks: an event holding a
+        # slot waits for venue slots, never the other way round
+        self._event_slots = asyncio.Semaphore(settings.MAX_CONCURRENT_JOBS)
+        self._venue_slots = asyncio.Semaphore(settings.MAX_CONCURRENT_JOBS)
+        # Cache writes of a tier run are flushed together (one pipeline per TTL)
+        self.cache_writes = cache.buffer()
+        # Response cache tags invalidated once at the end of the run
+        self.dirty_tags = set()
+        # Venue scrapes/analyses shared by all events of the run
+        self.venue_memo = VenueMemo()
+        # Adaptive SLME: events that changed in this run, and their new cadences
+        self.changed_events = set()
+        self.cadences: Dict[str, Cadence] = {}
+        # HOT batches: venue_id -> (post state, posts) future, filled by one batched scrape
+        self._live_posts: Dict[str, asyncio.Future] = {}
     
-    async def process_events_by_tier(self, tier: str) -> ProcessResult:
+    async def process_events_by_tier(self, tier: str, slots: Optional[SlotWindow] = None) -> ProcessResult:
         """
         Process events based on their lifecycle tier (HOT/WARM/COOL/COLD).
         
@@ -55,6 +97,7 @@ class EventProcessor:
         
         Args:
             tier: One of 'HOT', 'WARM', 'COOL', 'COLD' (from SLME)
+            slots: Only process events whose spread slot is in this window
         
         Returns:
             ProcessResult with success status and metadata
@@ -62,54 +105,229 @@ class EventProcessor:
         logger.info(f"🔥 Processing {tier} tier events...")
         
         try:
-            # 1. Query events that match this tier
-            events = await self._get_events_by_tier(tier)
+            # 1. Page through this tier's events (filtered in SQL, flat memory)
+            total = 0
+            processed_count = 0
+            failed_count = 0
+            skipped = 0
+            async for events in self.iter_events_by_tier(tier, slots=slots):
+                total += len(events)
+                
+                if adaptive_slme.enabled():
+                    # Stable events whose adaptive interval outlasts this run wait for a later one
+                    due, page_skipped = await adaptive_slme.filter_due(
+                        (str(event.id) for event in events), tier, slme.tier_frequency(tier)
+                    )
+                    skipped += page_skipped
+                    events = [event for event in events if str(event.id) in due]
+                    if not events:
+                        continue
+                
+                # 2. Process each page (cache writes flushed per page)
+                result = await self.process_events(events, tier)
+                processed_count += result.events_processed
+                failed_count += result.events_failed
             
-            if not events:
+            if not total:
                 logger.info(f"No {tier} events found.")
                 return ProcessResult(True, f"No {tier} events to process", 0)
             
-            logger.info(f"Found {len(events)} {tier} events")
-            
-            # 2. Process each event
-            processed_count = 0
-            for event in events:
-                try:
-                    await self._process_single_event(event, tier)
-                    processed_count += 1
-                except Exception as e:
-                    logger.error(f"Error processing event {event.id}: {str(e)}")
-                    # Continue with other events
-            
             return ProcessResult(
-                True, 
-                f"Processed {processed_count}/{len(events)} {tier} events",
-                processed_count
+                True,
+                f"Processed {processed_count}/{total} {tier} events"
+                + (f" ({skipped} not due, adaptive)" if skipped else ""),
+                processed_count,
+                failed_count
             )
             
         except Exception as e:
             logger.error(f"Tier processing failed for {tier}: {str(e)}")
             return ProcessResult(False, str(e), 0)
     
-    async def _get_events_by_tier(self, tier: str) -> List[Event]:
+    async def process_events(self, events: List[Event], tier: Optional[str] = None) -> ProcessResult:
         """
-        Query events that belong to a specific lifecycle tier.
+        Process the given events and flush the run's cache writes.
+        
+        Args:
+            events: Events loaded in self.db
+            tier: Tier to process them as; None computes each event's own
+                tier (per-event priority scheduler)
         
-        Uses SLME logic to determine tier based on start_time.
+        Returns:
+            ProcessResult with success status and metadata
         """
-        # Get all upcoming/live events
-        result = await self.db.execute(
-            select(Event).where(Event.status.in_(['scheduled', 'live']))
+        label = tier or "due"
+        prefetch = await self._start_live_prefetch(events, tier)
+        try:
+            outcomes = await asyncio.gather(*(self._process_isolated(event, tier) for event in events))
+            processed_count = sum(outcomes)
+            if adaptive_slme.enabled():
+                await self._observe_changes(events, outcomes, tier)
+        finally:
+            if prefetch is not None:
+                prefetch.cancel()
+                self._live_posts = {}
+            # Apply the batch's DB results (bulk UPDATEs, one commit), then
+            # flush buffered raw posts / QoE tags / watermarks to Redis
+            with self.stages.track("db"):
+                written = await self.writer.flush()
+            if written is None:
+                # Lost QoE/override results: keep the old watermarks so the
+                # next run analyzes these posts (and records them) again
+                dropped = self.cache_writes.discard()
+                self.dirty_tags.clear()
+                logger.warning(f"⚠️ DB write failed: dropped {dropped} cache writes, posts will be re-analyzed")
+            await self.cache_writes.flush()
+            if self.dirty_tags:
+                await invalidate_tags(*self.dirty_tags)
+                self.dirty_tags.clear()
+        
+        return ProcessResult(
+            True, 
+            f"Processed {processed_count}/{len(events)} {label} events",
+            processed_count,
+            len(events) - processed_count
         )
-        all_events = result.scalars().all()
+    
+    async def _start_live_prefetch(self, events: List[Event], tier: Optional[str]) -> Optional[asyncio.Task]:
+        """
+        Scrape the venues of the batch's HOT events with one batched call.
         
-        # Filter by SLME tier
-        tier_events = [
-            event for event in all_events
-            if slme.get_tier(event.start_time, event.status) == tier
-        ]
+        fetch_recent_posts_many streams results as provider batches complete;
+        each venue's live check starts as soon as its posts arrive instead of
+        paying a separate request per venue.
         
-        return tier_events
+        Venues with a fresh cross-run live check (VenueMemo) are left out:
+        their result is reused, so scrapes scale with venues that are due,
+        not with runs (tier slices) x venues.
+        """
+        hot = [e.id for e in events if (tier or slme.get_tier(e.start_time, e.status)) == "HOT"]
+        if not hot:
+            return None
+        try:
+            with self.stages.track("db"):
+                venue_ids = [str(v) for v in await self.writer.venue_ids_for(hot)]
+            keys = {live_check_key(venue_id): venue_id for venue_id in venue_ids}
+            fresh = await self.venue_memo.preload(list(keys), kind="live_check")
+        except Exception as e:
+            logger.warning(f"Live post prefetch skipped: {str(e)}")
+            return None
+        venue_ids = [venue_id for key, venue_id in keys.items() if key not in fresh]
+        if not venue_ids:
+            return None
+        loop = asyncio.get_running_loop()
+        self._live_posts = {venue_id: loop.create_future() for venue_id in venue_ids}
+        return asyncio.create_task(self._prefetch_live_posts(venue_ids))
+    
+    async def _prefetch_live_posts(self, venue_ids: List[str], platform: str = "instagram") -> None:
+        states: Dict[str, Dict[str, Any]] = {}
+        error = "batch fetch cancelled"
+        try:
+            states = await dtss_service.get_post_states(venue_ids, platform)
+            since = {venue_id: state["watermark"] for venue_id, state in states.items() if state["watermark"]}
+            with self.stages.track("scrape"):
+                async for result in scraper_service.fetch_recent_posts_many(venue_ids, platform, limit=3, since=since):
+                    future = self._live_posts.get(result.venue_id)
+                    if future is not None and not future.done():
+                        future.set_result((states[result.venue_id], result))
+            error = "not returned by batch fetch"
+        except Exception as e:
+            logger.warning(f"Batched live post fetch failed: {str(e)}")
+            error = str(e)
+        finally:
+            # Never leave a live check waiting (also when cancelled at the end of the batch)
+            for venue_id, future in self._live_posts.items():
+                if not future.done():
+                    future.set_result((states.get(venue_id), VenuePosts(venue_id, [], error)))
+    
+    async def _observe_changes(self, events: List[Event], outcomes: List[bool], tier: Optional[str]) -> None:
+        """
+        Report each successfully processed event to adaptive SLME.
+        
+        Changed = a venue reported new posts or an override, or the
+        confidence about to be written moved by SLME_ADAPTIVE_EPSILON or more.
+        """
+        observations = {}
+        for event, ok in zip(events, outcomes):
+            if not ok:
+                continue
+            event_id = str(event.id)
+            changed = event_id in self.changed_events
+            score = self.writer.pending_confidence(event.id)
+            if score is not None and abs(score - (event.confidence_score or 0.0)) >= settings.SLME_ADAPTIVE_EPSILON:
+                changed = True
+            observations[event_id] = (tier or slme.get_tier(event.start_time, event.status), changed)
+        try:
+            self.cadences.update(await adaptive_slme.observe(observations))
+        except Exception as e:
+            # Fail-safe: events keep their tier's fixed frequency
+            logger.warning(f"Adaptive SLME update failed: {str(e)}")
+        finally:
+            self.changed_events.clear()
+    
+    async def _process_isolated(self, event: Event, tier: Optional[str]) -> bool:
+        """Process one event within the concurrency bound; errors stay local"""
+        async with self._event_slots:
+            try:
+                event_tier = tier or slme.get_tier(event.start_time, event.status)
+                await self._process_single_event(event, event_tier)
+                return True
+            except Exception as e:
+                logger.error(f"Error processing event {event.id}: {str(e)}")
+                # Continue with other events
+                return False
+    
+    async def _gather_venues(self, venue_events: List[VenueEvent], check) -> None:
+        """Run `check(ve)` for every venue link concurrently (bounded, errors isolated)"""
+        async def run(ve: VenueEvent) -> None:
+            async with self._venue_slots:
+                try:
+                    await check(ve)
+                except Exception as e:
+                    logger.error(f"Error checking venue {ve.venue_id}: {str(e)}")
+        
+        await asyncio.gather(*(run(ve) for ve in venue_events))
+    
+    async def iter_events_by_tier(
+        self,
+        tier: str,
+        page_size: int = settings.SCHEDULER_BATCH_SIZE,
+        slots: Optional[SlotWindow] = None
+    ) -> AsyncIterator[List[Event]]:
+        """
+        Yield the events of one lifecycle tier in pages of up to `page_size`.
+        
+        With `slots`, only events whose spread slot falls in the window are
+        yielded (pages may be smaller; empty ones are skipped).
+        
+        The tier window comes from slme.tier_clause() (SQL, backed by the
+        partial index idx_events_active_status_start), so only this tier's
+        rows are read. Keyset pagination on (start_time, id) keeps memory
+        flat and, unlike a server-side cursor, survives the commits made
+        while a page is processed.
+        """
+        now = datetime.now(timezone.utc)  # One window for the whole run
+        base = select(Event).where(
+            Event.status.in_(['scheduled', 'live']),
+            slme.tier_clause(tier, Event.start_time, Event.status, now)
+        ).order_by(Event.start_time, Event.id).limit(page_size)
+        
+        last = None
+        while True:
+            stmt = base
+            if last is not None:
+                stmt = stmt.where(tuple_(Event.start_time, Event.id) > last)
+            with self.stages.track("db"):
+                result = await self.db.execute(stmt)
+            events = result.scalars().all()
+            if not events:
+                return
+            selected = events if slots is None else [event for event in events if event.id in slots]
+            if selected:
+                yield selected
+            if len(events) < page_size:
+                return
+            last = (events[-1].start_time, events[-1].id)
     
     async def _process_single_event(self, event: Event, tier: str) -> None:
         """
@@ -139,69 +357,116 @@ class EventProcessor:
         logger.info(f"[T-1] Verifying live status for: {event.title}")
         
         # Get associated venues
-        result = await self.db.execute(
-            select(VenueEvent).where(VenueEvent.event_id == event.id)
-        )
-        venue_events = result.scalars().all()
-        
-        for ve in venue_events:
-            # 1. Acquire Data (Layer A)
-            # Fetch recent posts from Scraper Service (Abstracts Instagram/Facebook/Mock)
-            posts = await scraper_service.fetch_recent_posts(
-                venue_id=str(ve.venue_id),
-                limit=3
+        with self.stages.track("db"):
+            venue_events = await self.writer.venue_links(event.id)
+        
+        positions = {id(ve): i for i, ve in enumerate(venue_events)}
+        
+        async def check(ve: VenueEvent) -> None:
+            # 1-2. Acquire + analyze, once per venue per run (see VenueMemo)
+            venue_id = str(ve.venue_id)
+            result = await self.venue_memo.get_or_load(
+                live_check_key(venue_id),
+                lambda: self._check_venue_live(venue_id),
+                kind="live_check"
             )
             
-            highest_confidence = 0.0
-            
-            # 2. Analyze Data (DTSS)
-            for post in posts:
-                analysis = await dtss_service.analyze_venue_post(
-                    venue_id=str(ve.venue_id),
-                    post_id=post["id"],
-                    text=post["text"],
-                    image_url=post["image_url"]
-                )
-                
-                # Keep the highest confidence found among recent posts
-                if analysis["event_confidence"] > highest_confidence:
-                    highest_confidence = analysis["event_confidence"]
-
-                # Trigger alert if ANY post says they are closed (Fail-Safe)
-                if analysis["override_status"]:
-                    await self.trigger_interventional_alert(str(event.id))
-                    # If overridden, we can stop checking this venue
-                    break
-            
-            # 3. Update Event State
-            await self.update_event_confidence(
+            # 3. Update Event State (written when the batch is flushed)
+            self.update_event_confidence(
                 str(event.id), 
-                highest_confidence
+                result["confidence"],
+                positions[id(ve)]
             )
             
-            # Calculate and update QoE Score (Constitutional: Section 3.2)
-            qoe_tags = qoe_calculator.generate_tags_from_dtss(analysis)
-            qoe_score = qoe_calculator.calculate_score(qoe_tags)
+            if result.get("new_posts") or result["override"]:
+                self.changed_events.add(str(event.id))
             
-            # Update venue QoE score in database (derivative data)
-            venue_result = await self.db.execute(
-                select(Venue).where(Venue.id == ve.venue_id)
-            )
-            venue = venue_result.scalars().first()
-            if venue:
-                venue.qoe_score = qoe_score / 100  # Normalize to 0.0-1.0
-                logger.info(f"Updated QoE for Venue {venue.name}: {qoe_score}/100")
-            
-            # Cache QoE tags for quick access (Constitutional: Section 3.3)
-            await cache.set(
-                f"venue:{ve.venue_id}:qoe_tags",
-                qoe_tags,
-                ttl=CacheTTL.SEMI_DYNAMIC  # 7 days - tags change infrequently
+            # Trigger alert if override detected
+            if result["override"]:
+                self.trigger_interventional_alert(str(event.id), event.sport)
+        
+        await self._gather_venues(venue_events, check)
+    
+    async def _check_venue_live(self, venue_id: str) -> Dict[str, Any]:
+        """
+        Scrape + DTSS for one venue and record its QoE (event independent).
+        
+        Incremental: only posts newer than the venue's watermark are fetched
+        and analyzed; the result is derived from the window of the latest
+        analyses, so an unchanged feed costs one Redis read and no LLM call.
+        
+        Returns:
+            {"confidence": highest event confidence, "override": bool,
+             "new_posts": posts analyzed in this check}
+        """
+        platform = "instagram"
+        prefetched = self._live_posts.get(venue_id)
+        
+        # 1. Acquire Data (Layer A)
+        if prefetched is not None:
+            # Posts newer than the watermark, from the batch's batched scrape
+            state, fetched = await prefetched
+            if fetched.error:
+                raise ScraperError(fetched.error)
+            posts = fetched.posts
+        else:
+            # Fetch posts newer than the watermark from Scraper Service (Abstracts Instagram/Facebook/Mock)
+            state = await dtss_service.get_post_state(venue_id, platform)
+            with self.stages.track("scrape"):
+                posts = await scraper_service.fetch_recent_posts(
+                    venue_id=venue_id,
+                    platform=platform,
+                    limit=3,
+                    since=state["watermark"]
+                )
+        
+        # 2. Analyze new posts (DTSS), carry forward the rest
+        with self.stages.track("analyze"):
+            result = await dtss_service.analyze_new_venue_posts(
+                venue_id, posts, state, platform=platform, window_size=3, cache_writes=self.cache_writes
             )
+        
+        highest_confidence = 0.0
+        analysis = None
+        
+        for analysis in result["window"]:
+            # Keep the highest confidence found among recent posts
+            if analysis["event_confidence"] > highest_confidence:
+                highest_confidence = analysis["event_confidence"]
             
-            # Trigger alert if override detected
+            # If ANY post says they are closed, stop checking this venue (Fail-Safe)
             if analysis["override_status"]:
-                await self.trigger_interventional_alert(str(event.id))
+                break
+        
+        if analysis is None:
+            # No posts: nothing to derive QoE from
+            return {"confidence": highest_confidence, "override": False, "new_posts": 0}
+        
+        if result["carried_forward"]:
+            # Same posts as last run: QoE and its cached tags are already up to date
+            return {"confidence": highest_confidence, "override": bool(analysis["override_status"]), "new_posts": 0}
+        
+        # Calculate and update QoE Score (Constitutional: Section 3.2)
+        qoe_tags = qoe_calculator.generate_tags_from_dtss(analysis)
+        qoe_score = qoe_calculator.calculate_score(qoe_tags)
+        
+        # Update venue QoE score in database (derivative data)
+        self.writer.record_venue_qoe(venue_id, qoe_score)
+        self.dirty_tags.add(QOE_TAG)
+        logger.info(f"Updated QoE for Venue {venue_id}: {qoe_score}/100")
+        
+        # Cache QoE tags for quick access (Constitutional: Section 3.3)
+        self.cache_writes.set(
+            f"venue:{venue_id}:qoe_tags",
+            qoe_tags,
+            ttl=CacheTTL.SEMI_DYNAMIC  # 7 days - tags change infrequently
+        )
+        
+        return {
+            "confidence": highest_confidence,
+            "override": bool(analysis["override_status"]),
+            "new_posts": result["new_posts"]
+        }
     
     async def _verify_social_posts(self, event: Event) -> None:
         """
@@ -210,13 +475,17 @@ class EventProcessor:
         """
         logger.info(f"[T-24] Social validation for: {event.title}")
         
-        result = await self.db.execute(
-            select(VenueEvent).where(VenueEvent.event_id == event.id)
-        )
-        venue_events = result.scalars().all()
+        with self.stages.track("db"):
+            venue_events = await self.writer.venue_links(event.id)
         
-        for ve in venue_events:
-            posts = await scraper_service.fetch_recent_posts(str(ve.venue_id), limit=5)
+        async def check(ve: VenueEvent) -> None:
+            venue_id = str(ve.venue_id)
+            # Raw posts: memo key lives in the raw: namespace (Redis only, Doctrine 1.1)
+            posts = await self.venue_memo.get_or_load(
+                f"raw:venue_posts:{venue_id}:instagram:5",
+                lambda: self._scrape(venue_id, limit=5),
+                kind="posts"
+            )
             
             confirmed = False
             for post in posts:
@@ -228,6 +497,12 @@ class EventProcessor:
             if confirmed:
                 logger.info(f"Venue {ve.venue_id} confirmed event {event.title} via social")
                 # Could update a 'social_confirmed' flag on VenueEvent model if it existed
+        
+        await self._gather_venues(venue_events, check)
+    
+    async def _scrape(self, venue_id: str, limit: int) -> List[Dict[str, Any]]:
+        with self.stages.track("scrape"):
+            return await scraper_service.fetch_recent_posts(venue_id, limit=limit)
     
     async def _update_prediction_score(self, event: Event) -> None:
         """T-7 Verification: Historical prediction"""
@@ -235,52 +510,29 @@ class EventProcessor:
         # Implement historical pattern analysis here
         pass
     
-    async def update_event_confidence(self, event_id: str, score: float) -> bool:
+    def update_event_confidence(self, event_id: str, score: float, position: int = 0) -> None:
         """
         Update event confidence score (Derivative data - PostgreSQL safe).
         
+        Recorded on self.writer and written with the rest of the batch; with
+        several venues, the one at the highest venue link `position` wins.
         Constitutional Compliance: Only stores derivative score, not raw data.
         """
-        try:
-            result = await self.db.execute(
-                select(Event).where(Event.id == event_id)
-            )
-            event = result.scalars().first()
-            
-            if event:
-                # Store derivative only
-                event.confidence_score = score
-                event.last_verified = datetime.utcnow()
-                await self.db.commit()
-                
-                logger.info(f"Updated confidence for event {event_id}: {score:.2f}")
-                return True
-            
-            return False
-            
-        except Exception as e:
-            logger.error(f"Failed to update confidence: {str(e)}")
-            await self.db.rollback()
-            return False
+        self.writer.record_confidence(event_id, score, position)
+        logger.info(f"Updated confidence for event {event_id}: {score:.2f}")
     
-    async def trigger_interventional_alert(self, event_id: str) -> None:
+    def trigger_interventional_alert(self, event_id: str, sport: Optional[str] = None) -> None:
         """
         Fail-Safe Trigger: Send alert when venue override detected.
         
         Examples: 'Private Event', 'Closed', 'Sold Out'
+        The cancellation is written with the rest of the batch.
         """
         logger.warning(f"🚨 INTERVENTIONAL ALERT triggered for Event {event_id}")
         
         # Update event status
-        result = await self.db.execute(
-            select(Event).where(Event.id == event_id)
-        )
-        event = result.scalars().first()
+        self.writer.record_override(event_id, "Venue reported unavailable")
+        self.dirty_tags.add(events_tag(sport))
         
-        if event:
-            event.status = "cancelled"  # or create new status "overridden"
-            event.override_reason = "Venue reported unavailable"
-            await self.db.commit()
-            
-            # In production: Send push notification, update frontend, etc.
-            logger.info(f"Event {event_id} marked as cancelled due to override")
+        # In production: Send push notification, update frontend, etc.
+        logger.info(f"Event {event_id} marked as cancelled due to override")
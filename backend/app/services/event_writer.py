@@ -0,0 +1,205 @@
+"""
+Event Writer - Unit of work for EventProcessor database writes
+
+An AsyncSession must not be used by two coroutines at once, and a run
+used to cost a re-SELECT plus a COMMIT per confidence update, per QoE
+update and per override. Concurrent event/venue tasks therefore only
+*record* their results here; flush() applies them at the end of the batch:
+
+- one executemany UPDATE per kind (event confidence, venue QoE, overrides)
+- one COMMIT for the whole batch
+
+Reads (venue_links) and flush() share one lock, so the session is never
+used concurrently. Instances loaded in the session (e.g. the batch's
+events) are updated in place, so callers see the new status right after
+flush().
+
+Metrics (GET /admin/metrics):
+- mosport_event_writer_records_total{kind}: results recorded
+- mosport_event_writer_round_trips_total{mode}: 'batched' statements +
+  commits actually sent vs 'per_record' (SELECT + UPDATE + COMMIT per
+  result, the previous pattern); the difference is the saving
+"""
+
+import asyncio
+import logging
+import uuid
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import bindparam, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy.orm.util import identity_key
+
+from app.core.metrics import registry
+from app.models.models import Event, Venue, VenueEvent
+
+logger = logging.getLogger(__name__)
+
+WRITER_RECORDS = registry.counter(
+    "mosport_event_writer_records_total", "Verification results recorded by kind (confidence, qoe, override)"
+)
+WRITER_ROUND_TRIPS = registry.counter(
+    "mosport_event_writer_round_trips_total",
+    "DB round trips for verification writes: 'batched' (sent) vs 'per_record' (previous pattern)"
+)
+
+# SELECT + UPDATE + COMMIT per result before batching
+_PER_RECORD_ROUND_TRIPS = 3
+
+_events = Event.__table__
+_venues = Venue.__table__
+
+
+def _uuid(value) -> uuid.UUID:
+    return value if isinstance(value, uuid.UUID) else uuid.UUID(str(value))
+
+
+class EventWriter:
+    """Collects verification results of a batch and writes them in bulk"""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+        self._lock = asyncio.Lock()
+        # Per event: (venue link position, score); the last linked venue wins
+        self._confidence: Dict[uuid.UUID, Tuple[int, float]] = {}
+        self._qoe: Dict[uuid.UUID, float] = {}
+        self._overrides: Dict[uuid.UUID, str] = {}
+        self._records = 0
+
+    def __len__(self) -> int:
+        return len(self._confidence) + len(self._qoe) + len(self._overrides)
+
+    async def venue_links(self, event_id) -> List[VenueEvent]:
+        """VenueEvent rows of one event"""
+        async with self._lock:
+            result = await self.db.execute(
+                select(VenueEvent).where(VenueEvent.event_id == event_id)
+            )
+            return result.scalars().all()
+
+    async def venue_ids_for(self, event_ids) -> List[uuid.UUID]:
+        """Distinct venues linked to any of the events (one query)"""
+        async with self._lock:
+            result = await self.db.execute(
+                select(VenueEvent.venue_id)
+                .where(VenueEvent.event_id.in_([_uuid(event_id) for event_id in event_ids]))
+                .distinct()
+            )
+            return result.scalars().all()
+
+    def record_confidence(self, event_id, score: float, position: int = 0) -> None:
+        """
+        Event confidence = score of the venue written last, as when venues
+        were checked one after another: `position` is the venue's index in
+        the event's venue links, so concurrent checks finishing in any order
+        give the same result.
+        """
+        key = _uuid(event_id)
+        current = self._confidence.get(key)
+        if current is None or position >= current[0]:
+            self._confidence[key] = (position, score)
+        self._count("confidence")
+
+    def pending_confidence(self, event_id) -> Optional[float]:
+        """Confidence recorded for an event and not flushed yet"""
+        pending = self._confidence.get(_uuid(event_id))
+        return None if pending is None else pending[1]
+
+    def record_venue_qoe(self, venue_id, qoe_score: float) -> None:
+        """QoE score 0-100 (stored normalized to 0.0-1.0)"""
+        self._qoe[_uuid(venue_id)] = qoe_score / 100
+        self._count("qoe")
+
+    def record_override(self, event_id, reason: str) -> None:
+        """Cancel the event (fail-safe after a venue override)"""
+        self._overrides[_uuid(event_id)] = reason
+        self._count("override")
+
+    async def flush(self) -> Optional[int]:
+        """
+        Apply all recorded results: one UPDATE per kind, one COMMIT.
+
+        Returns:
+            Number of recorded results written, or None if the write failed
+            (rolled back; the results are lost, so callers must not persist
+            state derived from them, e.g. post watermarks)
+        """
+        async with self._lock:
+            if not len(self):
+                return 0
+            confidence = {k: score for k, (_, score) in self._confidence.items()}
+            qoe, overrides = self._qoe, self._overrides
+            records = self._records
+            self._confidence, self._qoe, self._overrides, self._records = {}, {}, {}, 0
+
+            now = datetime.utcnow()
+            statements = 0
+            try:
+                if confidence:
+                    await self.db.execute(
+                        update(_events)
+                        .where(_events.c.id == bindparam("_id"))
+                        .values(confidence_score=bindparam("_score"), last_verified=bindparam("_at")),
+                        [{"_id": k, "_score": v, "_at": now} for k, v in confidence.items()]
+                    )
+                    statements += 1
+                if qoe:
+                    await self.db.execute(
+                        update(_venues)
+                        .where(_venues.c.id == bindparam("_id"))
+                        .values(qoe_score=bindparam("_score")),
+                        [{"_id": k, "_score": v} for k, v in qoe.items()]
+                    )
+                    statements += 1
+                if overrides:
+                    await self.db.execute(
+                        update(_events)
+                        .where(_events.c.id == bindparam("_id"))
+                        .values(status="cancelled", override_reason=bindparam("_reason")),
+                        [{"_id": k, "_reason": v} for k, v in overrides.items()]
+                    )
+                    statements += 1
+                await self.db.commit()
+            except Exception as e:
+                logger.error(f"Batch write of {records} verification results failed: {str(e)}")
+                await self.db.rollback()
+                return None
+
+            WRITER_ROUND_TRIPS.inc(statements + 1, mode="batched")
+            WRITER_ROUND_TRIPS.inc(records * _PER_RECORD_ROUND_TRIPS, mode="per_record")
+            logger.info(
+                f"💾 Wrote {records} verification results in {statements} statements + 1 commit "
+                f"(was {records * _PER_RECORD_ROUND_TRIPS} round trips)"
+            )
+
+            self._sync_loaded(confidence, qoe, overrides, now)
+            return records
+
+    def _count(self, kind: str) -> None:
+        self._records += 1
+        WRITER_RECORDS.inc(kind=kind)
+
+    def _sync_loaded(self, confidence, qoe, overrides, now: datetime) -> None:
+        """Core UPDATEs bypass the ORM: mirror them onto instances already loaded"""
+        identity_map = self.db.identity_map
+
+        def loaded(model, pk):
+            return identity_map.get(identity_key(model, pk))
+
+        for pk, score in confidence.items():
+            event = loaded(Event, pk)
+            if event is not None:
+                set_committed_value(event, "confidence_score", score)
+                set_committed_value(event, "last_verified", now)
+        for pk, score in qoe.items():
+            venue = loaded(Venue, pk)
+            if venue is not None:
+                set_committed_value(venue, "qoe_score", score)
+        for pk, reason in overrides.items():
+            event = loaded(Event, pk)
+            if event is not None:
+                set_committed_value(event, "status", "cancelled")
+                set_committed_value(event, "override_reason", reason)
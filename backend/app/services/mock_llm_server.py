@@ -0,0 +1,196 @@
+"""
+Mock LLM Server - Local OpenAI-compatible stand-in for AIJudge
+
+Serves POST /v1/chat/completions with deterministic keyword judgments in
+the shapes AIJudge asks for: one {is_match, confidence, tags} object for
+evaluate_post, {results: [...]} for the numbered posts of evaluate_posts.
+It models what makes batching interesting - per-request latency plus
+per-token generation time, a context window (400 context_length_exceeded)
+and max_tokens truncation (finish_reason 'length') - so batching and
+adaptive splitting can be tested and benchmarked offline. Standard
+library only (see MockHTTPServer).
+
+Run standalone (from backend/):
+    python -m app.services.mock_llm_server --port 8098 --latency 0.4
+    OPENAI_API_KEY=stub OPENAI_BASE_URL=http://127.0.0.1:8098/v1 uvicorn app.main:app
+
+Or in-process (benchmarks):
+    async with MockLLMServer(latency=0.4) as server:
+        judge = AIJudge(api_key="stub", base_url=server.base_url)
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import math
+import random
+import re
+import time
+from typing import Any, Dict, Optional, Tuple
+
+from app.services.mock_social_server import MockHTTPServer
+
+logger = logging.getLogger(__name__)
+
+_NUMBERED_POST = re.compile(r"^Post (?P<index>\d+): (?P<text>.*)$", re.DOTALL)
+_IMAGE_TOKENS = 765
+
+
+class MockLLMServer(MockHTTPServer):
+    """
+    Args:
+        host, port: Bind address (port 0 = any free port, see .base_url)
+        latency: Fixed delay per request in seconds (time to first token)
+        token_latency: Generation delay per completion token
+        context_window: Prompt + max_tokens limit per request
+        error_rate: Share of requests answered with 503
+        drop_rate: Share of posts left out of batch results (model sloppiness)
+        seed: Seed for error/drop draws (reproducible runs)
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: float = 0.4,
+        token_latency: float = 0.002,
+        context_window: int = 128000,
+        error_rate: float = 0.0,
+        drop_rate: float = 0.0,
+        seed: Optional[int] = None
+    ):
+        super().__init__(host, port)
+        self.latency = latency
+        self.token_latency = token_latency
+        self.context_window = context_window
+        self.error_rate = error_rate
+        self.drop_rate = drop_rate
+        self.posts = 0
+        self._rng = random.Random(seed)
+
+    @property
+    def base_url(self) -> str:
+        return f"{self.url}/v1"
+
+    async def _respond(self, method: str, target: str, body: bytes) -> Tuple[int, dict]:
+        if method != "POST" or target.split("?")[0] != "/v1/chat/completions":
+            return 404, {"error": {"message": "not found", "type": "invalid_request_error", "code": None}}
+        try:
+            request = json.loads(body)
+            messages = request["messages"]
+        except (ValueError, KeyError):
+            return 400, {"error": {"message": "invalid request body", "type": "invalid_request_error", "code": None}}
+
+        prompt_tokens = sum(self._tokens(message.get("content")) for message in messages)
+        max_tokens = request.get("max_tokens") or 4096
+        if prompt_tokens + max_tokens > self.context_window:
+            return 400, {"error": {
+                "message": f"This model's maximum context length is {self.context_window} tokens. "
+                           f"However, you requested {prompt_tokens + max_tokens} tokens.",
+                "type": "invalid_request_error",
+                "param": "messages",
+                "code": "context_length_exceeded"
+            }}
+        if self._rng.random() < self.error_rate:
+            await asyncio.sleep(self.latency)
+            return 503, {"error": {"message": "upstream overloaded", "type": "server_error", "code": None}}
+
+        content = json.dumps(self._judge(messages[-1].get("content")))
+        completion_tokens = math.ceil(len(content) / 4)
+        finish_reason = "stop"
+        if completion_tokens > max_tokens:
+            content = content[:max_tokens * 4]
+            completion_tokens = max_tokens
+            finish_reason = "length"
+        await asyncio.sleep(self.latency + completion_tokens * self.token_latency)
+
+        return 200, {
+            "id": f"chatcmpl-mock-{self.requests}",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": request.get("model", "mock"),
+            "choices": [{
+                "index": 0,
+                "message": {"role": "assistant", "content": content},
+                "finish_reason": finish_reason
+            }],
+            "usage": {
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": completion_tokens,
+                "total_tokens": prompt_tokens + completion_tokens
+            }
+        }
+
+    def _judge(self, content: Any) -> Dict[str, Any]:
+        parts = content if isinstance(content, list) else [{"type": "text", "text": content or ""}]
+        numbered = []
+        for part in parts:
+            match = _NUMBERED_POST.match(part.get("text", "")) if part.get("type") == "text" else None
+            if match:
+                numbered.append((int(match["index"]), match["text"]))
+        if not numbered:
+            # evaluate_post: "Post: <text>"
+            text = " ".join(part.get("text", "") for part in parts if part.get("type") == "text")
+            self.posts += 1
+            return self._judgment(text)
+
+        self.posts += len(numbered)
+        results = []
+        for index, text in numbered:
+            if self._rng.random() < self.drop_rate:
+                continue
+            results.append({"index": index, **self._judgment(text)})
+        return {"results": results}
+
+    @staticmethod
+    def _judgment(text: str) -> Dict[str, Any]:
+        text_lower = text.lower()
+        if any(kw in text_lower for kw in ("closed", "private event", "sold out")):
+            return {"is_match": False, "confidence": 0.9, "tags": ["Closed"]}
+        hits = sum(kw in text_lower for kw in ("live", "match", "football", "league", "wbc"))
+        tags = [tag for kw, tag in (("screen", "Big Screen"), ("sound", "Sound ON")) if kw in text_lower]
+        if hits:
+            return {"is_match": True, "confidence": round(min(0.99, 0.7 + 0.1 * hits), 2), "tags": tags}
+        return {"is_match": False, "confidence": 0.1, "tags": tags}
+
+    @staticmethod
+    def _tokens(content: Any) -> int:
+        if isinstance(content, str):
+            return math.ceil(len(content) / 4) + 4
+        tokens = 4
+        for part in content or []:
+            if part.get("type") == "image_url":
+                tokens += _IMAGE_TOKENS
+            else:
+                tokens += math.ceil(len(part.get("text", "")) / 4)
+        return tokens
+
+
+async def main(host: str, port: int, latency: float, context_window: int, error_rate: float,
+               drop_rate: float, seed: Optional[int]) -> None:
+    server = MockLLMServer(host, port, latency, context_window=context_window, error_rate=error_rate,
+                           drop_rate=drop_rate, seed=seed)
+    await server.start()
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await server.stop()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    parser = argparse.ArgumentParser(description="Mock OpenAI-compatible chat completions API")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8098)
+    parser.add_argument("--latency", type=float, default=0.4, help="Delay per request (s)")
+    parser.add_argument("--context-window", type=int, default=128000)
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Share of 503 responses")
+    parser.add_argument("--drop-rate", type=float, default=0.0, help="Share of posts missing from batch results")
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+    try:
+        asyncio.run(main(args.host, args.port, args.latency, args.context_window, args.error_rate,
+                         args.drop_rate, args.seed))
+    except KeyboardInterrupt:
+        pass
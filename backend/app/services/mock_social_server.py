@@ -0,0 +1,228 @@
+"""
+Mock Social Server - Local stand-in for the scraper HTTP API
+
+Serves the HTTP backend contract (services/scraper_backends.py) from
+generated posts (MockPostGenerator, so feeds match the in-process mock
+backend for the same profile), with configurable latency and error rate,
+so the HTTP backend (pooling, pacing, retries) can be exercised and benchmarked
+offline. Standard library only (asyncio), HTTP/1.1 with keep-alive; the
+server core (MockHTTPServer) is shared with services/mock_llm_server.py.
+
+Run standalone (from backend/):
+    python -m app.services.mock_social_server --port 8099 --latency 0.05 --error-rate 0.02
+    SCRAPER_BACKEND=http SCRAPER_HTTP_BASE_URL=http://127.0.0.1:8099 uvicorn app.main:app
+
+Or in-process (benchmarks):
+    async with MockSocialServer(latency=0.05) as server:
+        backend = HTTPBackend(server.url)
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import random
+import re
+from typing import Optional, Set, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from app.services.scraper_backends import MockPostGenerator, MockProfile
+
+logger = logging.getLogger(__name__)
+
+_POSTS_PATH = re.compile(r"^/v1/(?P<platform>[\w-]+)/venues/(?P<venue_id>[^/]+)/posts$")
+_BATCH_PATH = re.compile(r"^/v1/(?P<platform>[\w-]+)/posts$")
+
+_REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 429: "Too Many Requests", 503: "Service Unavailable"}
+
+
+class MockHTTPServer:
+    """
+    Minimal asyncio HTTP/1.1 JSON server with keep-alive; subclasses
+    implement _respond(method, target, body) -> (status, json body).
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0):
+        self.host = host
+        self.port = port
+        self.requests = 0
+        self.connections = 0
+        self._server: Optional[asyncio.base_events.Server] = None
+        self._handlers: Set[asyncio.Task] = set()
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    async def start(self) -> None:
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        logger.info(f"🧪 {type(self).__name__} listening on {self.url}")
+
+    async def stop(self) -> None:
+        """Stop listening and close open (keep-alive) connections"""
+        if self._server is None:
+            return
+        self._server.close()
+        handlers, self._handlers = self._handlers, set()
+        for task in handlers:
+            task.cancel()
+        await asyncio.gather(*handlers, return_exceptions=True)
+        await self._server.wait_closed()
+        self._server = None
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.stop()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.connections += 1
+        task = asyncio.current_task()
+        self._handlers.add(task)
+        try:
+            while True:
+                try:
+                    request = await self._read_request(reader)
+                except ValueError as e:
+                    # Malformed request line or headers: answer and drop the connection
+                    await self._write_response(writer, 400, {"error": f"bad request: {e}"}, keep_alive=False)
+                    break
+                if request is None:
+                    break
+                method, target, body, keep_alive = request
+                self.requests += 1
+                status, payload = await self._respond(method, target, body)
+                await self._write_response(writer, status, payload, keep_alive)
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        except asyncio.CancelledError:
+            # stop() while the connection was open (idle keep-alive or mid-response)
+            pass
+        finally:
+            self._handlers.discard(task)
+            writer.close()
+
+    @staticmethod
+    async def _write_response(writer: asyncio.StreamWriter, status: int, payload: dict, keep_alive: bool) -> None:
+        body = json.dumps(payload).encode()
+        writer.write(
+            f"HTTP/1.1 {status} {_REASONS.get(status, 'Error')}\r\n"
+            f"Content-Type: application/json\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n".encode() + body
+        )
+        await writer.drain()
+
+    async def _read_request(self, reader: asyncio.StreamReader) -> Optional[Tuple[str, str, bytes, bool]]:
+        """Next request on the connection, None at EOF; ValueError if malformed"""
+        request_line = await reader.readline()
+        if not request_line:
+            return None
+        parts = request_line.decode("latin-1").split(" ", 2)
+        if len(parts) != 3 or not parts[2].strip().startswith("HTTP/"):
+            raise ValueError(f"malformed request line {request_line[:100]!r}")
+        method, target, version = parts
+        headers = {}
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+        length = int(headers.get("content-length", 0))  # ValueError if not a number
+        if length < 0:
+            raise ValueError("negative content-length")
+        body = await reader.readexactly(length) if length else b""
+        connection = headers.get("connection", "").lower()
+        keep_alive = connection != "close" if version.strip() == "HTTP/1.1" else connection == "keep-alive"
+        return method, target, body, keep_alive
+
+    async def _respond(self, method: str, target: str, body: bytes) -> Tuple[int, dict]:
+        raise NotImplementedError
+
+
+class MockSocialServer(MockHTTPServer):
+    """
+    Args:
+        host, port: Bind address (port 0 = any free port, see .url)
+        latency: Mean response delay in seconds (exponentially distributed)
+        error_rate: Share of requests answered with 503
+        venue_error_rate: Share of venues reported as failed inside batch responses
+        seed: Seed for latency/error draws (reproducible runs)
+        profile: Feed shape (volume, languages, overrides); defaults to the
+            SCRAPER_MOCK_* settings
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: float = 0.05,
+        error_rate: float = 0.0,
+        seed: Optional[int] = None,
+        venue_error_rate: float = 0.0,
+        profile: Optional[MockProfile] = None
+    ):
+        super().__init__(host, port)
+        self.latency = latency
+        self.error_rate = error_rate
+        self.venue_error_rate = venue_error_rate
+        self._rng = random.Random(seed)
+        self._posts = MockPostGenerator(profile or MockProfile.from_settings())
+
+    async def _respond(self, method: str, target: str, body: bytes) -> Tuple[int, dict]:
+        if self.latency > 0:
+            await asyncio.sleep(self._rng.expovariate(1 / self.latency))
+        url = urlsplit(target)
+        single = _POSTS_PATH.match(url.path)
+        batch = _BATCH_PATH.match(url.path)
+        if method != "GET" or (single is None and batch is None):
+            return 404, {"error": "not found"}
+        if self._rng.random() < self.error_rate:
+            return 503, {"error": "upstream unavailable"}
+        query = parse_qs(url.query)
+        try:
+            limit = min(int(query.get("limit", ["5"])[0]), 50)
+        except ValueError:
+            return 400, {"error": "invalid limit"}
+        if single is not None:
+            return 200, {"posts": self._posts.posts(single["venue_id"], limit, single["platform"])}
+        
+        results = {}
+        for venue_id in filter(None, query.get("venue_ids", [""])[0].split(",")):
+            if self._rng.random() < self.venue_error_rate:
+                results[venue_id] = {"error": "profile unavailable"}
+            else:
+                results[venue_id] = {"posts": self._posts.posts(venue_id, limit, batch["platform"])}
+        return 200, {"results": results}
+
+
+async def main(host: str, port: int, latency: float, error_rate: float, seed: Optional[int],
+               venue_error_rate: float) -> None:
+    server = MockSocialServer(host, port, latency, error_rate, seed, venue_error_rate)
+    await server.start()
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await server.stop()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    parser = argparse.ArgumentParser(description="Mock social media scraper API")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8099)
+    parser.add_argument("--latency", type=float, default=0.05, help="Mean response delay (s)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Share of 503 responses")
+    parser.add_argument("--venue-error-rate", type=float, default=0.0, help="Share of failed venues in batches")
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+    try:
+        asyncio.run(main(args.host, args.port, args.latency, args.error_rate, args.seed, args.venue_error_rate))
+    except KeyboardInterrupt:
+        pass
@@ -9,69 +9,139 @@ It MUST pass raw data to DTSS for analysis and transient storage (Redis).
 
 import logging
 import asyncio
-from typing import List, Dict, Any, Optional
-from datetime import datetime, timedelta
-import random
+from typing import List, Dict, Any, AsyncIterator, Iterable, Optional
+
+from app.core.config import settings
+from app.services.scraper_backends import ScraperBackend, TokenBucket, VenuePosts, create_backend
+from app.services.watermarks import is_newer
 
 logger = logging.getLogger(__name__)
 
 class ScraperService:
     """
     Unified interface for acquiring social media data.
-    Currently supports: MOCK
-    Planned: Instagram, Facebook
+    Backends: mock (default), http (see services/scraper_backends.py)
+    Platforms: instagram, facebook
     """
     
-    def __init__(self):
+    def __init__(self, backend: Optional[ScraperBackend] = None):
         self.sources = ["instagram", "facebook"]
+        self._backend = backend
+        # platform -> semaphore bounding concurrent requests (rate limits / bans)
+        self._platform_slots: Dict[str, asyncio.Semaphore] = {}
+        # platform -> token bucket pacing request starts
+        self._platform_buckets: Dict[str, TokenBucket] = {}
 
-    async def fetch_recent_posts(self, venue_id: str, platform: str = "instagram", limit: int = 5) -> List[Dict[str, Any]]:
-        """
-        Fetch recent posts for a venue.
-        In production, this would call Apify or a custom scraper.
+    @property
+    def backend(self) -> ScraperBackend:
+        # Created lazily: the HTTP client must be bound to the running loop
+        if self._backend is None:
+            self._backend = create_backend()
+            logger.info(f"🕸️ Scraper backend: {type(self._backend).__name__}")
+        return self._backend
+
+    async def close(self) -> None:
+        if self._backend is not None:
+            await self._backend.close()
+            self._backend = None
+
+    def _slots(self, platform: str) -> asyncio.Semaphore:
+        slots = self._platform_slots.get(platform)
+        if slots is None:
+            limit = settings.SCRAPER_PLATFORM_LIMITS.get(platform, settings.SCRAPER_PLATFORM_CONCURRENCY)
+            slots = self._platform_slots[platform] = asyncio.Semaphore(limit)
+        return slots
+
+    def _bucket(self, platform: str) -> TokenBucket:
+        bucket = self._platform_buckets.get(platform)
+        if bucket is None:
+            rate = settings.SCRAPER_PLATFORM_RATES.get(platform, settings.SCRAPER_PLATFORM_RATE)
+            if not getattr(self.backend, "paced", True):
+                rate = 0  # Mock provider: pacing would only slow down simulations
+            bucket = self._platform_buckets[platform] = TokenBucket(rate, settings.SCRAPER_PLATFORM_BURST)
+        return bucket
+
+    async def fetch_recent_posts(
+        self,
+        venue_id: str,
+        platform: str = "instagram",
+        limit: int = 5,
+        since: Optional[Dict[str, Any]] = None
+    ) -> List[Dict[str, Any]]:
         """
-        logger.info(f"Refetching {platform} posts for venue {venue_id} (Limit: {limit})")
+        Fetch recent posts for a venue, newest first.
         
-        # Simulate network delay
-        await asyncio.sleep(0.5)
+        At most SCRAPER_PLATFORM_CONCURRENCY (or the platform's entry in
+        SCRAPER_PLATFORM_LIMITS) requests per platform run at once, and they
+        start at no more than SCRAPER_PLATFORM_RATE (SCRAPER_PLATFORM_RATES)
+        per second, in bursts of up to SCRAPER_PLATFORM_BURST. Backends
+        with `paced = False` (the mock) are not paced.
         
-        # Mock Logic (Layer A)
-        # Returns raw data structure
-        return self._generate_mock_posts(venue_id, limit)
-
-    def _generate_mock_posts(self, venue_id: str, count: int) -> List[Dict[str, Any]]:
+        Args:
+            since: Post watermark ({"post_id", "timestamp"}); only posts
+                newer than it are returned (see services/watermarks.py)
+        
+        Raises:
+            ScraperError: The backend gave up (retries exhausted)
         """
-        Generates realistic mock social media posts for testing DTSS.
+        async with self._slots(platform):
+            await self._bucket(platform).acquire()
+            logger.info(f"Refetching {platform} posts for venue {venue_id} (Limit: {limit})")
+            posts = await self.backend.fetch_posts(venue_id, platform, limit)
+        
+        if since:
+            posts = [post for post in posts if is_newer(post, since)]
+        return posts
+
+    async def fetch_recent_posts_many(
+        self,
+        venue_ids: Iterable[str],
+        platform: str = "instagram",
+        limit: int = 5,
+        since: Optional[Dict[str, Dict[str, Any]]] = None,
+        batch_size: Optional[int] = None
+    ) -> AsyncIterator[VenuePosts]:
         """
-        keywords = [
-            "Live Match", "Champions League", "Sound ON 🔊", "Full House", 
-            "Beer Promos", "Closed for private event", "Open till late", "Big Screen"
-        ]
+        Fetch recent posts for many venues, streamed as batches complete.
         
-        images = [
-            "https://example.com/stadium.jpg",
-            "https://example.com/crowd.jpg",
-            "https://example.com/tv_screen.jpg",
-            None # Text only
-        ]
+        Venues are grouped into batches of SCRAPER_BATCH_SIZE (or the
+        platform's entry in SCRAPER_PLATFORM_BATCH_SIZES); each batch is one
+        provider request under the same platform caps and pacing as
+        fetch_recent_posts. A failed venue - or a failed batch - yields
+        VenuePosts with `error` set for the venues concerned; the others
+        are unaffected.
         
-        posts = []
-        for i in range(count):
-            text = f"{random.choice(keywords)} - {random.choice(['Come join us!', 'Tonight!', 'Book now'])}"
-            
-            # Make one post explicitly have "CLOSED" to test overrides
-            if i == 0 and random.random() < 0.1:
-                text = "Sorry we are CLOSED for a private wedding tonight."
-            
-            posts.append({
-                "id": f"post_{venue_id}_{random.randint(1000,9999)}",
-                "text": text,
-                "image_url": random.choice(images),
-                "timestamp": (datetime.utcnow() - timedelta(hours=i*2)).isoformat(),
-                "likes": random.randint(10, 500),
-                "platform": "instagram"
-            })
-            
-        return posts
+        Usage:
+            async for result in scraper_service.fetch_recent_posts_many(venue_ids, limit=3):
+                if result.error: ...
+        
+        Args:
+            since: venue_id -> post watermark; only newer posts are returned
+        """
+        venue_ids = list(dict.fromkeys(str(venue_id) for venue_id in venue_ids))
+        size = max(1, batch_size or settings.SCRAPER_PLATFORM_BATCH_SIZES.get(platform, settings.SCRAPER_BATCH_SIZE))
+        batches = [venue_ids[i:i + size] for i in range(0, len(venue_ids), size)]
+        tasks = [asyncio.ensure_future(self._fetch_batch(batch, platform, limit)) for batch in batches]
+        try:
+            for next_batch in asyncio.as_completed(tasks):
+                for result in await next_batch:
+                    watermark = since.get(result.venue_id) if since else None
+                    if watermark and result.posts:
+                        result = result._replace(posts=[post for post in result.posts if is_newer(post, watermark)])
+                    yield result
+        finally:
+            # Consumer stopped early: do not leave requests running
+            for task in tasks:
+                task.cancel()
+
+    async def _fetch_batch(self, venue_ids: List[str], platform: str, limit: int) -> List[VenuePosts]:
+        async with self._slots(platform):
+            await self._bucket(platform).acquire()
+            logger.info(f"Refetching {platform} posts for {len(venue_ids)} venues (Limit: {limit})")
+            try:
+                return await self.backend.fetch_posts_many(venue_ids, platform, limit)
+            except Exception as e:
+                logger.warning(f"Batch fetch of {len(venue_ids)} {platform} venues failed: {e}")
+                return [VenuePosts(venue_id, [], str(e)) for venue_id in venue_ids]
 
 scraper_service = ScraperService()
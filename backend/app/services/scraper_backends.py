@@ -0,0 +1,429 @@
+"""
+Scraper Backends - Pluggable acquisition for ScraperService (Layer A)
+
+ScraperService owns the cross-cutting policy (per-platform concurrency
+caps, token-bucket pacing, watermark filtering); a backend only turns
+(venue, platform, limit) into raw posts:
+
+- 'mock': deterministic in-process posts and provider behaviour
+  (development, default; seeded load profiles via SCRAPER_MOCK_*)
+- 'http': async HTTP client with keep-alive connection pooling, timeouts
+  and exponential-backoff retries, against SCRAPER_HTTP_BASE_URL (Apify or
+  a custom scraper; offline: services/mock_social_server.py)
+
+Selected with SCRAPER_BACKEND. HTTP API contract:
+
+    GET {base_url}/v1/{platform}/venues/{venue_id}/posts?limit=N
+    -> 200 {"posts": [{"id", "text", "image_url", "timestamp", "likes", "platform"}, ...]}
+
+429 and 5xx responses, timeouts and connection errors are retried
+(Retry-After is honoured); other 4xx fail immediately.
+
+Batch contract (ScraperService.fetch_recent_posts_many):
+
+    GET {base_url}/v1/{platform}/posts?venue_ids=a,b,c&limit=N
+    -> 200 {"results": {"a": {"posts": [...]}, "b": {"error": "..."}, ...}}
+"""
+
+import asyncio
+import logging
+import math
+import random
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Any, Awaitable, Callable, Dict, List, NamedTuple, Optional, Protocol, Tuple, runtime_checkable
+
+from app.core.config import settings
+from app.core.metrics import registry
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - only needed for SCRAPER_BACKEND='http'
+    httpx = None
+
+logger = logging.getLogger(__name__)
+
+# Seconds; scraper calls range from tens of ms (mock server) to several seconds
+SCRAPER_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+SCRAPER_REQUESTS = registry.counter(
+    "mosport_scraper_requests_total", "Scraper backend requests by platform and outcome (ok, retry, error)"
+)
+SCRAPER_LATENCY = registry.histogram(
+    "mosport_scraper_latency_seconds", "Scraper backend request latency (including retries)", SCRAPER_BUCKETS
+)
+
+
+class ScraperError(Exception):
+    """A fetch failed for good (retries exhausted or non-retryable response)"""
+
+
+class VenuePosts(NamedTuple):
+    """Posts of one venue from a batch fetch; error is set instead if that venue failed"""
+    venue_id: str
+    posts: List[Dict[str, Any]]
+    error: Optional[str] = None
+
+
+@runtime_checkable
+class ScraperBackend(Protocol):
+    """Abstract acquisition backend (mock, HTTP, ...)"""
+
+    # False: no provider quota behind the backend, ScraperService skips pacing
+    paced: bool
+
+    async def fetch_posts(self, venue_id: str, platform: str, limit: int) -> List[Dict[str, Any]]:
+        """Recent posts of a venue, newest first"""
+        ...
+
+    async def fetch_posts_many(self, venue_ids: List[str], platform: str, limit: int) -> List[VenuePosts]:
+        """Recent posts of several venues in one provider request, one entry per venue"""
+        ...
+
+    async def close(self) -> None:
+        """Release connections"""
+        ...
+
+
+class TokenBucket:
+    """
+    In-process token bucket: `rate` requests per second on average, bursts
+    of up to `burst`. Waiters are served in arrival order.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: int,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep
+    ):
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = float(self.burst)
+        self._updated = clock()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        if self.rate <= 0:
+            return  # Pacing disabled
+        async with self._lock:
+            while True:
+                now = self._clock()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await self._sleep((1 - self._tokens) / self.rate)
+
+
+@dataclass
+class MockProfile:
+    """
+    Shape of the simulated feeds and provider (SCRAPER_MOCK_* settings).
+
+    Posts: every venue posts `posts_per_day` times a day on a fixed grid;
+    each post's language follows `languages` (weights) and it is an
+    override ("closed", "private event") with `override_probability`.
+    Content depends only on seed + venue + post time, so every run - and
+    every process - sees the same feeds.
+
+    Provider: each request takes a lognormal latency (median `latency`,
+    spread `latency_sigma`), with `tail_probability` of `tail_latency`
+    instead, and fails with `error_rate`. Draws are seeded per venue and
+    call number, so a run is reproducible regardless of task interleaving.
+    """
+    seed: Optional[int] = None
+    posts_per_day: float = 12
+    languages: Dict[str, float] = field(default_factory=lambda: {"en": 1.0})
+    override_probability: float = 0.035
+    latency: float = 0.5
+    latency_sigma: float = 0.0
+    tail_probability: float = 0.0
+    tail_latency: float = 5.0
+    error_rate: float = 0.0
+    anchor: Optional[datetime] = None  # Fixed "now" for fully repeatable feeds
+
+    @classmethod
+    def from_settings(cls) -> "MockProfile":
+        return cls(
+            seed=settings.SCRAPER_MOCK_SEED,
+            posts_per_day=settings.SCRAPER_MOCK_POSTS_PER_DAY,
+            languages=settings.SCRAPER_MOCK_LANGUAGES,
+            override_probability=settings.SCRAPER_MOCK_OVERRIDE_PROBABILITY,
+            latency=settings.SCRAPER_MOCK_LATENCY,
+            latency_sigma=settings.SCRAPER_MOCK_LATENCY_SIGMA,
+            tail_probability=settings.SCRAPER_MOCK_TAIL_PROBABILITY,
+            tail_latency=settings.SCRAPER_MOCK_TAIL_LATENCY,
+            error_rate=settings.SCRAPER_MOCK_ERROR_RATE,
+            anchor=datetime.fromisoformat(settings.SCRAPER_MOCK_ANCHOR) if settings.SCRAPER_MOCK_ANCHOR else None,
+        )
+
+
+# Caption fragments per language: (openers, calls to action, override notices)
+MOCK_PHRASES = {
+    "en": (
+        ["Live Match", "Champions League", "Sound ON 🔊", "Full House",
+         "Beer Promos", "Closed for private event", "Open till late", "Big Screen"],
+        ["Come join us!", "Tonight!", "Book now"],
+        ["Sorry we are CLOSED for a private wedding tonight.", "Private event tonight - sold out"],
+    ),
+    "vi": (
+        ["Trực tiếp Live Match", "Ngoại hạng Anh", "Màn hình lớn Big Screen", "Bia giảm giá"],
+        ["Đặt bàn ngay!", "Tối nay!", "Hẹn gặp bạn!"],
+        ["Xin lỗi, hôm nay quán CLOSED (private event)."],
+    ),
+    "th": (
+        ["ถ่ายทอดสด Live Match", "พรีเมียร์ลีก", "จอใหญ่ Big Screen", "โปรเบียร์"],
+        ["จองเลย!", "คืนนี้!", "มาเจอกัน!"],
+        ["ขออภัย วันนี้ร้าน CLOSED - private event"],
+    ),
+    "zh": (
+        ["直播 Live Match", "英超", "大屏幕 Big Screen", "啤酒优惠"],
+        ["快来订位!", "今晚见!", "欢迎光临!"],
+        ["抱歉, 今晚包场 private event, CLOSED"],
+    ),
+}
+
+MOCK_IMAGES = [
+    "https://example.com/stadium.jpg",
+    "https://example.com/crowd.jpg",
+    "https://example.com/tv_screen.jpg",
+    None  # Text only
+]
+
+
+class MockPostGenerator:
+    """Deterministic feeds and provider behaviour for a MockProfile"""
+
+    def __init__(self, profile: Optional[MockProfile] = None):
+        self.profile = profile or MockProfile()
+        self.post_interval = timedelta(seconds=86400 / max(self.profile.posts_per_day, 1e-6))
+        languages = {lang: w for lang, w in self.profile.languages.items() if lang in MOCK_PHRASES and w > 0}
+        self._languages = list(languages) or ["en"]
+        self._weights = list(languages.values()) or [1.0]
+        self._calls: Dict[str, int] = {}
+
+    def posts(self, venue_id: str, count: int, platform: str = "instagram") -> List[Dict[str, Any]]:
+        """
+        The venue's latest `count` posts, newest first.
+
+        Posts sit on a fixed grid (one per post interval), so repeated fetches
+        between two posts return the same posts (like a real feed) and
+        watermarks can skip them.
+        """
+        interval = self.post_interval.total_seconds()
+        epoch = datetime(1970, 1, 1)
+        now = self.profile.anchor or datetime.utcnow()
+        elapsed = (now - epoch).total_seconds()
+        latest = epoch + timedelta(seconds=elapsed // interval * interval)
+
+        posts = []
+        for i in range(count):
+            posted_at = latest - self.post_interval * i
+            rng = self._rng(venue_id, posted_at.isoformat())
+            language = rng.choices(self._languages, self._weights)[0]
+            openers, calls, overrides = MOCK_PHRASES[language]
+            text = f"{rng.choice(openers)} - {rng.choice(calls)}"
+
+            # Make some posts explicitly have "CLOSED" to test overrides
+            if rng.random() < self.profile.override_probability:
+                text = rng.choice(overrides)
+
+            posts.append({
+                "id": f"post_{venue_id}_{rng.randint(1000,9999)}",
+                "text": text,
+                "image_url": rng.choice(MOCK_IMAGES),
+                "timestamp": posted_at.isoformat(),
+                "likes": rng.randint(10, 500),
+                "language": language,
+                "platform": platform
+            })
+
+        return posts
+
+    def request_outcome(self, key: str) -> Tuple[float, bool]:
+        """(latency seconds, failed) of the next simulated request for `key` (venue or batch)"""
+        call = self._calls[key] = self._calls.get(key, 0) + 1
+        rng = self._rng(key, f"call:{call}")
+        profile = self.profile
+        if rng.random() < profile.tail_probability:
+            latency = profile.tail_latency
+        elif profile.latency_sigma > 0:
+            latency = rng.lognormvariate(math.log(max(profile.latency, 1e-6)), profile.latency_sigma)
+        else:
+            latency = profile.latency
+        return latency, rng.random() < profile.error_rate
+
+    def _rng(self, *parts: str) -> random.Random:
+        seed = "" if self.profile.seed is None else f"{self.profile.seed}:"
+        return random.Random(seed + ":".join(parts))
+
+
+class MockBackend:
+    """
+    In-process mock provider: MockPostGenerator feeds after simulated
+    latency, failing with the profile's error rate. Unpaced: its latency
+    model stands in for the provider, there is no quota to protect.
+    """
+
+    paced = False
+
+    def __init__(self, profile: Optional[MockProfile] = None):
+        self.generator = MockPostGenerator(profile or MockProfile.from_settings())
+
+    async def fetch_posts(self, venue_id: str, platform: str, limit: int) -> List[Dict[str, Any]]:
+        # Simulate network delay
+        latency, failed = self.generator.request_outcome(f"{platform}:{venue_id}")
+        await asyncio.sleep(latency)
+        if failed:
+            SCRAPER_REQUESTS.inc(platform=platform, outcome="error")
+            raise ScraperError(f"{platform} {venue_id}: simulated provider error")
+        SCRAPER_REQUESTS.inc(platform=platform, outcome="ok")
+        return self.generator.posts(venue_id, limit, platform)
+
+    async def fetch_posts_many(self, venue_ids: List[str], platform: str, limit: int) -> List[VenuePosts]:
+        # One simulated round trip for the whole batch; errors are per venue
+        latency, _ = self.generator.request_outcome(f"{platform}:batch:{venue_ids[0]}:{len(venue_ids)}")
+        await asyncio.sleep(latency)
+        SCRAPER_REQUESTS.inc(platform=platform, outcome="ok")
+        results = []
+        for venue_id in venue_ids:
+            _, failed = self.generator.request_outcome(f"{platform}:{venue_id}")
+            if failed:
+                results.append(VenuePosts(venue_id, [], "simulated provider error"))
+            else:
+                results.append(VenuePosts(venue_id, self.generator.posts(venue_id, limit, platform)))
+        return results
+
+    async def close(self) -> None:
+        pass
+
+
+class HTTPBackend:
+    """
+    Pooled async HTTP backend.
+
+    One httpx.AsyncClient per process keeps up to SCRAPER_HTTP_MAX_CONNECTIONS
+    connections alive, so requests skip TCP/TLS setup. Each request gets
+    SCRAPER_HTTP_TIMEOUT seconds; failures are retried up to
+    SCRAPER_HTTP_RETRIES times with exponential backoff and full jitter
+    (SCRAPER_HTTP_BACKOFF * 2^attempt, capped at SCRAPER_HTTP_BACKOFF_MAX).
+    """
+
+    RETRY_STATUSES = {429, 500, 502, 503, 504}
+    paced = True
+
+    def __init__(
+        self,
+        base_url: str,
+        api_key: Optional[str] = None,
+        timeout: float = settings.SCRAPER_HTTP_TIMEOUT,
+        retries: int = settings.SCRAPER_HTTP_RETRIES,
+        backoff: float = settings.SCRAPER_HTTP_BACKOFF,
+        backoff_max: float = settings.SCRAPER_HTTP_BACKOFF_MAX,
+        max_connections: int = settings.SCRAPER_HTTP_MAX_CONNECTIONS
+    ):
+        if httpx is None:
+            raise RuntimeError("SCRAPER_BACKEND='http' requires httpx (pip install httpx)")
+        self.retries = retries
+        self.backoff = backoff
+        self.backoff_max = backoff_max
+        headers = {"Authorization": f"Bearer {api_key}"} if api_key else {}
+        self._client = httpx.AsyncClient(
+            base_url=base_url.rstrip("/"),
+            headers=headers,
+            timeout=httpx.Timeout(timeout),
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections
+            )
+        )
+
+    async def fetch_posts(self, venue_id: str, platform: str, limit: int) -> List[Dict[str, Any]]:
+        body = await self._get(
+            f"/v1/{platform}/venues/{venue_id}/posts", {"limit": limit}, platform, venue_id
+        )
+        return body.get("posts", [])[:limit]
+
+    async def fetch_posts_many(self, venue_ids: List[str], platform: str, limit: int) -> List[VenuePosts]:
+        body = await self._get(
+            f"/v1/{platform}/posts",
+            {"venue_ids": ",".join(venue_ids), "limit": limit},
+            platform,
+            f"batch of {len(venue_ids)}"
+        )
+        results = body.get("results", {})
+        batch = []
+        for venue_id in venue_ids:
+            entry = results.get(venue_id)
+            if entry is None:
+                batch.append(VenuePosts(venue_id, [], "missing from batch response"))
+            elif entry.get("error"):
+                batch.append(VenuePosts(venue_id, [], str(entry["error"])))
+            else:
+                batch.append(VenuePosts(venue_id, entry.get("posts", [])[:limit]))
+        return batch
+
+    async def _get(self, path: str, params: Dict[str, Any], platform: str, label: str) -> Dict[str, Any]:
+        """GET with timeout + retries; returns the JSON body of the 200 response"""
+        started = time.perf_counter()
+        try:
+            for attempt in range(self.retries + 1):
+                retry_after = None
+                try:
+                    response = await self._client.get(path, params=params)
+                    if response.status_code == 200:
+                        try:
+                            body = response.json()
+                        except ValueError as e:  # Truncated/non-JSON body from the provider
+                            SCRAPER_REQUESTS.inc(platform=platform, outcome="error")
+                            raise ScraperError(f"{platform} {label}: invalid JSON response: {e}") from e
+                        SCRAPER_REQUESTS.inc(platform=platform, outcome="ok")
+                        return body
+                    if response.status_code not in self.RETRY_STATUSES:
+                        SCRAPER_REQUESTS.inc(platform=platform, outcome="error")
+                        raise ScraperError(f"{platform} {label}: HTTP {response.status_code}")
+                    error = f"HTTP {response.status_code}"
+                    retry_after = self._retry_after(response)
+                except httpx.TransportError as e:  # Timeouts, connection errors
+                    error = f"{type(e).__name__}: {e}"
+
+                if attempt == self.retries:
+                    SCRAPER_REQUESTS.inc(platform=platform, outcome="error")
+                    raise ScraperError(f"{platform} {label}: {error} after {attempt + 1} attempts")
+                SCRAPER_REQUESTS.inc(platform=platform, outcome="retry")
+                delay = retry_after if retry_after is not None else self._backoff(attempt)
+                logger.warning(f"Scraper {platform} {label}: {error}, retry {attempt + 1} in {delay:.2f}s")
+                await asyncio.sleep(delay)
+        finally:
+            SCRAPER_LATENCY.observe(time.perf_counter() - started, platform=platform)
+        return {}
+
+    async def close(self) -> None:
+        await self._client.aclose()
+
+    def _backoff(self, attempt: int) -> float:
+        return random.uniform(0, min(self.backoff_max, self.backoff * 2 ** attempt))
+
+    def _retry_after(self, response: Any) -> Optional[float]:
+        try:
+            return min(self.backoff_max, float(response.headers["Retry-After"]))
+        except (KeyError, ValueError):
+            return None
+
+
+def create_backend(name: Optional[str] = None) -> ScraperBackend:
+    """Backend for SCRAPER_BACKEND ('mock' or 'http')"""
+    name = (name or settings.SCRAPER_BACKEND).lower()
+    if name == "mock":
+        return MockBackend()
+    if name == "http":
+        if not settings.SCRAPER_HTTP_BASE_URL:
+            raise ValueError("SCRAPER_BACKEND='http' requires SCRAPER_HTTP_BASE_URL")
+        return HTTPBackend(settings.SCRAPER_HTTP_BASE_URL, settings.SCRAPER_HTTP_API_KEY)
+    raise ValueError(f"Unknown SCRAPER_BACKEND: {name}. Valid options: 'mock', 'http'")
@@ -0,0 +1,78 @@
+"""
+Venue Memo - Scrape and analyze each venue once per run
+
+init_db links every venue to every event, so a tier run used to scrape
+and analyze the same venue once per linked event. EventProcessor keeps one
+VenueMemo per run:
+
+- within the run, the first task for a venue does the work and every later
+  (or concurrent) task for the same venue awaits that result
+- across runs (separate batches, worker tasks, processes), results are
+  shared through CacheService.get_or_compute for VENUE_CHECK_FRESHNESS
+  seconds (0 = per-run memo only)
+
+Scrape and LLM calls therefore scale with distinct venues, not with
+venue-event links.
+"""
+
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, List, Set
+
+from app.core.cache import cache
+from app.core.config import settings
+from app.core.metrics import registry
+
+logger = logging.getLogger(__name__)
+
+MEMO_LOOKUPS = registry.counter(
+    "mosport_venue_memo_lookups_total", "Venue memo lookups by kind and result (run_hit, load, preloaded)"
+)
+
+
+class VenueMemo:
+    """
+    Per-run, single-flight memo keyed by cache key.
+
+    Args:
+        freshness: Seconds a result may be reused by later runs (0 = this run only)
+    """
+
+    def __init__(self, freshness: int = settings.VENUE_CHECK_FRESHNESS):
+        self.freshness = freshness
+        self._results: Dict[str, asyncio.Task] = {}
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+    async def preload(self, keys: List[str], kind: str) -> Set[str]:
+        """
+        Seed the run memo with results later runs may reuse (one MGET).
+
+        Returns the keys that are already fresh, so a batch can skip
+        acquiring data for them (e.g. the HOT live post prefetch).
+        """
+        if self.freshness <= 0:
+            return set()
+        loop = asyncio.get_running_loop()
+        cached = await cache.get_computed_many([key for key in keys if key not in self._results])
+        for key, value in cached.items():
+            future = self._results[key] = loop.create_future()
+            future.set_result(value)
+        MEMO_LOOKUPS.inc(len(cached), kind=kind, result="preloaded")
+        return set(cached)
+
+    async def get_or_load(self, key: str, loader: Callable[[], Awaitable[Any]], kind: str) -> Any:
+        task = self._results.get(key)
+        if task is None:
+            MEMO_LOOKUPS.inc(kind=kind, result="load")
+            task = self._results[key] = asyncio.ensure_future(self._load(key, loader))
+        else:
+            MEMO_LOOKUPS.inc(kind=kind, result="run_hit")
+        # A cancelled caller must not cancel the shared load
+        return await asyncio.shield(task)
+
+    async def _load(self, key: str, loader: Callable[[], Awaitable[Any]]) -> Any:
+        if self.freshness > 0:
+            return await cache.get_or_compute(key, loader, ttl=self.freshness)
+        return await loader()
@@ -0,0 +1,41 @@
+"""
+Post Watermarks - Track the newest post seen per venue and platform
+
+A venue check used to re-scrape and re-analyze the same recent posts on
+every run although feeds rarely change between two runs. Per venue and
+platform, Redis keeps the newest post already analyzed (the watermark)
+together with the derivative results of the latest posts (the window):
+
+- the scraper only returns posts newer than the watermark
+- DTSSService analyzes only those and merges them into the window
+- no new posts: the previous window (and its result) carries forward
+
+Posts are ordered by (timestamp, id); timestamps are ISO-8601 UTC strings
+from the scraper, which sort chronologically as strings.
+"""
+
+from typing import Any, Dict, Optional, Tuple
+
+
+def watermark_key(venue_id: str, platform: str) -> str:
+    # raw: namespace: Redis only (no L1), so every process sees the latest watermark
+    return f"raw:venue_post_state:{venue_id}:{platform}"
+
+
+def post_position(post: Dict[str, Any]) -> Tuple[str, str]:
+    """Sort key of a post (or watermark / window entry)"""
+    return (str(post.get("timestamp") or ""), str(post.get("post_id") or post.get("id") or ""))
+
+
+def is_newer(post: Dict[str, Any], watermark: Optional[Dict[str, Any]]) -> bool:
+    """True if the post was published after the watermark"""
+    if not watermark:
+        return True
+    return post_position(post) > post_position(watermark)
+
+
+def make_watermark(post: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "post_id": post.get("post_id") or post.get("id"),
+        "timestamp": post.get("timestamp"),
+    }
@@ -0,0 +1,152 @@
+"""
+Worker - Standalone process draining the Redis stream work queue
+
+Run (from backend/):
+    python -m app.worker [--concurrency N] [--name NAME]
+
+Used with SCHEDULER_EXECUTION='queue': the API process (scheduler leader)
+only enqueues due events, and any number of worker processes verify them.
+Each process is one consumer in WORK_QUEUE_GROUP and runs up to
+WORKER_CONCURRENCY tasks at a time. SIGINT/SIGTERM stop reading and let
+in-flight tasks finish; anything left unacked is requeued by another worker
+after WORK_QUEUE_VISIBILITY_TIMEOUT. While a task runs, its worker renews
+it every quarter of that timeout, so only tasks of dead workers go stale.
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import signal
+import socket
+from typing import Any, Awaitable, Callable, Dict, Set
+
+from app.core.cache import cache
+from app.core.config import settings
+from app.core.redis_health import redis_breaker
+from app.core.scheduler import run_event_job
+from app.core.work_queue import work_queue, QueuedTask, TASK_VERIFY_EVENTS
+from app.services.scraper import scraper_service
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger("app.worker")
+
+
+async def handle_verify_events(payload: Dict[str, Any]) -> None:
+    await run_event_job(payload["event_ids"])
+
+
+# Task type -> handler (must be idempotent, see core/work_queue.py)
+HANDLERS: Dict[str, Callable[[Dict[str, Any]], Awaitable[None]]] = {
+    TASK_VERIFY_EVENTS: handle_verify_events,
+}
+
+
+class Worker:
+    def __init__(self, name: str, concurrency: int):
+        self.name = name
+        self.concurrency = concurrency
+        self._slots = asyncio.Semaphore(concurrency)
+        self._inflight: Set[asyncio.Task] = set()
+        self._running_ids: Set[str] = set()  # Stream ids of in-flight tasks
+        self._stopping = asyncio.Event()
+
+    def stop(self) -> None:
+        if not self._stopping.is_set():
+            logger.info("🛑 Stop requested - finishing in-flight tasks...")
+            self._stopping.set()
+
+    async def run(self) -> None:
+        await work_queue.ensure_group()
+        logger.info(
+            f"👷 Worker {self.name} consuming {work_queue.stream} "
+            f"(group {work_queue.group}, concurrency {self.concurrency})"
+        )
+        janitor = asyncio.create_task(self._requeue_stale_loop())
+        try:
+            while not self._stopping.is_set():
+                # Wait for a free slot, then read as many tasks as there are free slots
+                await self._slots.acquire()
+                self._slots.release()
+                free = max(1, self.concurrency - len(self._inflight))
+                try:
+                    tasks = await work_queue.read(self.name, count=free, block_ms=2000)
+                except Exception as e:
+                    logger.warning(f"Work queue read failed: {e}")
+                    await asyncio.sleep(1)
+                    continue
+                for task in tasks:
+                    await self._slots.acquire()
+                    job = asyncio.create_task(self._execute(task))
+                    self._inflight.add(job)
+                    job.add_done_callback(self._inflight.discard)
+        finally:
+            janitor.cancel()
+            if self._inflight:
+                await asyncio.gather(*self._inflight, return_exceptions=True)
+            logger.info(f"✅ Worker {self.name} stopped")
+
+    async def _execute(self, task: QueuedTask) -> None:
+        self._running_ids.add(task.id)
+        try:
+            handler = HANDLERS.get(task.type)
+            if handler is None:
+                await work_queue.fail(task, f"no handler for task type '{task.type}'")
+                return
+            try:
+                await handler(task.payload)
+            except Exception as e:
+                logger.error(f"❌ Task {task.id} ({task.type}) failed: {e}")
+                await work_queue.fail(task, str(e))
+                return
+            await work_queue.ack(task)
+        except Exception as e:
+            # Ack/fail itself failed (Redis): the entry stays pending and is requeued later
+            logger.warning(f"Could not settle task {task.id}: {e}")
+        finally:
+            self._running_ids.discard(task.id)
+            self._slots.release()
+
+    async def _requeue_stale_loop(self) -> None:
+        timeout_ms = settings.WORK_QUEUE_VISIBILITY_TIMEOUT * 1000
+        while True:
+            await asyncio.sleep(max(5, settings.WORK_QUEUE_VISIBILITY_TIMEOUT / 4))
+            try:
+                await work_queue.heartbeat(self.name, set(self._running_ids))
+            except Exception as e:
+                logger.warning(f"In-flight task heartbeat failed: {e}")
+            try:
+                requeued = await work_queue.requeue_stale(
+                    self.name, timeout_ms, count=100, running=set(self._running_ids)
+                )
+                if requeued:
+                    logger.warning(f"Requeued {requeued} tasks left by a dead consumer")
+            except Exception as e:
+                logger.warning(f"Stale task requeue failed: {e}")
+
+
+async def main(name: str, concurrency: int) -> None:
+    worker = Worker(name, concurrency)
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, worker.stop)
+
+    await cache.start()
+    try:
+        await worker.run()
+    finally:
+        await scraper_service.close()
+        await cache.close()
+        await redis_breaker.close()
+        await work_queue.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Mosport verification worker")
+    parser.add_argument("--concurrency", type=int, default=settings.WORKER_CONCURRENCY)
+    parser.add_argument("--name", default=f"{socket.gethostname()}-{os.getpid()}")
+    args = parser.parse_args()
+    asyncio.run(main(args.name, args.concurrency))
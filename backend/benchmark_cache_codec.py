@@ -0,0 +1,99 @@
+"""
+Benchmark: legacy json.dumps cache values vs CacheCodec envelopes
+
+Measures stored size and encode/decode CPU time for payloads shaped like
+the ones the app actually caches. Runs offline (no Redis needed):
+
+    python benchmark_cache_codec.py
+"""
+
+import json
+import os
+import random
+import sys
+import time
+
+sys.path.append(os.getcwd())
+
+from app.core.codec import CacheCodec, SERIALIZERS
+
+ITERATIONS = 2000
+
+random.seed(42)
+
+_WORDS = [
+    "Live", "Match", "tonight", "Premier", "League", "Sound", "ON", "big", "screen",
+    "happy", "hour", "beer", "promo", "book", "now", "WBC", "Team", "Taiwan", "full",
+    "house", "kick-off", "come", "join", "us", "🔥", "⚽", "🍺",
+]
+
+
+def _caption(words: int) -> str:
+    return " ".join(random.choice(_WORDS) for _ in range(words))
+
+
+PAYLOADS = {
+    "qoe_tags": {"liveness": True, "visual": "Big Screen", "audio": "Sound ON", "vibe": None},
+    "raw_venue_post": {
+        "text": _caption(400),
+        "image_url": "https://example.com/tv_screen.jpg",
+        "captured_at": "2026-02-09T06:30:00.000000",
+    },
+    "raw_user_posts": {
+        "captions": [_caption(60) for _ in range(30)],
+        "analyzed_at": "2026-02-09T06:30:00.000000",
+    },
+    "cities_response": {
+        "user_location": None,
+        "total_cities": 40,
+        "cities": [
+            {
+                "name": f"City {i}",
+                "country": "Vietnam",
+                "country_code": "VN",
+                "flag_emoji": "🇻🇳",
+                "venue_count": random.randint(1, 200),
+                "latitude": random.uniform(-90, 90),
+                "longitude": random.uniform(-180, 180),
+            }
+            for i in range(40)
+        ],
+    },
+}
+
+
+def _time_us(func, arg) -> float:
+    start = time.perf_counter()
+    for _ in range(ITERATIONS):
+        func(arg)
+    return (time.perf_counter() - start) / ITERATIONS * 1e6
+
+
+def main() -> None:
+    variants = {"legacy json.dumps": None}
+    for name in SERIALIZERS:
+        variants[f"{name}"] = CacheCodec(serializer=name, compress_min_bytes=0)
+        variants[f"{name}+zlib"] = CacheCodec(serializer=name, compress_min_bytes=1024)
+
+    print(f"{'payload':<18}{'variant':<20}{'bytes':>8}{'encode us':>12}{'decode us':>12}")
+    print("-" * 70)
+    for payload_name, payload in PAYLOADS.items():
+        for variant_name, codec in variants.items():
+            if codec is None:
+                encoded = json.dumps(payload).encode("utf-8")
+                encode_us = _time_us(lambda v: json.dumps(v).encode("utf-8"), payload)
+                decode_us = _time_us(json.loads, encoded)
+            else:
+                encoded = codec.encode(payload)
+                assert codec.decode(encoded) == payload
+                encode_us = _time_us(codec.encode, payload)
+                decode_us = _time_us(codec.decode, encoded)
+            print(f"{payload_name:<18}{variant_name:<20}{len(encoded):>8}{encode_us:>12.1f}{decode_us:>12.1f}")
+        print()
+
+    if "msgpack" not in SERIALIZERS:
+        print("(msgpack not installed - msgpack variants skipped)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""
+Benchmark: AIJudge per-post vs batched evaluation against the local LLM stub
+
+Starts services/mock_llm_server.py in-process and judges the latest posts
+of many venues (seeded mock feeds) three ways:
+
+- single:    AIJudge.evaluate_post, one request per post
+- per_venue: AIJudge.evaluate_posts once per venue (~3 posts per request)
+- batcher:   concurrent per-venue calls through JudgeBatcher, packed across
+             venues under DTSS_BATCH_TOKEN_BUDGET (what venue checks use)
+
+Reports elapsed time, requests sent and posts that came back with an error.
+Runs offline (openai package required):
+
+    python benchmark_judge_batch.py [--venues 200] [--posts 3] [--latency 0.4]
+                                    [--context-window 8000] [--drop-rate 0.02]
+                                    [--cache none|fakeredis|redis]
+
+--cache picks the judgment memo backend: 'none' (default, no memo, no
+Redis connection), 'fakeredis' (in-process memo, cleared between modes) or
+'redis' (REDIS_URL). Captions carry the venue id so every post is distinct
+content; with a shared 'redis' memo, run the script once per cold start
+since the batched modes share a prompt version.
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+from datetime import datetime
+
+sys.path.append(os.getcwd())
+
+from app.core.cache import cache
+from app.core.config import settings
+from app.core.dtss import AIJudge, JudgeBatcher, JUDGE_REQUESTS
+from app.services.mock_llm_server import MockLLMServer
+from app.services.scraper_backends import MockPostGenerator, MockProfile
+
+MODES = ("single", "per_venue", "batcher")
+
+
+def use_cache(backend: str) -> None:
+    if backend == "none":
+        # No memo: every lookup misses without touching the network
+        cache.redis = None
+    elif backend == "fakeredis":
+        import fakeredis
+        cache.redis = fakeredis.FakeAsyncRedis()
+
+
+async def run(venues: int, per_venue: int, latency: float, context_window: int, drop_rate: float,
+              concurrency: int, backend: str) -> None:
+    use_cache(backend)
+    generator = MockPostGenerator(MockProfile(seed=42, languages={"en": 0.6, "vi": 0.4},
+                                              anchor=datetime(2026, 5, 1, 20)))
+    feeds = [
+        [
+            {"text": f"{post['text']} @venue-{i}", "image_url": post["image_url"]}
+            for post in generator.posts(f"venue-{i}", per_venue)
+        ]
+        for i in range(venues)
+    ]
+    posts = [post for feed in feeds for post in feed]
+
+    async with MockLLMServer(latency=latency, context_window=context_window, drop_rate=drop_rate,
+                             seed=42) as server:
+        judge = AIJudge(api_key="stub", base_url=server.base_url)
+        batcher = JudgeBatcher(judge)
+        slots = asyncio.Semaphore(concurrency)
+
+        async def single(post):
+            async with slots:
+                return [await judge.evaluate_post(post["text"], post["image_url"])]
+
+        async def per_venue_call(feed):
+            async with slots:
+                return await judge.evaluate_posts(feed)
+
+        print(f"posts={len(posts)} latency={latency}s context_window={context_window} "
+              f"drop_rate={drop_rate} cache={backend}")
+        for mode in MODES:
+            if backend == "fakeredis":
+                await cache.redis.flushall()
+            server.requests = 0
+            started = time.perf_counter()
+            if mode == "single":
+                batches = await asyncio.gather(*(single(post) for post in posts))
+            elif mode == "per_venue":
+                batches = await asyncio.gather(*(per_venue_call(feed) for feed in feeds))
+            else:
+                batches = await asyncio.gather(*(batcher.evaluate_posts(feed) for feed in feeds))
+            elapsed = time.perf_counter() - started
+            failed = sum(1 for batch in batches for result in batch if "error" in result)
+            print(f"--- {mode} (concurrency {concurrency})")
+            print(f"elapsed         {elapsed:8.2f} s")
+            print(f"requests        {server.requests:8d}")
+            print(f"failed posts    {failed:8d}")
+        print(f"batch splits    {JUDGE_REQUESTS.value(mode='batch', outcome='split'):8.0f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--venues", type=int, default=200)
+    parser.add_argument("--posts", type=int, default=3, help="Posts per venue")
+    parser.add_argument("--latency", type=float, default=0.4, help="Stub delay per request (s)")
+    parser.add_argument("--context-window", type=int, default=8000)
+    parser.add_argument("--drop-rate", type=float, default=0.02)
+    parser.add_argument("--concurrency", type=int, default=4, help="Requests in flight (all modes)")
+    parser.add_argument("--cache", choices=("none", "fakeredis", "redis"), default="none",
+                        help="Judgment memo backend")
+    args = parser.parse_args()
+    settings.DTSS_BATCH_CONCURRENCY = args.concurrency
+    asyncio.run(run(args.venues, args.posts, args.latency, args.context_window, args.drop_rate,
+                    args.concurrency, args.cache))
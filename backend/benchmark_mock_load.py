@@ -0,0 +1,114 @@
+"""
+Benchmark: tier-run scrape load against the seeded mock backend
+
+Fetches posts for thousands of venues the way a HOT tier run does
+(ScraperService.fetch_recent_posts_many, platform caps + token bucket)
+from an in-process MockBackend with a seeded MockProfile: post volume,
+language mix, override probability, lognormal latency with a slow tail
+and provider errors. Runs offline (no Redis/DB needed):
+
+    python benchmark_mock_load.py [--venues 5000] [--seed 42] [--latency 0.2 --sigma 0.5]
+                                  [--tail 0.01 --tail-latency 5] [--error-rate 0.02]
+                                  [--languages en=0.5,vi=0.3,th=0.2] [--runs 2]
+
+The feed digest printed per run depends only on the profile (the clock is
+pinned with --anchor), so two runs - or two machines - with the same
+arguments fetch identical posts and failures; compare timings, not data.
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import os
+import statistics
+import sys
+import time
+from collections import Counter
+from datetime import datetime
+
+sys.path.append(os.getcwd())
+
+from app.services.scraper import ScraperService
+from app.services.scraper_backends import MOCK_PHRASES, MockBackend, MockProfile
+
+OVERRIDE_TEXTS = {text for _, _, notices in MOCK_PHRASES.values() for text in notices}
+
+
+def _percentile(values, q: float) -> float:
+    values = sorted(values)
+    return values[min(len(values) - 1, int(q * len(values)))]
+
+
+async def run_once(profile: MockProfile, venues: int, platform: str) -> None:
+    scraper = ScraperService(MockBackend(profile))
+    feeds = {}
+    latencies = []
+    languages = Counter()
+    posts = overrides = errors = 0
+
+    started = time.perf_counter()
+    async for result in scraper.fetch_recent_posts_many(
+        (f"venue-{i}" for i in range(venues)), platform=platform, limit=3
+    ):
+        latencies.append(time.perf_counter() - started)
+        feeds[result.venue_id] = result.error or result.posts
+        if result.error:
+            errors += 1
+            continue
+        for post in result.posts:
+            posts += 1
+            languages[post["language"]] += 1
+            overrides += post["text"] in OVERRIDE_TEXTS
+    elapsed = time.perf_counter() - started
+    await scraper.close()
+    # Venues complete in timing-dependent order; the digest covers content only
+    digest = hashlib.blake2b(json.dumps(feeds, sort_keys=True).encode(), digest_size=8)
+
+    print(f"elapsed         {elapsed:8.2f} s")
+    print(f"throughput      {venues / elapsed:8.1f} venues/s")
+    print(f"venue ready p50 {statistics.median(latencies) * 1000:8.1f} ms (since run start)")
+    print(f"venue ready p99 {_percentile(latencies, 0.99) * 1000:8.1f} ms")
+    print(f"posts           {posts:8d} ({overrides} overrides)")
+    print(f"languages       {dict(languages.most_common())}")
+    print(f"failed venues   {errors:8d}")
+    print(f"feed digest     {digest.hexdigest()}")
+
+
+async def run(profile: MockProfile, venues: int, platform: str, runs: int) -> None:
+    print(f"venues={venues} platform={platform} profile={profile}")
+    for i in range(runs):
+        print(f"--- run {i + 1}")
+        await run_once(profile, venues, platform)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--venues", type=int, default=5000)
+    parser.add_argument("--platform", default="instagram")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--posts-per-day", type=float, default=12.0)
+    parser.add_argument("--languages", default="en=0.5,vi=0.3,th=0.1,zh=0.1", help="lang=weight,...")
+    parser.add_argument("--override-probability", type=float, default=0.035)
+    parser.add_argument("--latency", type=float, default=0.2, help="Median request latency (s)")
+    parser.add_argument("--sigma", type=float, default=0.5, help="Lognormal latency spread")
+    parser.add_argument("--tail", type=float, default=0.01, help="Share of requests hitting the tail")
+    parser.add_argument("--tail-latency", type=float, default=5.0)
+    parser.add_argument("--error-rate", type=float, default=0.02, help="Share of failed venues")
+    parser.add_argument("--anchor", default="2026-05-01T20:00:00", help="Pinned 'now' (ISO)")
+    parser.add_argument("--runs", type=int, default=2)
+    args = parser.parse_args()
+
+    profile = MockProfile(
+        seed=args.seed,
+        posts_per_day=args.posts_per_day,
+        languages={lang: float(w) for lang, _, w in (part.partition("=") for part in args.languages.split(","))},
+        override_probability=args.override_probability,
+        latency=args.latency,
+        latency_sigma=args.sigma,
+        tail_probability=args.tail,
+        tail_latency=args.tail_latency,
+        error_rate=args.error_rate,
+        anchor=datetime.fromisoformat(args.anchor),
+    )
+    asyncio.run(run(profile, args.venues, args.platform, args.runs))
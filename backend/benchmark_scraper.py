@@ -0,0 +1,89 @@
+"""
+Benchmark: scraper HTTP backend against the local mock social server
+
+Starts services/mock_social_server.py in-process and fetches posts for
+many venues through ScraperService (platform caps + token bucket) with
+the pooled HTTP backend. Reports throughput, latency percentiles, TCP
+connections opened and retries. Runs offline (no Redis/DB needed, httpx
+required):
+
+    python benchmark_scraper.py [--venues 500] [--latency 0.05] [--error-rate 0.02] [--batch]
+
+--batch fetches through fetch_recent_posts_many (one request per
+SCRAPER_BATCH_SIZE venues) instead of one request per venue.
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+
+sys.path.append(os.getcwd())
+
+from app.services.mock_social_server import MockSocialServer
+from app.services.scraper import ScraperService
+from app.services.scraper_backends import HTTPBackend, ScraperError, SCRAPER_REQUESTS
+
+
+def _percentile(values, q: float) -> float:
+    values = sorted(values)
+    return values[min(len(values) - 1, int(q * len(values)))]
+
+
+async def run(venues: int, latency: float, error_rate: float, platform: str, batch: bool) -> None:
+    async with MockSocialServer(latency=latency, error_rate=error_rate, seed=42) as server:
+        backend = HTTPBackend(server.url, backoff=0.05, backoff_max=0.5)
+        scraper = ScraperService(backend)
+        latencies = []
+        errors = 0
+
+        async def fetch(venue: int) -> None:
+            nonlocal errors
+            started = time.perf_counter()
+            try:
+                await scraper.fetch_recent_posts(f"venue-{venue}", platform=platform, limit=3)
+                latencies.append(time.perf_counter() - started)
+            except ScraperError:
+                errors += 1
+
+        async def fetch_batched() -> None:
+            nonlocal errors
+            async for result in scraper.fetch_recent_posts_many(
+                (f"venue-{i}" for i in range(venues)), platform=platform, limit=3
+            ):
+                if result.error:
+                    errors += 1
+                else:
+                    latencies.append(time.perf_counter() - started)
+
+        started = time.perf_counter()
+        if batch:
+            await fetch_batched()
+        else:
+            await asyncio.gather(*(fetch(i) for i in range(venues)))
+        elapsed = time.perf_counter() - started
+        await scraper.close()
+
+        print(f"venues={venues} latency={latency}s error_rate={error_rate} platform={platform} batch={batch}")
+        print(f"elapsed         {elapsed:8.2f} s")
+        print(f"throughput      {venues / elapsed:8.1f} venues/s")
+        if latencies:
+            print(f"latency p50     {statistics.median(latencies) * 1000:8.1f} ms (incl. pacing/queueing)")
+            print(f"latency p95     {_percentile(latencies, 0.95) * 1000:8.1f} ms")
+            print(f"latency p99     {_percentile(latencies, 0.99) * 1000:8.1f} ms")
+        print(f"requests        {server.requests:8d} ({SCRAPER_REQUESTS.value(platform=platform, outcome='retry'):.0f} retries)")
+        print(f"connections     {server.connections:8d} (keep-alive reuse)")
+        print(f"failed venues   {errors:8d}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--venues", type=int, default=500)
+    parser.add_argument("--latency", type=float, default=0.05)
+    parser.add_argument("--error-rate", type=float, default=0.02)
+    parser.add_argument("--platform", default="instagram")
+    parser.add_argument("--batch", action="store_true", help="Use fetch_recent_posts_many")
+    args = parser.parse_args()
+    asyncio.run(run(args.venues, args.latency, args.error_rate, args.platform, args.batch))
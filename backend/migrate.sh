@@ -139,6 +139,13 @@ CREATE INDEX IF NOT EXISTS venues_name_trgm_idx ON venues USING GIN (name gin_tr
 CREATE INDEX IF NOT EXISTS venues_tags_idx ON venues USING GIN (tags);
 CREATE INDEX IF NOT EXISTS venues_dtss_status_idx ON venues(current_dtss_status);
 
+-- ==================== SLME Scheduler ====================
+
+-- Tier jobs filter on status + start_time window (slme.tier_clause)
+CREATE INDEX IF NOT EXISTS idx_events_active_status_start
+    ON events(status, start_time)
+    WHERE status IN ('scheduled', 'live');
+
 -- V6.2 WBC Data
 ALTER TABLE venues ADD COLUMN IF NOT EXISTS event_tags TEXT[] DEFAULT '{}';
 ALTER TABLE venues ADD COLUMN IF NOT EXISTS fan_base VARCHAR(255);
@@ -7,6 +7,7 @@ from datetime import datetime
 # Add backend to path
 sys.path.append(os.path.join(os.getcwd(), 'backend'))
 
+from app.core.response_cache import invalidate_tags, events_tag
 from app.db.session import AsyncSessionLocal
 from app.models.models import Event
 from app.services.api_service import api_sports_service
@@ -73,6 +74,7 @@ async def sync_fixtures():
             count += 1
             
         await session.commit()
+        await invalidate_tags(events_tag("Baseball"))
         print(f"✅ Synced {count} fixtures.")
 
 if __name__ == "__main__":
@@ -0,0 +1,23 @@
+import fakeredis
+import pytest
+
+from app.core.cache import cache
+from app.core.redis_health import CircuitState, redis_breaker
+
+
+@pytest.fixture
+def fake_redis():
+    """Async fakeredis server shared by everything the test connects"""
+    return fakeredis.FakeAsyncRedis(server=fakeredis.FakeServer())
+
+
+@pytest.fixture
+def redis_cache(monkeypatch, fake_redis):
+    """The cache singleton on fakeredis, without L1 and with a closed breaker"""
+    monkeypatch.setattr(cache, "redis", fake_redis)
+    monkeypatch.setattr(cache, "local", None)
+    monkeypatch.setattr(cache, "_inflight", {})
+    monkeypatch.setattr(redis_breaker, "state", CircuitState.CLOSED)
+    monkeypatch.setattr(redis_breaker, "failures", 0)
+    cache.fallback.clear()
+    return cache
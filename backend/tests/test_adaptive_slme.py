@@ -0,0 +1,139 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.core.adaptive_slme import AdaptiveFrequency, Cadence
+from app.core.config import settings
+from app.core.slme import slme
+
+NOW = datetime(2026, 5, 1, 20, 0, tzinfo=timezone.utc)
+
+
+@pytest.fixture(autouse=True)
+def adaptive_settings(monkeypatch):
+    monkeypatch.setattr(settings, "SLME_ADAPTIVE", True)
+    monkeypatch.setattr(settings, "SLME_ADAPTIVE_BACKOFF", 1.5)
+    monkeypatch.setattr(settings, "SLME_ADAPTIVE_TIGHTEN", 0.5)
+    monkeypatch.setattr(settings, "SCHEDULER_SPREAD", 1.0)
+
+
+@pytest.fixture
+def adaptive(redis_cache):
+    return AdaptiveFrequency(prefix="test:cadence")
+
+
+async def observe_sequence(adaptive, event_id: str, tier: str, activity: str) -> list:
+    """Intervals after each observation; activity is a string of c(hanged)/s(table)"""
+    intervals = []
+    for step in activity:
+        cadences = await adaptive.observe({event_id: (tier, step == "c")})
+        intervals.append(cadences[event_id].interval)
+    return intervals
+
+
+def test_first_observation_uses_the_tier_base():
+    for tier in ("HOT", "WARM", "COOL", "COLD"):
+        assert AdaptiveFrequency.next_interval(tier, None, changed=True) == slme.tier_frequency(tier)
+        assert AdaptiveFrequency.next_interval(tier, None, changed=False) == slme.tier_frequency(tier)
+
+
+@pytest.mark.parametrize("tier", ["HOT", "WARM", "COOL", "COLD"])
+def test_intervals_are_clamped_to_tier_bounds(tier):
+    low, high = slme.ADAPTIVE_BOUNDS[tier]
+
+    assert AdaptiveFrequency.next_interval(tier, high, changed=False) == high
+    assert AdaptiveFrequency.next_interval(tier, high * 10, changed=False) == high
+    assert AdaptiveFrequency.next_interval(tier, low, changed=True) == low
+    assert AdaptiveFrequency.next_interval(tier, 1, changed=True) == low
+
+
+async def test_stable_event_relaxes_up_to_the_maximum(adaptive):
+    intervals = await observe_sequence(adaptive, "evt-stable", "HOT", "sssss")
+
+    assert intervals == [300, 450, 675, 900, 900]
+    cadence = (await adaptive.load(["evt-stable"]))["evt-stable"]
+    assert cadence.stable_runs == 5 and cadence.changes == 0
+
+
+async def test_changing_event_tightens_down_to_the_minimum(adaptive):
+    intervals = await observe_sequence(adaptive, "evt-busy", "HOT", "sssscccc")
+
+    assert intervals == [300, 450, 675, 900, 450, 225, 120, 120]
+    cadence = (await adaptive.load(["evt-busy"]))["evt-busy"]
+    assert cadence.stable_runs == 0 and cadence.changes == 4
+
+
+async def test_activity_after_a_quiet_spell_tightens_then_relaxes_again(adaptive):
+    intervals = await observe_sequence(adaptive, "evt-burst", "WARM", "ssscss")
+
+    assert intervals == [3600, 5400, 8100, 4050, 6075, 9112]
+
+
+async def test_new_tier_restarts_from_its_base(adaptive):
+    await observe_sequence(adaptive, "evt-tier", "WARM", "sss")
+
+    cadences = await adaptive.observe({"evt-tier": ("HOT", False)})
+
+    assert cadences["evt-tier"].interval == slme.FREQ_HOT
+    assert cadences["evt-tier"].stable_runs == 1
+
+
+async def test_filter_due_skips_events_backed_off_past_the_next_run(adaptive):
+    await observe_sequence(adaptive, "evt-relaxed", "HOT", "ssss")  # 900s
+    await observe_sequence(adaptive, "evt-busy", "HOT", "cccc")     # 120s
+
+    due, skipped = await adaptive.filter_due(["evt-relaxed", "evt-busy", "evt-new"], "HOT", horizon=300)
+
+    assert due == {"evt-busy", "evt-new"}
+    assert skipped == 1
+
+
+async def test_filter_due_ignores_state_from_another_tier(adaptive):
+    await observe_sequence(adaptive, "evt-moved", "COLD", "sss")
+
+    due, skipped = await adaptive.filter_due(["evt-moved"], "WARM", horizon=3600)
+
+    assert due == {"evt-moved"} and skipped == 0
+
+
+async def test_malformed_state_is_ignored(adaptive, redis_cache):
+    await redis_cache.set(adaptive.key("evt-bad"), {"tier": "HOT"})
+
+    assert await adaptive.load(["evt-bad"]) == {}
+
+
+def test_adaptive_interval_lands_on_the_events_slot():
+    start_time = NOW + timedelta(hours=1)  # HOT
+    for interval in (120, 450, 900):
+        next_check = slme.next_check_at(start_time, "scheduled", NOW, interval, "evt-1")
+
+        # On the event's grid for this interval, within the spread window
+        assert slme.spread_slot("evt-1", interval, next_check) == next_check
+        earliest = NOW + timedelta(seconds=interval / 2)
+        assert earliest <= next_check < earliest + timedelta(seconds=interval)
+
+
+def test_backed_off_events_stay_spread_across_the_interval():
+    start_time = NOW + timedelta(hours=1)
+    checks = [slme.next_check_at(start_time, "scheduled", NOW, 900, f"evt-{i}") for i in range(200)]
+
+    offsets = sorted((check - NOW).total_seconds() for check in checks)
+    assert offsets[0] < 450 + 90 and offsets[-1] > 1350 - 90
+    assert len(set(offsets)) > 150
+
+
+def test_backed_off_interval_is_cut_at_the_hotter_tier_boundary():
+    start_time = NOW + timedelta(hours=2, minutes=10)  # WARM, HOT in 10 minutes
+    low, high = slme.ADAPTIVE_BOUNDS["WARM"]
+
+    next_check = slme.next_check_at(start_time, "scheduled", NOW, high, "evt-1")
+
+    crossing = start_time - timedelta(hours=2)
+    assert crossing <= next_check < crossing + timedelta(seconds=slme.FREQ_HOT)
+    assert slme.spread_slot("evt-1", slme.FREQ_HOT, next_check) == next_check
+
+
+def test_cadence_due_at():
+    cadence = Cadence(tier="HOT", interval=450, checked_at=NOW.timestamp())
+
+    assert cadence.due_at() == NOW + timedelta(seconds=450)
@@ -0,0 +1,23 @@
+import uuid
+
+import pytest
+
+from app.core.auth import AuthPrincipal, GUEST_ROLE
+from app.core.limiter import RATE_LIMITS
+
+
+@pytest.mark.parametrize("role, tier", [
+    ("FAN", "fan"), ("VENUE", "venue"), ("STAFF", "staff"), ("ADMIN", "staff"), ("fan", "fan"),
+])
+def test_roles_map_to_rate_limit_tiers(role, tier):
+    assert AuthPrincipal(str(uuid.uuid4()), role).rate_limit_role == tier
+
+
+@pytest.mark.parametrize("role", ["MODERATOR", "", None])
+def test_unknown_roles_get_the_guest_tier(role):
+    assert AuthPrincipal(str(uuid.uuid4()), role).rate_limit_role == GUEST_ROLE
+
+
+@pytest.mark.parametrize("role", ["FAN", "VENUE", "STAFF", "ADMIN"])
+def test_every_tier_has_a_limit(role):
+    assert AuthPrincipal(str(uuid.uuid4()), role).rate_limit_role in RATE_LIMITS
@@ -0,0 +1,111 @@
+import asyncio
+
+import pytest
+
+from app.core.cache import COMPUTED_MARKER
+
+
+async def test_get_or_compute_caches_result(redis_cache):
+    calls = 0
+
+    async def loader():
+        nonlocal calls
+        calls += 1
+        return {"cities": ["Hanoi"]}
+
+    first = await redis_cache.get_or_compute("city:list", loader, ttl=60)
+    second = await redis_cache.get_or_compute("city:list", loader, ttl=60)
+
+    assert first == second == {"cities": ["Hanoi"]}
+    assert calls == 1
+
+
+async def test_concurrent_misses_share_one_loader_call(redis_cache):
+    calls = 0
+    release = asyncio.Event()
+
+    async def loader():
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return 42
+
+    waiters = [asyncio.create_task(redis_cache.get_or_compute("slow", loader, ttl=60)) for _ in range(10)]
+    await asyncio.sleep(0.01)
+    release.set()
+
+    assert await asyncio.gather(*waiters) == [42] * 10
+    assert calls == 1
+
+
+@pytest.mark.parametrize("falsy", [None, 0, False, "", [], {}])
+async def test_falsy_results_are_cached(redis_cache, falsy):
+    calls = 0
+
+    async def loader():
+        nonlocal calls
+        calls += 1
+        return falsy
+
+    assert await redis_cache.get_or_compute("empty", loader, ttl=60) == falsy
+    assert await redis_cache.get_or_compute("empty", loader, ttl=60) == falsy
+    assert calls == 1
+
+
+async def test_loader_error_reaches_every_waiter_and_is_not_cached(redis_cache):
+    release = asyncio.Event()
+
+    async def failing():
+        await release.wait()
+        raise RuntimeError("db down")
+
+    waiters = [asyncio.create_task(redis_cache.get_or_compute("flaky", failing, ttl=60)) for _ in range(3)]
+    await asyncio.sleep(0.01)
+    release.set()
+
+    results = await asyncio.gather(*waiters, return_exceptions=True)
+    assert all(isinstance(result, RuntimeError) for result in results)
+
+    async def loader():
+        return "ok"
+
+    assert await redis_cache.get_or_compute("flaky", loader, ttl=60) == "ok"
+
+
+async def test_serves_stale_value_while_another_worker_refreshes(redis_cache, fake_redis):
+    await redis_cache.set("hot", {COMPUTED_MARKER: 1, "value": "stale", "delta": 1.0, "expires_at": 0}, ttl=60)
+    await fake_redis.set("lock:hot", "other-worker", px=5000)
+
+    async def loader():
+        raise AssertionError("must not recompute while the lock is held")
+
+    assert await redis_cache.get_or_compute("hot", loader, ttl=60) == "stale"
+
+
+async def test_waits_for_the_lock_holder_result(redis_cache, fake_redis):
+    await fake_redis.set("lock:shared", "other-worker", px=5000)
+
+    async def other_worker():
+        await asyncio.sleep(0.1)
+        await redis_cache.set(
+            "shared", {COMPUTED_MARKER: 1, "value": "theirs", "delta": 0.1, "expires_at": 2e9}, ttl=60
+        )
+
+    async def loader():
+        return "ours"
+
+    writer = asyncio.create_task(other_worker())
+    assert await redis_cache.get_or_compute("shared", loader, ttl=60, lock_timeout=2) == "theirs"
+    await writer
+
+
+
+async def test_get_computed_many_skips_expired_and_plain_entries(redis_cache):
+    async def loader():
+        return "fresh"
+
+    await redis_cache.get_or_compute("a", loader, ttl=60)
+    await redis_cache.set("b", {COMPUTED_MARKER: 1, "value": "old", "delta": 0.1, "expires_at": 0}, ttl=60)
+    await redis_cache.set("c", "plain", ttl=60)
+
+    assert await redis_cache.get_computed_many(["a", "b", "c", "d"]) == {"a": "fresh"}
@@ -0,0 +1,77 @@
+from app.core.redis_health import CircuitState, redis_breaker
+
+
+class RoundTrips:
+    """Counts client calls that reach Redis (pipelines count once)"""
+
+    def __init__(self, client, monkeypatch):
+        self.calls = []
+        for name in ("get", "set", "delete", "mget", "pipeline"):
+            original = getattr(client, name)
+            monkeypatch.setattr(client, name, self._wrap(name, original))
+
+    def _wrap(self, name, original):
+        def wrapper(*args, **kwargs):
+            self.calls.append(name)
+            return original(*args, **kwargs)
+        return wrapper
+
+
+async def test_set_many_then_get_many(redis_cache, fake_redis):
+    mapping = {f"venue:{i}:qoe_tags": {"tags": ["Big Screen"], "score": i} for i in range(50)}
+
+    assert await redis_cache.set_many(mapping, ttl=120)
+
+    found = await redis_cache.get_many(list(mapping) + ["venue:missing:qoe_tags"])
+    assert found == mapping
+    assert 0 < await fake_redis.ttl("venue:7:qoe_tags") <= 120
+
+
+async def test_bulk_operations_cost_one_round_trip_each(redis_cache, fake_redis, monkeypatch):
+    keys = [f"raw:venue_post:{i}" for i in range(200)]
+    trips = RoundTrips(fake_redis, monkeypatch)
+
+    await redis_cache.set_many({key: {"text": key} for key in keys})
+    await redis_cache.get_many(keys + keys[:10])  # Duplicates are fetched once
+    await redis_cache.delete_many(keys)
+
+    assert trips.calls == ["pipeline", "mget", "pipeline"]
+    assert await redis_cache.get_many(keys) == {}
+
+
+async def test_get_many_without_keys_skips_redis(redis_cache, fake_redis, monkeypatch):
+    trips = RoundTrips(fake_redis, monkeypatch)
+
+    assert await redis_cache.get_many([]) == {}
+    assert await redis_cache.set_many({})
+    assert await redis_cache.delete_many([])
+    assert trips.calls == []
+
+
+async def test_open_breaker_serves_bulk_ops_from_the_fallback(redis_cache, fake_redis, monkeypatch):
+    monkeypatch.setattr(redis_breaker, "state", CircuitState.OPEN)
+    monkeypatch.setattr(redis_breaker, "_ensure_probe", lambda: None)
+    trips = RoundTrips(fake_redis, monkeypatch)
+
+    assert not await redis_cache.set_many({"venue:1:qoe_tags": ["Sound On"], "venue:2:qoe_tags": []})
+    assert await redis_cache.get_many(["venue:1:qoe_tags", "venue:2:qoe_tags", "venue:3:qoe_tags"]) == {
+        "venue:1:qoe_tags": ["Sound On"], "venue:2:qoe_tags": []
+    }
+    assert not await redis_cache.delete_many(["venue:1:qoe_tags"])
+    assert await redis_cache.get_many(["venue:1:qoe_tags"]) == {}
+    assert trips.calls == []
+
+
+async def test_redis_errors_are_swallowed(redis_cache, fake_redis, monkeypatch):
+    await redis_cache.set_many({"event:1:fixture": {"id": 1}})
+
+    def down(*args, **kwargs):
+        raise ConnectionError("redis down")
+
+    monkeypatch.setattr(fake_redis, "mget", down)
+    monkeypatch.setattr(fake_redis, "pipeline", down)
+
+    assert await redis_cache.get_many(["event:1:fixture"]) == {}
+    assert not await redis_cache.set_many({"event:2:fixture": {"id": 2}})
+    assert not await redis_cache.delete_many(["event:1:fixture"])
+    assert redis_breaker.failures == 3
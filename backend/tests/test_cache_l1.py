@@ -0,0 +1,103 @@
+import asyncio
+
+import fakeredis
+import pytest
+
+from app.core.cache import CacheService
+from app.core.config import settings
+from app.core.redis_health import CircuitState, redis_breaker
+
+
+@pytest.fixture
+def make_cache(monkeypatch):
+    """Separate CacheService instances (one per 'process') on one fake Redis"""
+    server = fakeredis.FakeServer()
+    monkeypatch.setattr(redis_breaker, "state", CircuitState.CLOSED)
+    instances = []
+
+    def make(l1: bool) -> CacheService:
+        monkeypatch.setattr(CacheService, "_instance", None)
+        monkeypatch.setattr(settings, "CACHE_L1_ENABLED", l1)
+        service = CacheService()
+        service.redis = fakeredis.FakeAsyncRedis(server=server)
+        instances.append(service)
+        return service
+
+    yield make
+    monkeypatch.setattr(CacheService, "_instance", None)
+
+
+async def stop(*services):
+    for service in services:
+        await service.close()
+
+
+async def test_l1_copy_expires_with_the_redis_entry(make_cache):
+    writer, reader = make_cache(l1=False), make_cache(l1=True)
+    # 'city' keys get a 1h L1 lifetime; the Redis entry only lives 1s
+    await writer.set("city:list", ["Hanoi"], ttl=1)
+
+    assert await reader.get("city:list") == ["Hanoi"]
+    await asyncio.sleep(1.1)
+
+    assert await reader.get("city:list") is None
+
+
+async def test_get_many_caps_l1_copies_too(make_cache):
+    writer, reader = make_cache(l1=False), make_cache(l1=True)
+    await writer.set("city:list", ["Hanoi"], ttl=1)
+    await writer.set("city:other", ["Saigon"], ttl=60)
+
+    assert await reader.get_many(["city:list", "city:other"]) == {"city:list": ["Hanoi"], "city:other": ["Saigon"]}
+    await asyncio.sleep(1.1)
+
+    assert await reader.get_many(["city:list", "city:other"]) == {"city:other": ["Saigon"]}
+
+
+async def test_l1_serves_without_redis_until_invalidated(make_cache):
+    reader = make_cache(l1=True)
+    await reader.set("city:list", ["Hanoi"], ttl=60)
+    await reader.redis.flushall()
+
+    assert await reader.get("city:list") == ["Hanoi"]
+
+
+@pytest.mark.parametrize("writer_l1", [False, True])
+async def test_writes_invalidate_other_workers_l1(make_cache, writer_l1):
+    writer, reader = make_cache(l1=writer_l1), make_cache(l1=True)
+    await reader.start()
+    try:
+        await asyncio.sleep(0.05)  # Listener subscribed
+        await writer.set("city:list", ["Hanoi"], ttl=60)
+        await asyncio.sleep(0.05)
+        assert await reader.get("city:list") == ["Hanoi"]
+
+        await writer.set("city:list", ["Hanoi", "Saigon"], ttl=60)
+        await asyncio.sleep(0.05)
+        assert await reader.get("city:list") == ["Hanoi", "Saigon"]
+
+        await writer.set_many({"city:list": ["Danang"]}, ttl=60)
+        await asyncio.sleep(0.05)
+        assert await reader.get("city:list") == ["Danang"]
+
+        await writer.delete("city:list")
+        await asyncio.sleep(0.05)
+        assert await reader.get("city:list") is None
+    finally:
+        await stop(reader, writer)
+
+
+async def test_writer_without_l1_does_not_publish_when_disabled(make_cache, monkeypatch):
+    writer, reader = make_cache(l1=False), make_cache(l1=True)
+    monkeypatch.setattr(settings, "CACHE_L1_INVALIDATION", False)
+    await reader.start()
+    try:
+        await asyncio.sleep(0.05)
+        await writer.set("city:list", ["Hanoi"], ttl=60)
+        assert await reader.get("city:list") == ["Hanoi"]
+
+        await writer.set("city:list", ["Saigon"], ttl=60)
+        await asyncio.sleep(0.05)
+        assert await reader.get("city:list") == ["Hanoi"]
+    finally:
+        await stop(reader, writer)
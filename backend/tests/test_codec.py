@@ -0,0 +1,75 @@
+import json
+import zlib
+
+import pytest
+
+from app.core.codec import CacheCodec, FLAG_ZLIB, HEADER_SIZE, MAGIC, SERIALIZERS
+
+
+@pytest.mark.parametrize("serializer", sorted(SERIALIZERS))
+def test_round_trip(serializer):
+    codec = CacheCodec(serializer=serializer)
+    value = {"venue": "abc", "score": 0.75, "tags": ["Big Screen"], "open": True, "note": None}
+
+    raw = codec.encode(value)
+
+    assert raw.startswith(MAGIC)
+    assert codec.decode(raw) == value
+
+
+def test_large_values_are_compressed():
+    codec = CacheCodec(compress_min_bytes=64)
+    value = {"text": "live football tonight " * 100}
+
+    raw = codec.encode(value)
+
+    assert raw[HEADER_SIZE - 1] & FLAG_ZLIB
+    assert codec.decode(raw) == value
+    assert len(raw) < len(json.dumps(value))
+
+
+def test_incompressible_values_stay_uncompressed():
+    codec = CacheCodec(compress_min_bytes=1)
+
+    raw = codec.encode("x")
+
+    assert not raw[HEADER_SIZE - 1] & FLAG_ZLIB
+    assert codec.decode(raw) == "x"
+
+
+def test_decodes_legacy_json():
+    codec = CacheCodec()
+    legacy = json.dumps({"city": "Hanoi", "venues": [1, 2]}).encode()
+
+    assert codec.decode(legacy) == {"city": "Hanoi", "venues": [1, 2]}
+    assert codec.decode(legacy.decode()) == {"city": "Hanoi", "venues": [1, 2]}
+
+
+def test_decodes_legacy_plain_string():
+    assert CacheCodec().decode(b"not json") == "not json"
+
+
+def test_decodes_values_of_another_serializer():
+    """A worker reading entries written with a different CACHE_SERIALIZER"""
+    writer = CacheCodec(serializer=sorted(SERIALIZERS)[-1])
+    reader = CacheCodec(serializer="json")
+
+    assert reader.decode(writer.encode([1, "two"])) == [1, "two"]
+
+
+def test_rejects_unknown_envelope_version():
+    raw = MAGIC + bytes((99, 1, 0)) + b"{}"
+
+    with pytest.raises(ValueError):
+        CacheCodec().decode(raw)
+
+
+def test_unknown_serializer_falls_back_to_json():
+    assert CacheCodec(serializer="pickle").serializer.name == "json"
+
+
+def test_compressed_body_is_zlib():
+    codec = CacheCodec(compress_min_bytes=16)
+    raw = codec.encode("a" * 1000)
+
+    assert json.loads(zlib.decompress(raw[HEADER_SIZE:])) == "a" * 1000
@@ -0,0 +1,72 @@
+from datetime import datetime, timedelta, timezone
+
+from app.core.event_queue import EventQueue
+
+NOW = datetime(2026, 5, 1, 20, tzinfo=timezone.utc)
+
+
+def at(minutes: int) -> datetime:
+    return NOW + timedelta(minutes=minutes)
+
+
+def test_pops_due_events_earliest_first():
+    queue = EventQueue()
+    queue.schedule("c", at(-1))
+    queue.schedule("a", at(-10))
+    queue.schedule("b", at(-5))
+    queue.schedule("later", at(5))
+
+    assert queue.pop_due(NOW, limit=10) == ["a", "b", "c"]
+    assert len(queue) == 1
+    assert queue.next_due() == at(5)
+
+
+def test_pop_respects_limit():
+    queue = EventQueue()
+    for i in range(5):
+        queue.schedule(f"e{i}", at(-i))
+
+    assert queue.pop_due(NOW, limit=2) == ["e4", "e3"]
+    assert queue.pop_due(NOW, limit=10) == ["e2", "e1", "e0"]
+
+
+def test_reschedule_uses_latest_due_time():
+    queue = EventQueue()
+    queue.schedule("a", at(-10))
+    queue.schedule("b", at(-5))
+    queue.schedule("a", at(10))
+
+    assert queue.pop_due(NOW, limit=10) == ["b"]
+    assert queue.due_at("a") == at(10)
+    assert queue.pop_due(at(10), limit=10) == ["a"]
+    assert queue.next_due() is None
+
+
+def test_moving_an_event_earlier():
+    queue = EventQueue()
+    queue.schedule("a", at(10))
+    queue.schedule("a", at(-1))
+
+    assert queue.pop_due(NOW, limit=10) == ["a"]
+    assert queue.pop_due(at(10), limit=10) == []
+
+
+def test_removed_events_are_skipped():
+    queue = EventQueue()
+    queue.schedule("a", at(-2))
+    queue.schedule("b", at(-1))
+    queue.remove("a")
+
+    assert "a" not in queue
+    assert queue.next_due() == at(-1)
+    assert queue.pop_due(NOW, limit=10) == ["b"]
+
+
+def test_compaction_keeps_order():
+    queue = EventQueue()
+    for round_ in range(50):
+        for i in range(10):
+            queue.schedule(f"e{i}", at(round_ - i))
+
+    assert len(queue._heap) <= 2 * len(queue) + 64
+    assert queue.pop_due(at(100), limit=10) == [f"e{i}" for i in range(9, -1, -1)]
@@ -0,0 +1,183 @@
+import uuid
+import pytest
+from sqlalchemy import Column, Float, MetaData, Table, Uuid, create_engine, select
+from sqlalchemy.orm import Session
+
+from app.models.models import Event
+from app.services.event_writer import EventWriter
+
+
+class FakeSession:
+    """Records statements; execute() raises when fail is set"""
+
+    def __init__(self, fail: bool = False):
+        self.fail = fail
+        self.statements = []
+        self.commits = 0
+        self.rollbacks = 0
+        self.identity_map = {}
+
+    async def execute(self, statement, params=None):
+        if self.fail:
+            raise ConnectionError("db down")
+        self.statements.append((statement, params))
+
+    async def commit(self):
+        self.commits += 1
+
+    async def rollback(self):
+        self.rollbacks += 1
+
+
+class SyncBackedSession:
+    """AsyncSession interface over a sync SQLite Session (no async driver needed)"""
+
+    def __init__(self, session: Session):
+        self.session = session
+        self.identity_map = session.identity_map
+        self.executions = 0
+
+    async def execute(self, statement, params=None):
+        self.executions += 1
+        return self.session.execute(statement, params)
+
+    async def commit(self):
+        self.session.commit()
+
+    async def rollback(self):
+        self.session.rollback()
+
+
+# Only the columns the writer touches: Venue has Postgres-only types
+VENUES = Table("venues", MetaData(), Column("id", Uuid, primary_key=True), Column("qoe_score", Float))
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite://")
+    Event.__table__.create(engine)
+    VENUES.create(engine)
+    with Session(engine, expire_on_commit=False) as session:
+        yield session
+
+
+@pytest.fixture
+def ids():
+    return [uuid.uuid4() for _ in range(3)]
+
+
+async def test_flush_writes_one_statement_per_kind_and_one_commit(ids):
+    session = FakeSession()
+    writer = EventWriter(session)
+    writer.record_confidence(ids[0], 0.9)
+    writer.record_confidence(ids[1], 0.4)
+    writer.record_venue_qoe(ids[2], 80)
+    writer.record_override(ids[1], "Closed")
+
+    assert await writer.flush() == 4
+    assert len(session.statements) == 3
+    assert session.commits == 1
+    assert len(writer) == 0
+
+
+async def test_flush_without_records_is_a_no_op():
+    session = FakeSession()
+
+    assert await EventWriter(session).flush() == 0
+    assert session.commits == 0
+
+
+async def test_failed_flush_returns_none_and_rolls_back(ids):
+    session = FakeSession(fail=True)
+    writer = EventWriter(session)
+    writer.record_confidence(ids[0], 0.9)
+    writer.record_venue_qoe(ids[1], 50)
+
+    assert await writer.flush() is None
+    assert session.rollbacks == 1
+    assert session.commits == 0
+    # Results of the failed batch are dropped, not retried with the next one
+    assert len(writer) == 0
+    session.fail = False
+    assert await writer.flush() == 0
+
+
+async def test_confidence_of_last_linked_venue_wins(ids):
+    """Concurrent venue checks finishing in any order give the same result"""
+    writer = EventWriter(FakeSession())
+    writer.record_confidence(ids[0], 0.2, position=2)
+    writer.record_confidence(ids[0], 0.95, position=0)
+    writer.record_confidence(ids[0], 0.5, position=1)
+
+    assert writer.pending_confidence(ids[0]) == 0.2
+    assert writer.pending_confidence(ids[1]) is None
+
+
+async def test_ids_are_accepted_as_strings(ids):
+    writer = EventWriter(FakeSession())
+    writer.record_confidence(str(ids[0]), 0.7)
+
+    assert writer.pending_confidence(ids[0]) == 0.7
+
+
+async def test_cache_write_buffer_discard(redis_cache):
+    writes = redis_cache.buffer()
+    writes.set("raw:watermark:a", {"post_id": "1"})
+    writes.set("venue:a:qoe_tags", ["Big Screen"], ttl=60)
+
+    assert writes.discard() == 2
+    assert await writes.flush()
+    assert await redis_cache.get("raw:watermark:a") is None
+
+
+async def test_flush_updates_the_expected_rows(db):
+    events = [Event(title=f"Match {i}", status="scheduled", confidence_score=0.0) for i in range(4)]
+    db.add_all(events)
+    db.commit()
+    venue_ids = [uuid.uuid4() for _ in range(3)]
+    db.execute(VENUES.insert(), [{"id": venue_id, "qoe_score": 0.0} for venue_id in venue_ids])
+    db.commit()
+
+    session = SyncBackedSession(db)
+    writer = EventWriter(session)
+    writer.record_confidence(events[0].id, 0.9)
+    writer.record_confidence(str(events[1].id), 0.4)
+    writer.record_venue_qoe(venue_ids[0], 80)
+    writer.record_venue_qoe(venue_ids[2], 35)
+    writer.record_override(events[2].id, "Private event")
+
+    assert await writer.flush() == 5
+    assert session.executions == 3  # One executemany UPDATE per kind
+
+    rows = {
+        row.id: row for row in db.execute(
+            select(Event.__table__.c.id, Event.__table__.c.confidence_score,
+                   Event.__table__.c.last_verified, Event.__table__.c.status,
+                   Event.__table__.c.override_reason)
+        )
+    }
+    assert rows[events[0].id].confidence_score == 0.9
+    assert rows[events[1].id].confidence_score == 0.4
+    assert rows[events[0].id].last_verified is not None
+    assert rows[events[2].id].status == "cancelled"
+    assert rows[events[2].id].override_reason == "Private event"
+    untouched = rows[events[3].id]
+    assert (untouched.confidence_score, untouched.status, untouched.last_verified) == (0.0, "scheduled", None)
+
+    qoe = dict(db.execute(select(VENUES.c.id, VENUES.c.qoe_score)).all())
+    assert qoe == {venue_ids[0]: 0.8, venue_ids[1]: 0.0, venue_ids[2]: 0.35}
+
+
+async def test_loaded_events_see_flushed_results(db):
+    event = Event(title="Final", status="live", confidence_score=0.1)
+    db.add(event)
+    db.commit()
+
+    writer = EventWriter(SyncBackedSession(db))
+    writer.record_confidence(event.id, 0.75)
+    writer.record_override(event.id, "Closed")
+    await writer.flush()
+
+    # Updated in place, without reloading the instance
+    assert (event.confidence_score, event.status, event.override_reason) == (0.75, "cancelled", "Closed")
+    assert event.last_verified is not None
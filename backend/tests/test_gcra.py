@@ -0,0 +1,105 @@
+import time
+
+import fakeredis
+import pytest
+from limits import parse
+
+from app.core.gcra import GCRARateLimiter, GCRA_PEEK_SCRIPT, GCRA_SCRIPT, LocalPreFilter
+
+
+@pytest.fixture
+def server():
+    return fakeredis.FakeServer()
+
+
+def make_limiter(server) -> GCRARateLimiter:
+    """One worker's limiter on the shared fake Redis server"""
+    limiter = GCRARateLimiter("redis://localhost:6379/0")
+    limiter._client = fakeredis.FakeRedis(server=server)
+    limiter._gcra = limiter._client.register_script(GCRA_SCRIPT)
+    limiter._peek = limiter._client.register_script(GCRA_PEEK_SCRIPT)
+    return limiter
+
+
+def test_allows_burst_then_denies(server):
+    limiter = make_limiter(server)
+    item = parse("5/minute")
+
+    assert [limiter.hit(item, "1.2.3.4:fan") for _ in range(6)] == [True] * 5 + [False]
+    assert limiter.get_window_stats(item, "1.2.3.4:fan").remaining == 0
+
+
+def test_keys_are_limited_independently(server):
+    limiter = make_limiter(server)
+    item = parse("1/minute")
+
+    assert limiter.hit(item, "1.2.3.4:fan")
+    assert limiter.hit(item, "5.6.7.8:fan")
+    assert not limiter.hit(item, "1.2.3.4:fan")
+
+
+def test_limit_is_global_across_workers(server):
+    first, second = make_limiter(server), make_limiter(server)
+    item = parse("4/minute")
+
+    assert all(first.hit(item, "client") for _ in range(3))
+    # The second worker's local bucket is full; Redis still rejects
+    assert second.hit(item, "client")
+    assert not second.hit(item, "client")
+
+
+def test_rejected_client_is_turned_away_locally(server):
+    first, second = make_limiter(server), make_limiter(server)
+    item = parse("1/minute")
+    assert first.hit(item, "client")
+    assert not second.hit(item, "client")
+
+    def no_redis(*args, **kwargs):
+        raise AssertionError("blocked client must not reach Redis")
+
+    second._gcra = no_redis
+    assert not second.hit(item, "client")
+
+
+def test_recovers_after_emission_interval(server):
+    limiter = make_limiter(server)
+    item = parse("10/second")
+    while limiter.hit(item, "client"):
+        pass
+
+    time.sleep(0.15)
+
+    assert limiter.hit(item, "client")
+    assert not limiter.hit(item, "client")
+
+
+def test_test_does_not_consume(server):
+    limiter = make_limiter(server)
+    item = parse("1/minute")
+
+    assert limiter.test(item, "client")
+    assert limiter.test(item, "client")
+    assert limiter.hit(item, "client")
+    assert not limiter.test(item, "client")
+
+
+def test_clear_resets_the_key(server):
+    limiter = make_limiter(server)
+    item = parse("1/minute")
+    assert limiter.hit(item, "client")
+    assert not limiter.hit(item, "client")
+
+    limiter.clear(item, "client")
+
+    assert limiter.hit(item, "client")
+
+
+def test_pre_filter_is_bounded():
+    local = LocalPreFilter(max_keys=2)
+    for key in ("a", "b", "c"):
+        local.consume(key, rate=1.0, capacity=1)
+        local.block(key, 60)
+
+    assert len(local._buckets) == 2
+    assert local.blocked_for("a") == 0.0
+    assert local.blocked_for("c") > 0
@@ -0,0 +1,106 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import httpx
+import pytest
+from fastapi import FastAPI
+
+from app.api.api_v1.endpoints import admin
+from app.core.job_telemetry import JOB_EVENTS, JOB_OVERLAPS, JOB_RUNS, JobTelemetry
+
+
+@pytest.fixture
+def telemetry(redis_cache, monkeypatch):
+    telemetry = JobTelemetry(prefix="test:telemetry", history=5)
+    monkeypatch.setattr(admin, "job_telemetry", telemetry)
+    return telemetry
+
+
+async def test_successful_run_is_recorded(telemetry):
+    scheduled = datetime.now(timezone.utc) - timedelta(seconds=2)
+    async with telemetry.track("job_ok", interval=60, scheduled_at=scheduled) as run:
+        run.processed, run.failed = 4, 1
+
+    record = (await telemetry.runs("job_ok"))["job_ok"]["runs"][0]
+    assert record["status"] == "ok" and record["success"]
+    assert record["processed"] == 4 and record["failed"] == 1
+    assert record["lag"] >= 2
+    assert JOB_RUNS.value(job="job_ok", status="ok") == 1
+    assert JOB_EVENTS.value(job="job_ok", outcome="processed") == 4
+    assert JOB_EVENTS.value(job="job_ok", outcome="failed") == 1
+
+
+async def test_failed_run_is_recorded_and_reraised(telemetry):
+    with pytest.raises(RuntimeError):
+        async with telemetry.track("job_failed"):
+            raise RuntimeError("db down")
+
+    record = (await telemetry.runs("job_failed"))["job_failed"]["runs"][0]
+    assert record["status"] == "failed" and not record["success"]
+    assert record["message"] == "db down"
+    assert JOB_RUNS.value(job="job_failed", status="failed") == 1
+
+
+async def test_cancelled_run_is_recorded_and_reraised(telemetry):
+    started = asyncio.Event()
+
+    async def job():
+        async with telemetry.track("job_cancelled"):
+            started.set()
+            await asyncio.sleep(60)
+
+    task = asyncio.create_task(job())
+    await started.wait()
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    record = (await telemetry.runs("job_cancelled"))["job_cancelled"]["runs"][0]
+    assert record["status"] == "cancelled" and not record["success"]
+    assert JOB_RUNS.value(job="job_cancelled", status="cancelled") == 1
+    assert JOB_RUNS.value(job="job_cancelled", status="failed") == 0
+
+
+async def test_overlapping_runs_are_counted(telemetry):
+    release = asyncio.Event()
+
+    async def job():
+        async with telemetry.track("job_overlap", interval=60):
+            await release.wait()
+
+    first, second = asyncio.create_task(job()), asyncio.create_task(job())
+    await asyncio.sleep(0)
+    release.set()
+    await asyncio.gather(first, second)
+
+    assert JOB_OVERLAPS.value(job="job_overlap") == 1
+
+
+async def test_history_is_bounded(telemetry):
+    for i in range(8):
+        async with telemetry.track("job_history") as run:
+            run.processed = i
+
+    runs = (await telemetry.runs("job_history"))["job_history"]["runs"]
+    assert [r["processed"] for r in runs] == [7, 6, 5, 4, 3]
+
+
+async def test_admin_endpoint_reports_runs_and_summary(telemetry):
+    async with telemetry.track("job_admin") as run:
+        run.processed = 2
+    with pytest.raises(RuntimeError):
+        async with telemetry.track("job_admin"):
+            raise RuntimeError("boom")
+
+    app = FastAPI()
+    app.include_router(admin.router, prefix="/admin")
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        response = await client.get("/admin/scheduler/runs", params={"job": "job_admin"})
+
+    assert response.status_code == 200
+    report = response.json()["job_admin"]
+    assert [r["status"] for r in report["runs"]] == ["failed", "ok"]
+    assert report["summary"]["runs"] == 2
+    assert report["summary"]["processed"] == 2
+    assert report["summary"]["errors"] == 1
+    assert report["summary"]["cancelled"] == 0
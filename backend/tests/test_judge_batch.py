@@ -0,0 +1,118 @@
+import asyncio
+
+import pytest
+
+pytest.importorskip("openai")
+
+from app.core.config import settings
+from app.core.dtss import AIJudge, JudgeBatcher
+from app.services import dtss as dtss_module
+from app.services.dtss import DTSSService
+from app.services.mock_llm_server import MockLLMServer
+
+POSTS = [
+    {"text": "Premier League live tonight, big screen and sound on", "image_url": None},
+    {"text": "New brunch menu this weekend", "image_url": None},
+    {"text": "Closed for a private event", "image_url": None},
+    {"text": "WBC final live on every screen", "image_url": None},
+]
+
+
+async def test_evaluate_posts_batches_into_one_request(redis_cache):
+    async with MockLLMServer(latency=0, token_latency=0) as server:
+        judge = AIJudge(api_key="stub", base_url=server.base_url)
+
+        results = await judge.evaluate_posts(POSTS)
+
+    assert server.requests == 1
+    assert [result["is_match"] for result in results] == [True, False, False, True]
+    assert all("error" not in result for result in results)
+
+
+async def test_evaluate_posts_splits_when_context_overflows(redis_cache):
+    async with MockLLMServer(latency=0, token_latency=0, context_window=300) as server:
+        judge = AIJudge(api_key="stub", base_url=server.base_url)
+
+        results = await judge.evaluate_posts(POSTS)
+
+    assert server.requests > 1
+    assert [result["is_match"] for result in results] == [True, False, False, True]
+
+
+async def test_repeated_posts_are_served_from_the_memo(redis_cache):
+    async with MockLLMServer(latency=0, token_latency=0) as server:
+        judge = AIJudge(api_key="stub", base_url=server.base_url)
+        await judge.evaluate_posts(POSTS)
+        server.requests = 0
+
+        await judge.evaluate_posts(POSTS + POSTS)
+
+    assert server.requests == 0
+
+
+def venue_posts(venue: str, count: int = 3) -> list:
+    return [
+        {"id": f"{venue}-{i}", "timestamp": f"2026-05-01T2{i}:00:00", **post}
+        for i, post in enumerate(POSTS[:count])
+    ]
+
+
+async def test_new_venue_posts_are_judged_in_one_call(redis_cache, monkeypatch):
+    async with MockLLMServer(latency=0, token_latency=0) as server:
+        judge = AIJudge(api_key="stub", base_url=server.base_url)
+        monkeypatch.setattr(dtss_module, "judge_batcher", JudgeBatcher(judge, linger=0.01))
+
+        result = await DTSSService().analyze_new_venue_posts(
+            "venue-1", venue_posts("venue-1"), {"watermark": None, "window": []}
+        )
+
+    assert server.requests == 1
+    by_post = {analysis["post_id"]: analysis for analysis in result["window"]}
+    assert by_post["venue-1-0"]["has_live_event"] and by_post["venue-1-0"]["qoe_update"]["visual"] == "Big Screen"
+    assert not by_post["venue-1-1"]["has_live_event"]
+    assert by_post["venue-1-2"]["override_status"]
+
+
+async def test_posts_of_concurrent_venue_checks_share_requests(redis_cache, monkeypatch):
+    """Distinct captions per venue, so only batching (not the memo) saves requests"""
+    service = DTSSService()
+    async with MockLLMServer(latency=0, token_latency=0) as server:
+        judge = AIJudge(api_key="stub", base_url=server.base_url)
+        monkeypatch.setattr(dtss_module, "judge_batcher", JudgeBatcher(judge, linger=0.05))
+
+        def feed(venue):
+            return [{**post, "text": f"{post['text']} @{venue}"} for post in venue_posts(venue)]
+
+        results = await asyncio.gather(*(
+            service.analyze_new_venue_posts(f"venue-{i}", feed(f"venue-{i}"), {"watermark": None, "window": []})
+            for i in range(5)
+        ))
+
+    assert server.requests == 1
+    assert server.posts == 15
+    assert all(len(result["window"]) == 3 for result in results)
+
+
+async def test_batcher_flushes_a_full_round_without_waiting(redis_cache, monkeypatch):
+    monkeypatch.setattr(settings, "DTSS_BATCH_MAX_POSTS", 2)
+    monkeypatch.setattr(settings, "DTSS_BATCH_CONCURRENCY", 1)
+    async with MockLLMServer(latency=0, token_latency=0) as server:
+        batcher = JudgeBatcher(AIJudge(api_key="stub", base_url=server.base_url), linger=60)
+
+        results = await asyncio.wait_for(batcher.evaluate_posts(POSTS[:2]), timeout=5)
+
+    assert [result["is_match"] for result in results] == [True, False]
+
+
+async def test_batcher_answers_every_caller_when_the_batch_fails(redis_cache):
+    judge = AIJudge(api_key="stub", base_url="http://127.0.0.1:9/v1")
+    batcher = JudgeBatcher(judge, linger=0.01)
+
+    async def broken(posts):
+        raise RuntimeError("boom")
+
+    judge.evaluate_posts = broken
+    first, second = await asyncio.gather(batcher.evaluate_posts(POSTS[:1]), batcher.evaluate_posts(POSTS[1:3]))
+
+    assert len(first) == 1 and len(second) == 2
+    assert all("error" in result for result in first + second)
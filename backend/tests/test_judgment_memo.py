@@ -0,0 +1,64 @@
+from app.core.judgment_memo import JUDGMENT_MEMO, JudgmentMemo, content_hash, prompt_version
+
+RESULT = {"is_match": True, "confidence": 0.9, "tags": ["Big Screen"]}
+
+
+def lookups(kind: str, result: str) -> float:
+    return JUDGMENT_MEMO.value(kind=kind, result=result)
+
+
+async def test_miss_then_hit(redis_cache):
+    memo = JudgmentMemo()
+    key = memo.key("judge", prompt_version("gpt-4o", "prompt"), "Live football tonight")
+    hits, misses = lookups("judge", "hit"), lookups("judge", "miss")
+
+    assert await memo.get(key, "judge") is None
+    await memo.set(key, RESULT)
+    assert await memo.get(key, "judge") == RESULT
+
+    assert lookups("judge", "miss") == misses + 1
+    assert lookups("judge", "hit") == hits + 1
+
+
+async def test_reposted_content_hits_after_normalization(redis_cache):
+    memo = JudgmentMemo()
+    version = prompt_version("gpt-4o", "prompt")
+    await memo.set(memo.key("judge", version, "Live  Football\nTONIGHT"), RESULT)
+
+    assert await memo.get(memo.key("judge", version, "live football tonight"), "judge") == RESULT
+
+
+async def test_model_or_prompt_change_invalidates(redis_cache):
+    memo = JudgmentMemo()
+    text = "Live football tonight"
+    await memo.set(memo.key("judge", prompt_version("gpt-4o", "prompt v1"), text), RESULT)
+
+    assert await memo.get(memo.key("judge", prompt_version("gpt-4o", "prompt v2"), text), "judge") is None
+    assert await memo.get(memo.key("judge", prompt_version("gpt-4o-mini", "prompt v1"), text), "judge") is None
+
+
+async def test_image_is_part_of_the_content():
+    assert content_hash("Live tonight", "https://cdn/a.jpg") != content_hash("Live tonight", "https://cdn/b.jpg")
+    assert content_hash("Live tonight") == content_hash("live   tonight", None)
+
+
+async def test_get_many_counts_distinct_keys(redis_cache):
+    memo = JudgmentMemo()
+    version = prompt_version("gpt-4o", "prompt")
+    known, unknown = memo.key("judge", version, "known"), memo.key("judge", version, "unknown")
+    await memo.set_many({known: RESULT})
+    hits, misses = lookups("batch", "hit"), lookups("batch", "miss")
+
+    assert await memo.get_many([known, unknown, unknown], "batch") == {known: RESULT}
+    assert lookups("batch", "hit") == hits + 1
+    assert lookups("batch", "miss") == misses + 1
+
+
+async def test_stats_report_hit_rate(redis_cache):
+    memo = JudgmentMemo()
+    key = memo.key("stats_kind", prompt_version("gpt-4o", "prompt"), "post")
+    await memo.get(key, "stats_kind")
+    await memo.set(key, RESULT)
+    await memo.get(key, "stats_kind")
+
+    assert memo.stats()["stats_kind"] == {"hit": 1, "miss": 1, "hit_rate": 0.5}
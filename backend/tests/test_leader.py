@@ -0,0 +1,226 @@
+import asyncio
+
+import fakeredis
+import pytest
+
+from app.core.config import settings
+from app.core.leader import LeaderElector
+
+
+class Calls:
+    def __init__(self):
+        self.elected = 0
+        self.demoted = 0
+
+    def on_elected(self):
+        self.elected += 1
+
+    def on_demoted(self):
+        self.demoted += 1
+
+
+@pytest.fixture
+def calls():
+    return Calls()
+
+
+def make_elector(fake_redis, calls, lease_ttl: float = 0.3) -> LeaderElector:
+    elector = LeaderElector("scheduler:leader", lease_ttl, calls.on_elected, calls.on_demoted)
+    elector._client = fake_redis
+    return elector
+
+
+async def test_only_one_elector_leads(fake_redis, calls):
+    first, second = make_elector(fake_redis, calls), make_elector(fake_redis, calls)
+
+    await first._tick()
+    await second._tick()
+
+    assert first.is_leader and not second.is_leader
+    assert calls.elected == 1
+
+
+async def test_renewal_keeps_leadership(fake_redis, calls):
+    elector = make_elector(fake_redis, calls)
+    await elector._tick()
+
+    for _ in range(3):
+        await asyncio.sleep(elector.renew_interval)
+        await elector._tick()
+
+    assert elector.is_leader
+    assert calls.demoted == 0
+
+
+async def test_demoted_at_lease_deadline_without_renewal(fake_redis, calls):
+    elector = make_elector(fake_redis, calls)
+    await elector._tick()
+
+    await asyncio.sleep(elector.lease_ttl + 0.05)
+
+    assert not elector.is_leader
+    assert calls.demoted == 1
+
+
+async def test_demoted_when_renewal_fails_close_to_expiry(fake_redis, calls):
+    elector = make_elector(fake_redis, calls)
+    await elector._tick()
+
+    async def unreachable(*args, **kwargs):
+        raise ConnectionError("redis down")
+
+    fake_redis.eval = unreachable
+    await asyncio.sleep(elector.renew_interval * 2.1)
+    await elector._tick()
+
+    assert not elector.is_leader
+    assert calls.demoted == 1
+
+
+async def test_demoted_when_lease_taken_over(fake_redis, calls):
+    elector = make_elector(fake_redis, calls)
+    await elector._tick()
+
+    await fake_redis.set("scheduler:leader", "someone-else")
+    await elector._tick()
+
+    assert not elector.is_leader
+    assert calls.demoted == 1
+
+
+async def test_follower_takes_over_after_expiry(fake_redis, calls):
+    leader, follower = make_elector(fake_redis, calls), make_elector(fake_redis, calls)
+    await leader._tick()
+
+    await asyncio.sleep(leader.lease_ttl + 0.05)
+    await follower._tick()
+
+    assert follower.is_leader and not leader.is_leader
+
+
+async def test_release_hands_over_immediately(fake_redis, calls):
+    leader, follower = make_elector(fake_redis, calls), make_elector(fake_redis, calls)
+    await leader._tick()
+
+    await leader._release()
+    await follower._tick()
+
+    assert follower.is_leader
+    assert calls.demoted == 1
+
+
+def unreachable_redis(fake_redis):
+    async def unreachable(*args, **kwargs):
+        raise ConnectionError("redis down")
+
+    fake_redis.set = unreachable
+    fake_redis.eval = unreachable
+
+
+async def test_leads_locally_when_redis_unreachable_at_start(fake_redis, calls):
+    elector = make_elector(fake_redis, calls)
+    unreachable_redis(fake_redis)
+
+    await elector._tick()
+    await elector._tick()
+
+    assert elector.is_leader and elector.local
+    assert calls.elected == 1
+
+
+async def test_local_leader_takes_lease_when_redis_returns(fake_redis, calls):
+    elector = make_elector(fake_redis, calls)
+    set_, eval_ = fake_redis.set, fake_redis.eval
+    unreachable_redis(fake_redis)
+    await elector._tick()
+
+    fake_redis.set, fake_redis.eval = set_, eval_
+    await elector._tick()
+
+    assert elector.is_leader and not elector.local
+    assert await fake_redis.get("scheduler:leader") == elector.token.encode()
+    assert calls.elected == 1 and calls.demoted == 0
+
+
+async def test_local_leader_steps_down_for_lease_holder(fake_redis, calls):
+    elector = make_elector(fake_redis, calls)
+    set_ = fake_redis.set
+    unreachable_redis(fake_redis)
+    await elector._tick()
+
+    fake_redis.set = set_
+    await fake_redis.set("scheduler:leader", "someone-else")
+    await elector._tick()
+
+    assert not elector.is_leader and not elector.local
+    assert calls.demoted == 1
+
+
+async def test_no_local_fallback_once_redis_was_reached(fake_redis, calls):
+    leader, follower = make_elector(fake_redis, calls), make_elector(fake_redis, calls)
+    await leader._tick()
+    await follower._tick()
+
+    unreachable_redis(fake_redis)
+    await follower._tick()
+
+    assert not follower.is_leader
+
+
+async def test_local_fallback_can_be_disabled(fake_redis, calls, monkeypatch):
+    monkeypatch.setattr(settings, "SCHEDULER_LEADER_LOCAL_FALLBACK", False)
+    elector = make_elector(fake_redis, calls)
+    unreachable_redis(fake_redis)
+
+    await elector._tick()
+
+    assert not elector.is_leader
+
+
+async def test_restart_uses_a_fresh_client(fake_redis, calls, monkeypatch):
+    elector = LeaderElector("scheduler:leader", 0.3, calls.on_elected, calls.on_demoted)
+    clients = []
+
+    def connect():
+        clients.append(fakeredis.FakeAsyncRedis(server=fake_redis.connection_pool.connection_kwargs["server"]))
+        return clients[-1]
+
+    monkeypatch.setattr(elector, "_connect", connect)
+
+    for _ in range(2):
+        elector.start()
+        await asyncio.sleep(0.05)
+        assert elector.is_leader
+        task = elector._task
+        elector.stop()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert not elector.is_leader and elector._client is None
+
+    assert len(clients) == 2 and clients[0] is not clients[1]
+    assert calls.elected == 2 and calls.demoted == 2
+
+
+async def test_scheduler_shutdown_cancels_running_jobs():
+    from app.core.scheduler import APSchedulerAdapter
+
+    adapter = APSchedulerAdapter()
+    adapter._scheduler.start()
+    started, cancelled = asyncio.Event(), asyncio.Event()
+
+    async def long_job():
+        started.set()
+        try:
+            await asyncio.sleep(60)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    job = asyncio.create_task(adapter._tracked(long_job)())
+    await started.wait()
+
+    adapter.shutdown()
+
+    with pytest.raises(asyncio.CancelledError):
+        await job
+    assert cancelled.is_set()
@@ -0,0 +1,90 @@
+import pytest
+from fastapi import FastAPI, Request, Response
+from fastapi.testclient import TestClient
+from slowapi import _rate_limit_exceeded_handler
+from slowapi.errors import RateLimitExceeded
+
+from app.core import limiter as limiter_module
+from app.core.limiter import CircuitBreakerLimiter, RATE_LIMITS, get_limit_for_key, get_user_key, role_based_limit
+from app.core.redis_health import CircuitState, redis_breaker
+
+UNREACHABLE_REDIS = "redis://127.0.0.1:1/0"
+
+
+@pytest.fixture
+def breaker(monkeypatch):
+    """Shared breaker with its recovery probe disabled"""
+    monkeypatch.setattr(redis_breaker, "state", CircuitState.CLOSED)
+    monkeypatch.setattr(redis_breaker, "failures", 0)
+    monkeypatch.setattr(redis_breaker, "failure_threshold", 1000)
+    monkeypatch.setattr(redis_breaker, "_ensure_probe", lambda: None)
+    return redis_breaker
+
+
+def make_client(monkeypatch) -> "tuple[TestClient, CircuitBreakerLimiter]":
+    monkeypatch.setattr(limiter_module.settings, "REDIS_URL", UNREACHABLE_REDIS)
+    limiter = CircuitBreakerLimiter(
+        key_func=get_user_key,
+        storage_uri=UNREACHABLE_REDIS,
+        storage_options={"socket_connect_timeout": 0.2, "socket_timeout": 0.2},
+        default_limits=["100/minute"],
+        headers_enabled=True,
+        in_memory_fallback_enabled=True,
+        in_memory_fallback=[get_limit_for_key],
+        swallow_errors=True
+    )
+    app = FastAPI()
+    app.state.limiter = limiter
+    app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
+
+    @app.middleware("http")
+    async def role_from_header(request: Request, call_next):
+        request.state.user_role = request.headers.get("x-role", "guest")
+        return await call_next(request)
+
+    @app.get("/limited")
+    @limiter.limit(role_based_limit())
+    async def limited(request: Request, response: Response):
+        return {"ok": True}
+
+    return TestClient(app), limiter
+
+
+def allowed_requests(client: TestClient, role: str, attempts: int) -> int:
+    statuses = [client.get("/limited", headers={"x-role": role}).status_code for _ in range(attempts)]
+    assert set(statuses) <= {200, 429}
+    return statuses.count(200)
+
+
+@pytest.mark.parametrize("role", ["fan", "guest"])
+def test_open_breaker_enforces_role_limits_in_memory(monkeypatch, breaker, role):
+    client, limiter = make_client(monkeypatch)
+    monkeypatch.setattr(redis_breaker, "state", CircuitState.OPEN)
+    budget = int(RATE_LIMITS[role].split("/")[0])
+
+    assert allowed_requests(client, role, budget + 5) == budget
+    assert not limiter._storage_dead  # Redis was never tried
+
+
+@pytest.mark.parametrize("role", ["fan", "guest"])
+def test_dead_storage_falls_back_to_role_limits(monkeypatch, breaker, role):
+    client, limiter = make_client(monkeypatch)
+    budget = int(RATE_LIMITS[role].split("/")[0])
+
+    assert allowed_requests(client, role, budget + 5) == budget
+    assert limiter._storage_dead
+
+
+def test_staff_is_not_capped_by_a_flat_fallback(monkeypatch, breaker):
+    client, limiter = make_client(monkeypatch)
+
+    assert allowed_requests(client, "staff", 150) == 150
+    assert limiter._storage_dead
+
+
+def test_failed_redis_checks_are_reported_to_the_breaker(monkeypatch, breaker):
+    client, _ = make_client(monkeypatch)
+
+    client.get("/limited", headers={"x-role": "fan"})
+
+    assert breaker.failures == 1
@@ -0,0 +1,98 @@
+import httpx
+import pytest
+from fastapi import FastAPI
+
+from app.api.api_v1.endpoints import admin
+from app.core.metrics import MetricsRegistry
+
+
+@pytest.fixture
+def registry():
+    return MetricsRegistry()
+
+
+def test_counter_increments_per_label_set(registry):
+    lookups = registry.counter("test_lookups_total", "Lookups")
+
+    lookups.inc(namespace="venue", result="hit")
+    lookups.inc(2, result="hit", namespace="venue")  # Label order does not matter
+    lookups.inc(namespace="venue", result="miss")
+
+    assert lookups.value(namespace="venue", result="hit") == 3
+    assert lookups.value(namespace="venue", result="miss") == 1
+    assert lookups.value(namespace="event", result="hit") == 0
+
+
+def test_registry_returns_the_existing_metric(registry):
+    first = registry.counter("test_total", "Test")
+    first.inc()
+
+    assert registry.counter("test_total", "Test") is first
+
+
+def test_histogram_buckets_and_summary(registry):
+    latency = registry.histogram("test_latency_seconds", "Latency", buckets=(0.01, 0.1, 1.0))
+    for value in [0.005] * 50 + [0.05] * 45 + [0.5] * 4 + [5.0]:
+        latency.observe(value, op="get")
+
+    summary = latency.summary(op="get")
+    assert summary["count"] == 100
+    assert summary["sum"] == pytest.approx(0.25 + 2.25 + 2.0 + 5.0)
+    assert (summary["p50"], summary["p95"], summary["p99"]) == (0.01, 0.1, 1.0)
+    assert latency.summary(op="set")["count"] == 0
+
+
+def test_render_prometheus_text(registry):
+    registry.counter("test_hits_total", "Hits").inc(3, namespace="raw")
+    registry.histogram("test_seconds", "Time", buckets=(0.1, 1.0)).observe(0.5, op="get")
+
+    text = registry.render()
+
+    assert "# TYPE test_hits_total counter\n" in text
+    assert 'test_hits_total{namespace="raw"} 3\n' in text
+    assert "# TYPE test_seconds histogram\n" in text
+    assert 'test_seconds_bucket{op="get",le="0.1"} 0\n' in text
+    assert 'test_seconds_bucket{op="get",le="1.0"} 1\n' in text
+    assert 'test_seconds_bucket{op="get",le="+Inf"} 1\n' in text
+    assert 'test_seconds_count{op="get"} 1\n' in text
+
+
+def test_reset_clears_values(registry):
+    counter = registry.counter("test_total", "Test")
+    counter.inc(5)
+
+    registry.reset()
+
+    assert counter.value() == 0 and counter.samples() == []
+
+
+async def test_cache_lookups_are_counted_per_namespace(redis_cache):
+    before = redis_cache.stats()["namespaces"].get("mtest", {"hit": 0, "miss": 0, "bytes_read": 0, "bytes_written": 0})
+
+    await redis_cache.set("mtest:1", {"value": "x" * 100})
+    await redis_cache.get("mtest:1")
+    await redis_cache.get("mtest:1")
+    await redis_cache.get("mtest:missing")
+
+    stats = redis_cache.stats()["namespaces"]["mtest"]
+    assert stats["hit"] - before["hit"] == 2
+    assert stats["miss"] - before["miss"] == 1
+    assert stats["bytes_read"] - before["bytes_read"] > 200
+    assert stats["bytes_written"] > before["bytes_written"]
+    assert stats["latency"]["get"]["count"] >= 3
+
+
+async def test_admin_endpoints_expose_cache_metrics(redis_cache):
+    await redis_cache.set("madmin:1", [1, 2, 3])
+    await redis_cache.get("madmin:1")
+
+    app = FastAPI()
+    app.include_router(admin.router, prefix="/admin")
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        stats = (await client.get("/admin/cache/stats")).json()
+        metrics = (await client.get("/admin/metrics")).text
+
+    assert stats["namespaces"]["madmin"]["hit"] >= 1
+    assert stats["namespaces"]["madmin"]["hit_rate"] is not None
+    assert 'mosport_cache_lookups_total{namespace="madmin",result="hit"}' in metrics
+    assert "# TYPE mosport_cache_latency_seconds histogram" in metrics
@@ -0,0 +1,116 @@
+import asyncio
+
+import pytest
+
+from app.core import redis_health
+from app.core.redis_health import CircuitState, RedisCircuitBreaker
+
+
+class FlakyPing:
+    """Redis client stand-in whose ping fails until `up` is set"""
+
+    def __init__(self):
+        self.up = False
+        self.pings = 0
+
+    async def ping(self):
+        self.pings += 1
+        if not self.up:
+            raise ConnectionError("redis down")
+        return True
+
+    async def aclose(self):
+        pass
+
+
+@pytest.fixture
+def client(monkeypatch):
+    client = FlakyPing()
+    monkeypatch.setattr(redis_health.redis, "from_url", lambda *args, **kwargs: client)
+    return client
+
+
+@pytest.fixture
+def breaker():
+    breaker = RedisCircuitBreaker(failure_threshold=3, probe_interval=0.01)
+    yield breaker
+    if breaker._probe_task is not None:
+        breaker._probe_task.cancel()
+
+
+async def test_opens_after_consecutive_failures(breaker, client):
+    transitions = []
+    breaker.add_listener(transitions.append)
+
+    breaker.record_failure()
+    breaker.record_failure()
+    assert breaker.allow_request()
+
+    breaker.record_failure()
+    assert breaker.is_open and not breaker.allow_request()
+    assert transitions == [CircuitState.OPEN]
+    await breaker.close()
+
+
+async def test_success_resets_the_failure_count(breaker):
+    breaker.record_failure()
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+
+    assert breaker.state == CircuitState.CLOSED
+    assert breaker.failures == 1
+
+
+async def test_stays_open_while_probes_fail(breaker, client):
+    for _ in range(3):
+        breaker.record_failure()
+
+    await asyncio.sleep(0.05)
+
+    assert breaker.is_open
+    assert client.pings >= 2
+    assert breaker.status()["state"] == CircuitState.OPEN
+    await breaker.close()
+
+
+async def test_probe_closes_breaker_once_redis_answers(breaker, client):
+    transitions = []
+    breaker.add_listener(transitions.append)
+    for _ in range(3):
+        breaker.record_failure()
+    await asyncio.sleep(0.03)
+
+    # Half-open: the next probe is the trial request
+    client.up = True
+    await asyncio.sleep(0.05)
+
+    assert breaker.state == CircuitState.CLOSED and breaker.allow_request()
+    assert breaker.failures == 0 and breaker.opened_at is None
+    assert transitions == [CircuitState.OPEN, CircuitState.CLOSED]
+    assert breaker._probe_task.done()
+
+
+async def test_reopens_after_recovery(breaker, client):
+    for _ in range(3):
+        breaker.record_failure()
+    client.up = True
+    await asyncio.sleep(0.05)
+    assert not breaker.is_open
+
+    client.up = False
+    for _ in range(3):
+        breaker.record_failure()
+
+    assert breaker.is_open
+    await breaker.close()
+
+
+async def test_close_stops_the_probe(breaker, client):
+    for _ in range(3):
+        breaker.record_failure()
+    task = breaker._probe_task
+
+    await breaker.close()
+
+    assert task.cancelled() and breaker._probe_task is None
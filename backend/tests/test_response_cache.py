@@ -0,0 +1,111 @@
+from collections import Counter
+
+import pytest
+
+from app.core.response_cache import cached_response, events_tag, invalidate_tags
+
+
+@pytest.fixture
+def endpoints(redis_cache):
+    """Cached endpoints tagged at different levels; calls counts loader runs"""
+    calls = Counter()
+
+    def endpoint(name, tags, **options):
+        @cached_response(name, tags=tags, **options)
+        async def load(**params):
+            calls[name] += 1
+            return {"endpoint": name, "run": calls[name], "params": params}
+        return load
+
+    return calls, {
+        "football": endpoint("football", [events_tag("football")]),
+        "baseball": endpoint("baseball", [events_tag("baseball")]),
+        "all_events": endpoint("all_events", ["events"]),
+        "venues": endpoint("venues", ["venues"]),
+        "nearby": endpoint("nearby", ["venues"], precision=2),
+    }
+
+
+async def warm(endpoints):
+    for load in endpoints.values():
+        await load()
+
+
+async def test_repeated_calls_are_cached(endpoints):
+    calls, loads = endpoints
+    await warm(loads)
+    await warm(loads)
+
+    assert set(calls.values()) == {1}
+
+
+async def test_parent_invalidation_evicts_child_entries(endpoints):
+    calls, loads = endpoints
+    await warm(loads)
+
+    await invalidate_tags("events")
+    await warm(loads)
+
+    assert calls["football"] == calls["baseball"] == calls["all_events"] == 2
+    assert calls["venues"] == 1
+
+
+async def test_child_invalidation_leaves_siblings_and_other_tags_alone(endpoints):
+    calls, loads = endpoints
+    await warm(loads)
+
+    await invalidate_tags(events_tag("football"))
+    await warm(loads)
+
+    assert calls["football"] == 2
+    assert calls["baseball"] == 1
+    assert calls["venues"] == calls["nearby"] == 1
+    # Entries tagged with the bare parent aggregate over all children
+    # (e.g. /sports), so a child change drops them as well
+    assert calls["all_events"] == 2
+
+
+async def test_key_varies_with_query_params(endpoints):
+    calls, loads = endpoints
+
+    first = await loads["venues"](city="hanoi")
+    assert await loads["venues"](city="hanoi") == first
+    assert (await loads["venues"](city="saigon"))["params"] == {"city": "saigon"}
+    await loads["venues"](city="hanoi", sport="football")
+    # Whitespace and None params do not make a new entry
+    await loads["venues"](city=" hanoi ", sport=None)
+
+    assert calls["venues"] == 3
+
+
+async def test_float_params_share_entries_at_precision(endpoints):
+    calls, loads = endpoints
+
+    await loads["nearby"](lat=21.02851, lng=105.8542)
+    await loads["nearby"](lat=21.02849, lng=105.8538)
+    await loads["nearby"](lat=21.04, lng=105.85)
+
+    assert calls["nearby"] == 2
+
+
+async def test_stale_version_never_serves_a_hit(endpoints):
+    calls, loads = endpoints
+    seen = []
+    for _ in range(3):
+        seen.append((await loads["football"]())["run"])
+        await invalidate_tags(events_tag("football"))
+        seen.append((await loads["football"]())["run"])
+
+    # Every read after an invalidation recomputes: no run number is served twice across versions
+    assert seen == [1, 2, 2, 3, 3, 4]
+
+
+async def test_invalidating_several_tags_at_once(endpoints):
+    calls, loads = endpoints
+    await warm(loads)
+
+    await invalidate_tags("venues", events_tag("baseball"))
+    await warm(loads)
+
+    assert calls["venues"] == calls["nearby"] == calls["baseball"] == 2
+    assert calls["football"] == 1
@@ -0,0 +1,75 @@
+import uuid
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import pytest
+
+from app.core import scheduler
+from app.services.event_processor import ProcessResult
+
+
+class FakeSession:
+    """AsyncSession stand-in returning fixed Event rows"""
+
+    def __init__(self, rows):
+        self.rows = rows
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def execute(self, statement):
+        rows = self.rows
+        return SimpleNamespace(scalars=lambda: SimpleNamespace(all=lambda: rows))
+
+
+class RecordingProcessor:
+    processed = []
+
+    def __init__(self, session, stages=None):
+        self.cadences = {}
+
+    async def process_events(self, events, tier=None):
+        RecordingProcessor.processed.append([str(event.id) for event in events])
+        return ProcessResult(True, f"Processed {len(events)}/{len(events)} due events", len(events))
+
+
+def make_event(status: str, start_in: timedelta = timedelta(hours=1)) -> SimpleNamespace:
+    return SimpleNamespace(id=uuid.uuid4(), status=status, start_time=datetime.now(timezone.utc) + start_in)
+
+
+@pytest.fixture
+def run_with(monkeypatch):
+    RecordingProcessor.processed = []
+    monkeypatch.setattr(scheduler, "EventProcessor", RecordingProcessor)
+
+    async def run(rows, event_ids):
+        monkeypatch.setattr(scheduler, "AsyncSessionLocal", lambda: FakeSession(rows))
+        return await scheduler.run_event_job(event_ids)
+
+    return run
+
+
+async def test_inactive_events_are_dropped_on_dequeue(run_with):
+    live, scheduled = make_event("live", timedelta(0)), make_event("scheduled")
+    finished, cancelled = make_event("finished", -timedelta(hours=4)), make_event("cancelled")
+    rows = [live, finished, scheduled, cancelled]
+    event_ids = [str(event.id) for event in rows]
+
+    next_checks = await run_with(rows, event_ids)
+
+    assert RecordingProcessor.processed == [[str(live.id), str(scheduled.id)]]
+    assert next_checks[str(finished.id)] is None and next_checks[str(cancelled.id)] is None
+    assert next_checks[str(live.id)] is not None and next_checks[str(scheduled.id)] is not None
+
+
+async def test_batch_without_active_events_is_not_processed(run_with):
+    finished = make_event("finished", -timedelta(hours=4))
+    deleted_id = str(uuid.uuid4())
+
+    next_checks = await run_with([finished], [str(finished.id), deleted_id])
+
+    assert RecordingProcessor.processed == []
+    assert next_checks == {str(finished.id): None, deleted_id: None}
@@ -0,0 +1,101 @@
+import asyncio
+
+import pytest
+
+httpx = pytest.importorskip("httpx")
+
+from app.services.mock_social_server import MockSocialServer
+from app.services.scraper_backends import HTTPBackend, MockProfile, ScraperError
+
+
+class FlakySocialServer(MockSocialServer):
+    """Answers the first `failures` requests with 503"""
+
+    def __init__(self, failures: int, **kwargs):
+        super().__init__(latency=0, profile=MockProfile(seed=1), **kwargs)
+        self.failures = failures
+
+    async def _respond(self, method, target, body):
+        if self.failures > 0:
+            self.failures -= 1
+            return 503, {"error": "upstream unavailable"}
+        return await super()._respond(method, target, body)
+
+
+async def test_retries_503_then_succeeds():
+    async with FlakySocialServer(failures=2) as server:
+        backend = HTTPBackend(server.url, retries=3, backoff=0)
+        try:
+            posts = await backend.fetch_posts("venue-1", "instagram", 3)
+        finally:
+            await backend.close()
+
+    assert server.requests == 3
+    assert len(posts) == 3
+
+
+async def test_gives_up_after_retry_budget():
+    async with FlakySocialServer(failures=10) as server:
+        backend = HTTPBackend(server.url, retries=2, backoff=0)
+        try:
+            with pytest.raises(ScraperError, match="HTTP 503 after 3 attempts"):
+                await backend.fetch_posts("venue-1", "instagram", 3)
+        finally:
+            await backend.close()
+
+    assert server.requests == 3
+
+
+async def test_batch_reports_per_venue_errors():
+    venue_ids = [f"venue-{i}" for i in range(20)]
+    async with MockSocialServer(latency=0, seed=7, venue_error_rate=0.5,
+                                profile=MockProfile(seed=1)) as server:
+        backend = HTTPBackend(server.url, retries=0)
+        try:
+            batch = await backend.fetch_posts_many(venue_ids, "instagram", 2)
+        finally:
+            await backend.close()
+
+    assert [entry.venue_id for entry in batch] == venue_ids
+    failed = [entry for entry in batch if entry.error]
+    assert 0 < len(failed) < len(venue_ids)
+    assert all(entry.error == "profile unavailable" and entry.posts == [] for entry in failed)
+    assert all(len(entry.posts) == 2 for entry in batch if not entry.error)
+
+
+async def test_invalid_json_raises_scraper_error():
+    backend = HTTPBackend("http://provider.test", retries=0)
+    await backend.close()
+    backend._client = httpx.AsyncClient(
+        base_url="http://provider.test",
+        transport=httpx.MockTransport(lambda request: httpx.Response(200, content=b'{"posts": [')),
+    )
+    try:
+        with pytest.raises(ScraperError, match="invalid JSON"):
+            await backend.fetch_posts("venue-1", "instagram", 3)
+    finally:
+        await backend.close()
+
+
+async def test_malformed_request_line_gets_400():
+    async with MockSocialServer(latency=0) as server:
+        reader, writer = await asyncio.open_connection(server.host, server.port)
+        writer.write(b"GARBAGE\r\n\r\n")
+        await writer.drain()
+        status_line = await reader.readline()
+        writer.close()
+
+    assert status_line.startswith(b"HTTP/1.1 400")
+
+
+async def test_stop_closes_idle_keep_alive_connections():
+    server = MockSocialServer(latency=0, profile=MockProfile(seed=1))
+    await server.start()
+    backend = HTTPBackend(server.url, retries=0)
+    try:
+        await backend.fetch_posts("venue-1", "instagram", 1)  # Leaves a pooled connection open
+        await asyncio.wait_for(server.stop(), timeout=2)
+    finally:
+        await backend.close()
+
+    assert server._handlers == set()
@@ -0,0 +1,123 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import Column, DateTime, Integer, MetaData, String, Table, create_engine, select
+
+from app.core.slme import FrequencyController, slme
+
+TIERS = ("HOT", "WARM", "COOL", "COLD")
+
+# Start times relative to now, with a margin around every tier boundary
+OFFSETS = [
+    timedelta(days=-30), timedelta(hours=-3, minutes=-5), timedelta(hours=-2, minutes=-55),
+    timedelta(0), timedelta(hours=1, minutes=55), timedelta(hours=2, minutes=5),
+    timedelta(hours=23, minutes=55), timedelta(hours=24, minutes=5), timedelta(days=6, hours=23),
+    timedelta(days=7, hours=1), timedelta(days=90),
+]
+
+
+@pytest.fixture
+def events():
+    engine = create_engine("sqlite://")
+    table = Table(
+        "events", MetaData(),
+        Column("id", Integer, primary_key=True),
+        Column("start_time", DateTime(timezone=True)),
+        Column("status", String),
+    )
+    table.metadata.create_all(engine)
+    with engine.connect() as conn:
+        yield conn, table
+
+
+def test_tier_clause_matches_get_tier(events):
+    conn, table = events
+    now = datetime.now(timezone.utc)
+    rows = [
+        {"id": i, "start_time": now + offset, "status": status}
+        for i, (offset, status) in enumerate(
+            (offset, status) for offset in OFFSETS for status in ("scheduled", "live")
+        )
+    ]
+    conn.execute(table.insert(), rows)
+
+    for tier in TIERS:
+        clause = slme.tier_clause(tier, table.c.start_time, table.c.status, now=now)
+        selected = set(conn.execute(select(table.c.id).where(clause)).scalars())
+        expected = {row["id"] for row in rows if slme.get_tier(row["start_time"], row["status"]) == tier}
+        assert selected == expected, tier
+
+
+def test_every_event_is_in_exactly_one_tier(events):
+    conn, table = events
+    now = datetime.now(timezone.utc)
+    conn.execute(table.insert(), [
+        {"id": i, "start_time": now + offset, "status": "scheduled"} for i, offset in enumerate(OFFSETS)
+    ])
+
+    selected = []
+    for tier in TIERS:
+        clause = slme.tier_clause(tier, table.c.start_time, table.c.status, now=now)
+        selected += conn.execute(select(table.c.id).where(clause)).scalars().all()
+
+    assert sorted(selected) == list(range(len(OFFSETS)))
+
+
+def test_unknown_tier_is_rejected(events):
+    _, table = events
+    with pytest.raises(ValueError):
+        FrequencyController.tier_clause("LUKEWARM", table.c.start_time, table.c.status)
+
+
+START = datetime(2026, 5, 1, 20, tzinfo=timezone.utc)
+EVENT_IDS = [f"event-{i}" for i in range(200)]
+
+
+@pytest.mark.parametrize("spread", [1.0, 0.5])
+def test_spread_slot_is_first_slot_at_or_after_earliest(spread):
+    period = 300
+    for event_id in EVENT_IDS:
+        slot = slme.spread_slot(event_id, period, START, spread)
+
+        assert START <= slot < START + timedelta(seconds=period)
+        # A slot is its own first slot (no float drift to the next period)
+        assert slme.spread_slot(event_id, period, slot, spread) == slot
+
+
+def test_spread_slot_is_deterministic():
+    assert slme.spread_slot("event-1", 3600, START) == slme.spread_slot("event-1", 3600, START)
+    assert 0 <= slme.spread_offset("event-1") < 1
+
+
+def test_slots_spread_over_the_period():
+    period = 3600
+    minutes = {slme.spread_slot(event_id, period, START).minute // 15 for event_id in EVENT_IDS}
+
+    assert minutes == {0, 1, 2, 3}
+
+
+def test_slot_in_window_is_half_open():
+    period = 300
+    slot = slme.spread_slot("event-1", period, START)
+    second = timedelta(seconds=1)
+
+    assert slme.slot_in_window("event-1", period, slot - second, slot)
+    assert not slme.slot_in_window("event-1", period, slot, slot + second)
+    assert not slme.slot_in_window("event-1", period, slot - 2 * second, slot - second)
+
+
+def test_full_period_window_contains_every_event():
+    period = 300
+    end = START + timedelta(seconds=period)
+
+    assert all(slme.slot_in_window(event_id, period, START, end) for event_id in EVENT_IDS)
+
+
+def test_consecutive_windows_take_each_event_once():
+    """Tier job runs sliced over one period check every event exactly once"""
+    period, slices = 300, 4
+    bounds = [START + timedelta(seconds=period * i / slices) for i in range(slices + 1)]
+
+    for event_id in EVENT_IDS:
+        hits = sum(slme.slot_in_window(event_id, period, start, end) for start, end in zip(bounds, bounds[1:]))
+        assert hits == 1, event_id
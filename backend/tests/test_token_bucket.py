@@ -0,0 +1,87 @@
+import pytest
+
+from app.core.config import settings
+from app.services.scraper import ScraperService
+from app.services.scraper_backends import HTTPBackend, MockBackend, MockProfile, TokenBucket
+
+
+class FakeClock:
+    """Monotonic clock that only moves when the bucket sleeps"""
+
+    def __init__(self):
+        self.now = 100.0
+        self.sleeps = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    async def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def make_bucket(rate: float, burst: int) -> "tuple[TokenBucket, FakeClock]":
+    clock = FakeClock()
+    return TokenBucket(rate, burst, clock=clock, sleep=clock.sleep), clock
+
+
+async def test_burst_is_served_without_waiting():
+    bucket, clock = make_bucket(rate=2.0, burst=5)
+
+    for _ in range(5):
+        await bucket.acquire()
+
+    assert clock.sleeps == []
+    assert clock.now == 100.0
+
+
+async def test_requests_past_the_burst_are_paced_at_rate():
+    bucket, clock = make_bucket(rate=4.0, burst=2)
+
+    for _ in range(2 + 8):
+        await bucket.acquire()
+
+    # 8 requests beyond the burst at 4/s
+    assert clock.now - 100.0 == pytest.approx(2.0)
+    assert all(seconds == pytest.approx(0.25) for seconds in clock.sleeps)
+
+
+async def test_idle_time_refills_up_to_burst_only():
+    bucket, clock = make_bucket(rate=1.0, burst=3)
+    for _ in range(3):
+        await bucket.acquire()
+
+    clock.now += 60  # Long idle period: still only `burst` tokens
+    for _ in range(3):
+        await bucket.acquire()
+    assert clock.sleeps == []
+
+    await bucket.acquire()
+    assert clock.sleeps == [pytest.approx(1.0)]
+
+
+async def test_zero_rate_disables_pacing():
+    bucket, clock = make_bucket(rate=0, burst=1)
+
+    for _ in range(100):
+        await bucket.acquire()
+
+    assert clock.sleeps == []
+
+
+async def test_mock_backend_is_not_paced(monkeypatch):
+    monkeypatch.setattr(settings, "SCRAPER_PLATFORM_RATE", 5.0)
+    scraper = ScraperService(MockBackend(MockProfile(seed=1)))
+
+    assert scraper._bucket("instagram").rate == 0
+
+
+async def test_http_backend_is_paced(monkeypatch):
+    pytest.importorskip("httpx")
+    monkeypatch.setattr(settings, "SCRAPER_PLATFORM_RATE", 5.0)
+    backend = HTTPBackend("http://provider.test")
+    try:
+        scraper = ScraperService(backend)
+        assert scraper._bucket("instagram").rate == 5.0
+    finally:
+        await backend.close()
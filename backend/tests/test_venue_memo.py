@@ -0,0 +1,44 @@
+import asyncio
+
+from app.services.venue_memo import VenueMemo
+
+
+async def test_concurrent_loads_of_a_venue_share_one_call(redis_cache):
+    memo = VenueMemo(freshness=60)
+    calls = 0
+
+    async def loader():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return {"confidence": 0.9}
+
+    results = await asyncio.gather(*(memo.get_or_load("venue:a:live_check", loader, "live_check") for _ in range(5)))
+
+    assert results == [{"confidence": 0.9}] * 5
+    assert calls == 1
+
+
+async def test_preload_serves_results_of_earlier_runs(redis_cache):
+    async def loader():
+        return {"confidence": 0.9}
+
+    await VenueMemo(freshness=60).get_or_load("venue:a:live_check", loader, "live_check")
+
+    memo = VenueMemo(freshness=60)
+    fresh = await memo.preload(["venue:a:live_check", "venue:b:live_check"], kind="live_check")
+
+    async def must_not_load():
+        raise AssertionError("preloaded venue loaded again")
+
+    assert fresh == {"venue:a:live_check"}
+    assert await memo.get_or_load("venue:a:live_check", must_not_load, "live_check") == {"confidence": 0.9}
+
+
+async def test_preload_is_a_no_op_without_freshness(redis_cache):
+    async def loader():
+        return 1
+
+    await VenueMemo(freshness=60).get_or_load("venue:a:live_check", loader, "live_check")
+
+    assert await VenueMemo(freshness=0).preload(["venue:a:live_check"], kind="live_check") == set()
@@ -0,0 +1,134 @@
+from app.services.dtss import DTSSService
+from app.services.event_processor import EventProcessor
+from app.services.watermarks import is_newer, make_watermark, post_position
+
+
+def post(post_id: str, hour: int, text: str = "Live football tonight") -> dict:
+    return {"id": post_id, "timestamp": f"2026-05-01T{hour:02d}:00:00", "text": text}
+
+
+def test_everything_is_newer_without_a_watermark():
+    assert is_newer(post("a", 10), None)
+    assert is_newer(post("a", 10), {})
+
+
+def test_is_newer_compares_timestamps():
+    watermark = make_watermark(post("b", 12))
+
+    assert is_newer(post("c", 13), watermark)
+    assert not is_newer(post("a", 11), watermark)
+
+
+def test_equal_timestamps_are_ordered_by_post_id():
+    watermark = make_watermark(post("b", 12))
+
+    assert is_newer(post("c", 12), watermark)
+    assert not is_newer(post("a", 12), watermark)
+    # The watermark post itself is not new
+    assert not is_newer(post("b", 12), watermark)
+
+
+def test_window_entries_and_posts_share_one_order():
+    assert post_position({"post_id": "x", "timestamp": "2026-05-01T12:00:00"}) == post_position(post("x", 12))
+    assert make_watermark(post("x", 12)) == {"post_id": "x", "timestamp": "2026-05-01T12:00:00"}
+
+
+async def test_first_check_analyzes_latest_posts(redis_cache):
+    service = DTSSService()
+    posts = [post("a", 10), post("b", 11), post("c", 12), post("d", 13)]
+
+    result = await service.analyze_new_venue_posts("venue-1", posts, {"watermark": None, "window": []})
+
+    assert result["new_posts"] == 4 and not result["carried_forward"]
+    assert [entry["post_id"] for entry in result["window"]] == ["d", "c", "b"]
+    state = await service.get_post_state("venue-1")
+    assert state["watermark"] == make_watermark(posts[-1])
+
+
+async def test_only_posts_past_the_watermark_are_analyzed(redis_cache, monkeypatch):
+    service = DTSSService()
+    await service.analyze_new_venue_posts("venue-1", [post("a", 10), post("b", 11)], {"watermark": None, "window": []})
+    state = await service.get_post_state("venue-1")
+    analyzed = []
+    judge = service._judge_venue_post
+    monkeypatch.setattr(service, "_judge_venue_post", lambda text: analyzed.append(text) or judge(text))
+
+    result = await service.analyze_new_venue_posts(
+        "venue-1", [post("a", 10), post("b", 11), post("c", 12, "Closed tonight")], state
+    )
+
+    assert analyzed == ["Closed tonight"]
+    assert result["new_posts"] == 1
+    # New analysis merged in front of the carried-forward ones
+    assert [entry["post_id"] for entry in result["window"]] == ["c", "b", "a"]
+    assert result["window"][0]["override_status"]
+
+
+async def test_window_keeps_only_the_latest_analyses(redis_cache):
+    service = DTSSService()
+    state = {"watermark": None, "window": []}
+    for hour, post_id in enumerate("abcde", start=10):
+        await service.analyze_new_venue_posts("venue-1", [post(post_id, hour)], state, window_size=3)
+        state = await service.get_post_state("venue-1")
+
+    assert [entry["post_id"] for entry in state["window"]] == ["e", "d", "c"]
+    assert state["watermark"]["post_id"] == "e"
+
+
+async def test_unchanged_feed_carries_forward_without_writes(redis_cache):
+    service = DTSSService()
+    posts = [post("a", 10), post("b", 11)]
+    await service.analyze_new_venue_posts("venue-1", posts, {"watermark": None, "window": []})
+    state = await service.get_post_state("venue-1")
+    writes = redis_cache.buffer()
+
+    result = await service.analyze_new_venue_posts("venue-1", posts, state, cache_writes=writes)
+
+    assert result == {"window": state["window"], "new_posts": 0, "carried_forward": True}
+    assert len(writes) == 0
+
+
+async def test_buffered_watermark_is_written_on_flush(redis_cache):
+    service = DTSSService()
+    writes = redis_cache.buffer()
+
+    await service.analyze_new_venue_posts("venue-1", [post("a", 10)], {"watermark": None, "window": []},
+                                          cache_writes=writes)
+
+    assert (await service.get_post_state("venue-1"))["watermark"] is None
+    await writes.flush()
+    assert (await service.get_post_state("venue-1"))["watermark"]["post_id"] == "a"
+
+
+async def test_failed_db_write_drops_buffered_watermarks(redis_cache, monkeypatch):
+    processor = EventProcessor(db=None)
+    service = DTSSService()
+    await service.analyze_new_venue_posts("venue-1", [post("a", 10)], {"watermark": None, "window": []},
+                                          cache_writes=processor.cache_writes)
+    processor.dirty_tags.add("qoe")
+
+    async def failed_flush():
+        return None
+
+    monkeypatch.setattr(processor.writer, "flush", failed_flush)
+    await processor.process_events([])
+
+    # The post is analyzed (and its results recorded) again next run
+    assert (await service.get_post_state("venue-1"))["watermark"] is None
+    assert len(processor.cache_writes) == 0
+    assert not processor.dirty_tags
+
+
+async def test_successful_db_write_flushes_buffered_watermarks(redis_cache, monkeypatch):
+    processor = EventProcessor(db=None)
+    service = DTSSService()
+    await service.analyze_new_venue_posts("venue-1", [post("a", 10)], {"watermark": None, "window": []},
+                                          cache_writes=processor.cache_writes)
+
+    async def flushed():
+        return 1
+
+    monkeypatch.setattr(processor.writer, "flush", flushed)
+    await processor.process_events([])
+
+    assert (await service.get_post_state("venue-1"))["watermark"]["post_id"] == "a"
@@ -0,0 +1,72 @@
+import asyncio
+
+import pytest
+
+from app.core.work_queue import WorkQueue
+
+
+@pytest.fixture
+async def queue(fake_redis):
+    queue = WorkQueue(stream="test:work", group="workers", maxlen=1000, max_attempts=3)
+    queue.redis = fake_redis
+    await queue.ensure_group()
+    return queue
+
+
+async def test_read_and_ack(queue):
+    await queue.enqueue("verify_events", {"event_ids": ["a"]})
+
+    [task] = await queue.read("w1", count=10, block_ms=10)
+    await queue.ack(task)
+
+    assert task.payload == {"event_ids": ["a"]}
+    assert (await queue.stats())["pending"] == 0
+
+
+async def test_failed_task_is_retried_then_dead_lettered(queue):
+    await queue.enqueue("verify_events", {"event_ids": ["a"]})
+
+    for attempt in range(3):
+        [task] = await queue.read("w1", count=10, block_ms=10)
+        assert task.attempts == attempt
+        await queue.fail(task, "boom")
+
+    stats = await queue.stats()
+    assert stats["length"] == 0
+    assert stats["dead"] == 1
+
+
+async def test_task_of_dead_consumer_is_requeued(queue):
+    await queue.enqueue("verify_events", {"event_ids": ["a"]})
+    await queue.read("crashed", count=10, block_ms=10)
+    await asyncio.sleep(0.05)
+
+    assert await queue.requeue_stale("w2", min_idle_ms=20, count=10) == 1
+    [task] = await queue.read("w2", count=10, block_ms=10)
+    assert task.attempts == 1
+
+
+async def test_heartbeat_keeps_running_task_from_being_requeued(queue):
+    await queue.enqueue("verify_events", {"event_ids": ["a"]})
+    [task] = await queue.read("w1", count=10, block_ms=10)
+
+    for _ in range(3):
+        await asyncio.sleep(0.02)
+        await queue.heartbeat("w1", [task.id])
+        assert await queue.requeue_stale("w2", min_idle_ms=30, count=10) == 0
+
+    await queue.ack(task)
+    assert (await queue.stats())["pending"] == 0
+
+
+async def test_own_running_tasks_are_not_requeued(queue):
+    await queue.enqueue("verify_events", {"event_ids": ["a"]})
+    [task] = await queue.read("w1", count=10, block_ms=10)
+    await asyncio.sleep(0.05)
+
+    assert await queue.requeue_stale("w1", min_idle_ms=20, count=10, running={task.id}) == 0
+    assert (await queue.stats())["length"] == 1
+
+
+async def test_heartbeat_without_tasks_is_a_no_op(queue):
+    await queue.heartbeat("w1", [])